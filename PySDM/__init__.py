@@ -23,11 +23,33 @@ PySDM test-suite built using [pytest](https://docs.pytest.org/) is located in th
 """
 
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
 
-from . import environments, exporters, products
-from .builder import Builder
-from .formulae import Formulae
-from .particulator import Particulator
+from .impl.lazy_imports import lazy_module
+
+if TYPE_CHECKING:  # names resolved lazily at runtime, listed here for static analysis
+    from .builder import Builder
+    from .formulae import Formulae
+    from .particulator import Particulator
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    exports={
+        "Builder": "builder",
+        "Formulae": "formulae",
+        "Particulator": "particulator",
+    },
+    subpackages=(
+        "attributes",
+        "backends",
+        "dynamics",
+        "environments",
+        "exporters",
+        "initialisation",
+        "physics",
+        "products",
+    ),
+)
 
 try:
     __version__ = version(__name__)
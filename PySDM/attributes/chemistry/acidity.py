@@ -36,6 +36,7 @@ class Acidity(DerivedAttribute):
             ),
             do_chemistry_flag=dynamic.do_chemistry_flag,
             pH=self.data,
+            n_iters=dynamic.counters["n_pH_iterations"],
             H_min=dynamic.pH_H_min,
             H_max=dynamic.pH_H_max,
             ionic_strength_threshold=dynamic.ionic_strength_threshold,
@@ -11,8 +11,24 @@ class DerivedAttribute(Attribute):
         assert len(dependencies) > 0
         super().__init__(builder, name)
         self.dependencies = dependencies
+        self.chain = None
+        self.virtual = False
+
+    def allocate(self, idx):
+        if not self.virtual:
+            super().allocate(idx)
+
+    def get(self):
+        if self.virtual:
+            raise ValueError(
+                f"attribute '{self.name}' is virtual (computed on the fly and not stored)"
+            )
+        return super().get()
 
     def update(self):
+        if self.chain is not None:
+            self.chain.update()
+            return
         for dependency in self.dependencies:
             dependency.update()
         dependencies_timestamp = sum(
@@ -7,10 +7,13 @@ import ctypes
 import os
 import sys
 import warnings
+from typing import TYPE_CHECKING
 
-from numba import cuda
-
-from .numba import Numba
+if TYPE_CHECKING:  # names resolved lazily at runtime, listed here for static analysis
+    from .numba import Numba
+    from .numba import Numba as CPU
+    from .thrust_rtc import ThrustRTC
+    from .thrust_rtc import ThrustRTC as GPU
 
 
 # https://gist.github.com/f0k/63a664160d016a491b2cbea15913d549
@@ -45,39 +48,78 @@ def _cuda_is_available():
     return True
 
 
-if "CI" not in os.environ and (_cuda_is_available() or cuda.is_available()):
+_CUDA_AVAILABLE = None
+
+
+def probe_cuda():
+    """checks (only once, upon first use of the GPU backend) if CUDA is available,
+    if not, sets the `PySDM.backends.impl_thrust_rtc.test_helpers.flag.fakeThrustRTC`
+    flag"""
+    global _CUDA_AVAILABLE  # pylint: disable=global-statement
+    if _CUDA_AVAILABLE is None:
+        # pylint: disable=import-outside-toplevel
+        from numba import cuda
+
+        from .impl_thrust_rtc.test_helpers import flag
+
+        _CUDA_AVAILABLE = "CI" not in os.environ and (
+            _cuda_is_available() or cuda.is_available()
+        )
+        if not _CUDA_AVAILABLE:
+            flag.fakeThrustRTC = True
+    return _CUDA_AVAILABLE
+
+
+def _thrust_rtc():
+    # pylint: disable=import-outside-toplevel
     from PySDM.backends.thrust_rtc import ThrustRTC
-else:
-    from .impl_thrust_rtc.test_helpers import flag
 
-    flag.fakeThrustRTC = True
+    if not probe_cuda() and ThrustRTC.ENABLE:
+        import numpy as np
 
-    import numpy as np
+        from PySDM.backends.impl_common.random_common import RandomCommon
 
-    from PySDM.backends.impl_common.random_common import (  # pylint: disable=ungrouped-imports
-        RandomCommon,
-    )
-    from PySDM.backends.thrust_rtc import ThrustRTC  # pylint: disable=ungrouped-imports
+        ThrustRTC.ENABLE = False
 
-    ThrustRTC.ENABLE = False
+        class Random(RandomCommon):  # pylint: disable=too-few-public-methods
+            def __init__(self, size, seed):
+                super().__init__(size, seed)
+                self.generator = np.random.default_rng(seed)
 
-    class Random(RandomCommon):  # pylint: disable=too-few-public-methods
-        def __init__(self, size, seed):
-            super().__init__(size, seed)
-            self.generator = np.random.default_rng(seed)
+            def __call__(self, storage):
+                # pylint: disable=unsupported-assignment-operation
+                storage.data.ndarray[:] = self.generator.uniform(0, 1, storage.shape)
 
-        def __call__(self, storage):
-            # pylint: disable=unsupported-assignment-operation
-            storage.data.ndarray[:] = self.generator.uniform(0, 1, storage.shape)
+        ThrustRTC.Random = Random
+    return ThrustRTC
 
-    ThrustRTC.Random = Random
 
-CPU = Numba
-"""
-alias for Numba
-"""
+def _numba():
+    # pylint: disable=import-outside-toplevel
+    from .numba import Numba
 
-GPU = ThrustRTC
-"""
-alias for ThrustRTC
-"""
+    return Numba
+
+
+_BACKENDS = {
+    "CPU": _numba,
+    "Numba": _numba,
+    "GPU": _thrust_rtc,
+    "ThrustRTC": _thrust_rtc,
+}
+
+
+def __getattr__(name):
+    """the backend modules are imported (and for the GPU one, CUDA availability
+    is probed) upon first access (see [PEP 562](https://peps.python.org/pep-0562/)):
+    `CPU` is an alias for `PySDM.backends.numba.Numba` and
+    `GPU` is an alias for `PySDM.backends.thrust_rtc.ThrustRTC`"""
+    if name in _BACKENDS:
+        value = _BACKENDS[name]()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *_BACKENDS})
@@ -38,16 +38,24 @@ def make_Index(backend):
         def sort_by_key(self, keys):
             backend.sort_by_key(self, keys)
 
-        def shuffle(self, temporary, parts=None):
+        def shuffle(self, temporary, parts=None, parallel=False):
             if parts is None:
-                backend.shuffle_global(
-                    idx=self.data, length=self.length, u01=temporary.data
-                )
+                (
+                    backend.shuffle_global_parallel
+                    if parallel
+                    else backend.shuffle_global
+                )(idx=self.data, length=self.length, u01=temporary.data)
             else:
                 backend.shuffle_local(
                     idx=self.data, u01=temporary.data, cell_start=parts.data
                 )
 
+        def locality(self):
+            return backend.index_locality(self.data, int(self.length))
+
+        def reorder(self, storages):
+            backend.reorder_by_index(self, storages)
+
         def remove_zero_n_or_flagged(self, indexed_storage):
             self.length = backend.remove_zero_n_or_flagged(
                 indexed_storage.data, self.data, self.length
@@ -4,6 +4,7 @@ common code for storage classes
 
 from abc import abstractmethod
 from collections import namedtuple
+from contextlib import nullcontext
 from typing import Type
 
 
@@ -25,6 +26,12 @@ class StorageBase:
     def __len__(self):
         return self.shape[0]
 
+    @staticmethod
+    def deferred():
+        """context manager within which element-wise arithmetics may be deferred
+        and fused into a single pass (a no-op unless overridden)"""
+        return nullcontext()
+
     def __pow__(self, other):
         raise TypeError("Use **=")
 
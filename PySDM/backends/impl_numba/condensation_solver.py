@@ -0,0 +1,455 @@
+"""
+CPU implementation of the droplet-level part of the condensation solver:
+ the implicit per-droplet growth solves and the liquid water mass sums
+ used by `PySDM.backends.impl_numba.methods.condensation_methods`
+"""
+
+from collections import namedtuple
+import math
+
+import numba
+import numpy as np
+
+from PySDM.backends.impl_numba import jit_cache
+from PySDM.backends.impl_numba.toms748 import toms748_solve
+from PySDM.backends.impl_numba.warnings import warn
+
+_DropletInvariants = namedtuple(
+    typename="_DropletInvariants",
+    field_names=("rd3", "x_insane", "RH_eq", "RH_eq_cached"),
+)
+
+
+def make_droplet_invariants(jit_flags, formulae):
+    """per-timestep buffer of the droplet properties that do not change
+    within the substep loop (with `RH_eq` holding the equilibrium-skip cache,
+    valid where `RH_eq_cached` is set)"""
+
+    @jit_cache.njit(**jit_flags)
+    def droplet_invariants(attributes, cell_idx):
+        n_sd_in_cell = len(cell_idx)
+        invariants = _DropletInvariants(
+            rd3=np.empty(n_sd_in_cell),
+            x_insane=np.empty(n_sd_in_cell),
+            RH_eq=np.empty(n_sd_in_cell),
+            RH_eq_cached=np.zeros(n_sd_in_cell, dtype=np.bool_),
+        )
+        for i, drop in enumerate(cell_idx):
+            invariants.rd3[i] = attributes.vdry[drop] / formulae.constants.PI_4_3
+            invariants.x_insane[i] = formulae.condensation_coordinate__x(
+                attributes.vdry[drop] / 100
+            )
+        return invariants
+
+    return droplet_invariants
+
+
+def make_calculate_ml_old(jit_flags):
+    @jit_cache.njit(**jit_flags)
+    def calculate_ml_old(water_mass, multiplicity, cell_idx):
+        result = 0
+        for drop in cell_idx:
+            if water_mass[drop] > 0:
+                result += multiplicity[drop] * water_mass[drop]
+        return result
+
+    return calculate_ml_old
+
+
+def make_calculate_ml_new(  # pylint: disable=too-many-statements
+    *,
+    formulae,
+    jit_flags,
+    max_iters,
+    RH_rtol,
+    parallel=False,
+):
+    """with `parallel=True`, the per-droplet implicit solves are split across
+    threads, with the droplet contributions summed afterwards in droplet order
+    (hence with results identical to the serial variant)"""
+
+    @jit_cache.njit(**jit_flags)
+    def minfun(  # pylint: disable=too-many-arguments,too-many-locals
+        x_new,
+        x_old,
+        timestep,
+        kappa,
+        f_org,
+        rd3,
+        temperature,
+        RH,
+        lv,
+        pvs,
+        D,
+        K,
+        ventilation_factor,
+    ):
+        volume = formulae.condensation_coordinate__volume(x_new)
+        RH_eq = formulae.hygroscopicity__RH_eq(
+            formulae.trivia__radius(volume),
+            temperature,
+            kappa,
+            rd3,
+            formulae.surface_tension__sigma(
+                temperature, volume, formulae.constants.PI_4_3 * rd3, f_org
+            ),
+        )
+        r_dr_dt = formulae.drop_growth__r_dr_dt(
+            RH_eq,
+            temperature,
+            RH,
+            lv,
+            pvs,
+            D,
+            K,
+            ventilation_factor,
+        )
+        return (
+            x_old
+            - x_new
+            + timestep * formulae.condensation_coordinate__dx_dt(x_new, r_dr_dt)
+        )
+
+    @jit_cache.njit(**jit_flags)
+    def calculate_ml_new_drop(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        attributes,
+        invariants,
+        i,
+        drop,
+        timestep,
+        fake,
+        T,
+        p,
+        RH,
+        Sc,
+        lv,
+        pvs,
+        DTp,
+        KTp,
+        lambdaK,
+        lambdaD,
+        rtol_x,
+    ):
+        """returns the droplet contribution to the liquid water mass and to its
+        rate-of-change sensitivity to relative humidity, the success flag and
+        the activating, deactivating and activated-and-growing counts;
+        droplets found within `RH_rtol` of equilibrium have their `RH_eq`
+        stored in `invariants` and are skipped as long as the cell RH stays
+        within tolerance of it (`RH_eq` is not reevaluated for changes of `T`)"""
+        if invariants.RH_eq_cached[i] and formulae.trivia__within_tolerance(
+            np.abs(RH - invariants.RH_eq[i]), RH, RH_rtol
+        ):
+            return (
+                attributes.multiplicity[drop] * attributes.water_mass[drop],
+                0.0,
+                True,
+                0,
+                0,
+                0,
+            )
+        v_drop = formulae.particle_shape_and_density__mass_to_volume(
+            attributes.water_mass[drop]
+        )
+        if v_drop < 0:
+            return 0.0, 0.0, True, 0, 0, 0
+        x_old = formulae.condensation_coordinate__x(v_drop)
+        r_old = formulae.trivia__radius(v_drop)
+        rd3 = invariants.rd3[i]
+        sgm = formulae.surface_tension__sigma(
+            T, v_drop, attributes.vdry[drop], attributes.f_org[drop]
+        )
+        RH_eq = formulae.hygroscopicity__RH_eq(
+            r_old, T, attributes.kappa[drop], rd3, sgm
+        )
+        if not formulae.trivia__within_tolerance(np.abs(RH - RH_eq), RH, RH_rtol):
+            invariants.RH_eq_cached[i] = False
+            Dr = formulae.diffusion_kinetics__D(DTp, r_old, lambdaD)
+            Kr = formulae.diffusion_kinetics__K(KTp, r_old, lambdaK)
+            ventilation_factor = formulae.ventilation__ventilation_coefficient(
+                sqrt_re_times_cbrt_sc=formulae.trivia__sqrt_re_times_cbrt_sc(
+                    Re=attributes.reynolds_number[drop],
+                    Sc=Sc,
+                )
+            )
+            args = (
+                x_old,
+                timestep,
+                attributes.kappa[drop],
+                attributes.f_org[drop],
+                rd3,
+                T,
+                RH,
+                lv,
+                pvs,
+                Dr,
+                Kr,
+                ventilation_factor,
+            )
+            r_dr_dt_old = formulae.drop_growth__r_dr_dt(
+                RH_eq,
+                T,
+                RH,
+                lv,
+                pvs,
+                Dr,
+                Kr,
+                ventilation_factor,
+            )
+            dx_old = timestep * formulae.condensation_coordinate__dx_dt(
+                x_old, r_dr_dt_old
+            )
+            dm_dt__dRH = formulae.particle_shape_and_density__volume_to_mass(
+                4
+                * formulae.constants.PI
+                * r_old
+                * formulae.drop_growth__r_dr_dt(
+                    0, T, 1, lv, pvs, Dr, Kr, ventilation_factor
+                )
+            )
+        else:
+            invariants.RH_eq[i] = RH_eq
+            invariants.RH_eq_cached[i] = True
+            dx_old = 0.0
+            dm_dt__dRH = 0.0
+        if dx_old == 0:
+            x_new = x_old
+        else:
+            a = x_old
+            b = max(invariants.x_insane[i], a + dx_old)
+            fa = minfun(a, *args)
+            fb = minfun(b, *args)
+
+            counter = 0
+            while not fa * fb < 0:
+                counter += 1
+                if counter > max_iters:
+                    if not fake:
+                        warn(
+                            "failed to find interval",
+                            __file__,
+                            context=(
+                                "T",
+                                T,
+                                "p",
+                                p,
+                                "RH",
+                                RH,
+                                "a",
+                                a,
+                                "b",
+                                b,
+                                "fa",
+                                fa,
+                                "fb",
+                                fb,
+                            ),
+                        )
+                    return 0.0, 0.0, False, 0, 0, 0
+                b = max(invariants.x_insane[i], a + math.ldexp(dx_old, counter))
+                fb = minfun(b, *args)
+
+            if a != b:
+                if a > b:
+                    a, b = b, a
+                    fa, fb = fb, fa
+
+                x_new, iters_taken = toms748_solve(
+                    minfun,
+                    args,
+                    a,
+                    b,
+                    fa,
+                    fb,
+                    rtol_x,
+                    max_iters,
+                    formulae.trivia__within_tolerance,
+                )
+                if iters_taken in (-1, max_iters):
+                    if not fake:
+                        warn("TOMS failed", __file__)
+                    return 0.0, 0.0, False, 0, 0, 0
+            else:
+                x_new = x_old
+
+        mass_new = formulae.particle_shape_and_density__volume_to_mass(
+            formulae.condensation_coordinate__volume(x_new)
+        )
+        mass_cr = formulae.particle_shape_and_density__volume_to_mass(
+            attributes.v_cr[drop]
+        )
+        multiplicity = attributes.multiplicity[drop]
+        n_activating, n_deactivating, n_activated_and_growing = 0, 0, 0
+        if not fake:
+            if mass_new > mass_cr and mass_new > attributes.water_mass[drop]:
+                n_activated_and_growing = multiplicity
+            if mass_new > mass_cr > attributes.water_mass[drop]:
+                n_activating = multiplicity
+            if mass_new < mass_cr < attributes.water_mass[drop]:
+                n_deactivating = multiplicity
+            attributes.water_mass[drop] = mass_new
+        return (
+            multiplicity * mass_new,
+            multiplicity * dm_dt__dRH,
+            True,
+            n_activating,
+            n_deactivating,
+            n_activated_and_growing,
+        )
+
+    if parallel:
+
+        @jit_cache.njit(**{**jit_flags, "parallel": True})
+        def calculate_ml_new(  # pylint: disable=too-many-arguments,too-many-locals
+            attributes,
+            timestep,
+            fake,
+            T,
+            p,
+            RH,
+            Sc,
+            cell_idx,
+            invariants,
+            lv,
+            pvs,
+            DTp,
+            KTp,
+            rtol_x,
+        ):
+            lambdaK = formulae.diffusion_kinetics__lambdaK(T, p)
+            lambdaD = formulae.diffusion_kinetics__lambdaD(DTp, T)
+            n_sd_in_cell = len(cell_idx)
+            ml = np.empty(n_sd_in_cell)
+            dml_dt__dRH = np.empty(n_sd_in_cell)
+            success = np.empty(n_sd_in_cell, dtype=np.bool_)
+            counts = np.empty((3, n_sd_in_cell), dtype=np.int64)
+            for i in numba.prange(n_sd_in_cell):  # pylint: disable=not-an-iterable
+                (
+                    ml[i],
+                    dml_dt__dRH[i],
+                    success[i],
+                    counts[0, i],
+                    counts[1, i],
+                    counts[2, i],
+                ) = calculate_ml_new_drop(
+                    attributes,
+                    invariants,
+                    i,
+                    cell_idx[i],
+                    timestep,
+                    fake,
+                    T,
+                    p,
+                    RH,
+                    Sc,
+                    lv,
+                    pvs,
+                    DTp,
+                    KTp,
+                    lambdaK,
+                    lambdaD,
+                    rtol_x,
+                )
+
+            # reduction in droplet order, as in the serial variant below
+            result, sensitivity = 0.0, 0.0
+            n_activating, n_deactivating, n_activated_and_growing = 0, 0, 0
+            for i in range(n_sd_in_cell):
+                if not success[i]:
+                    return (
+                        result,
+                        sensitivity,
+                        False,
+                        n_activating,
+                        n_deactivating,
+                        0,
+                    )
+                result += ml[i]
+                sensitivity += dml_dt__dRH[i]
+                n_activating += counts[0, i]
+                n_deactivating += counts[1, i]
+                n_activated_and_growing += counts[2, i]
+            n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
+            return (
+                result,
+                sensitivity,
+                True,
+                n_activating,
+                n_deactivating,
+                n_ripening,
+            )
+
+    else:
+
+        @jit_cache.njit(**jit_flags)
+        def calculate_ml_new(  # pylint: disable=too-many-arguments,too-many-locals
+            attributes,
+            timestep,
+            fake,
+            T,
+            p,
+            RH,
+            Sc,
+            cell_idx,
+            invariants,
+            lv,
+            pvs,
+            DTp,
+            KTp,
+            rtol_x,
+        ):
+            lambdaK = formulae.diffusion_kinetics__lambdaK(T, p)
+            lambdaD = formulae.diffusion_kinetics__lambdaD(DTp, T)
+            result, sensitivity = 0.0, 0.0
+            n_activating, n_deactivating, n_activated_and_growing = 0, 0, 0
+            for i, drop in enumerate(cell_idx):
+                (
+                    ml,
+                    dml_dt__dRH,
+                    success,
+                    drop_activating,
+                    drop_deactivating,
+                    drop_activated_and_growing,
+                ) = calculate_ml_new_drop(
+                    attributes,
+                    invariants,
+                    i,
+                    drop,
+                    timestep,
+                    fake,
+                    T,
+                    p,
+                    RH,
+                    Sc,
+                    lv,
+                    pvs,
+                    DTp,
+                    KTp,
+                    lambdaK,
+                    lambdaD,
+                    rtol_x,
+                )
+                if not success:
+                    return (
+                        result,
+                        sensitivity,
+                        False,
+                        n_activating,
+                        n_deactivating,
+                        0,
+                    )
+                result += ml
+                sensitivity += dml_dt__dRH
+                n_activating += drop_activating
+                n_deactivating += drop_deactivating
+                n_activated_and_growing += drop_activated_and_growing
+            n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
+            return (
+                result,
+                sensitivity,
+                True,
+                n_activating,
+                n_deactivating,
+                n_ripening,
+            )
+
+    return calculate_ml_new
@@ -15,6 +15,10 @@ JIT_FLAGS = {
     "cache": False,  # https://github.com/numba/numba/issues/2956
 }
 
+JIT_CACHE_DIR = os.environ.get("PYSDM_JIT_CACHE_DIR", "")
+""" location of the content-addressed on-disk cache of compiled closures and formulae
+ (see `PySDM.backends.impl_numba.jit_cache`), caching is disabled if empty """
+
 if platform.machine() == "arm64":
     warnings.warn(
         "Disabling Numba threading due to ARM64 CPU (atomics do not work yet)"
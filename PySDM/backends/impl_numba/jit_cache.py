@@ -0,0 +1,236 @@
+"""
+content-addressed on-disk cache for Numba-compiled closures and exec-generated formulae
+ (which cannot be handled by Numba's own `cache=True` mechanism as the generated code
+ is not backed by a source file and the closure cell contents are not reproducibly
+ picklable across processes, see https://github.com/numba/numba/issues/2956);
+
+the cache key is a hash of the bytecode of the function and (recursively) of everything
+ it references: closure cells, globals (incl. other jitted functions), the constants
+ catalogue namedtuple and the JIT flags (e.g., `fastmath`) - hence, a change of any
+ physics formulae choice or constant value results in a different cache entry;
+
+enabled by setting the `PYSDM_JIT_CACHE_DIR` environment variable (or assigning
+ `PySDM.backends.impl_numba.conf.JIT_CACHE_DIR` before `PySDM.backends.CPU` is first
+ accessed, as the kernels defined at class level are decorated upon import);
+ the cache files are written atomically by Numba, so the directory can be shared
+ between concurrently running processes
+"""
+
+import hashlib
+import sys
+import types
+
+import numba
+import numpy as np
+from numba.core.caching import (
+    CompileResultCacheImpl,
+    FunctionCache,
+    IndexDataCacheFile,
+    _CacheLocator,
+)
+from numba.core.dispatcher import Dispatcher
+
+from PySDM.backends.impl_numba import conf
+
+_FINGERPRINTS = {}
+
+
+class _NotCacheable(Exception):
+    pass
+
+
+def register_fingerprint(obj, *items):
+    """lets objects for which the Python source is not available (e.g., vectorized
+    formulae) take part in the cache key computation"""
+    if not conf.JIT_CACHE_DIR:
+        return
+    try:
+        fingerprint = _hash(items)
+    except _NotCacheable:
+        fingerprint = None
+    _FINGERPRINTS[id(obj)] = (obj, fingerprint)
+
+
+def _hash(obj):
+    hasher = hashlib.sha256()
+    _feed(hasher, obj, set())
+    return hasher.hexdigest()
+
+
+def _feed_code(hasher, code, seen):
+    hasher.update(code.co_code)
+    hasher.update(repr((code.co_names, code.co_varnames, code.co_freevars)).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _feed_code(hasher, const, seen)
+        else:
+            _feed(hasher, const, seen)
+
+
+def _global_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _feed_function(hasher, func, seen):
+    hasher.update(func.__qualname__.encode())
+    _feed_code(hasher, func.__code__, seen)
+    _feed(hasher, (func.__defaults__, func.__kwdefaults__), seen)
+    for cell in func.__closure__ or ():
+        _feed(hasher, cell.cell_contents, seen)
+    for name in sorted(_global_names(func.__code__)):
+        if name in func.__globals__:
+            hasher.update(name.encode())
+            _feed(hasher, func.__globals__[name], seen)
+
+
+def _feed(hasher, obj, seen):  # pylint: disable=too-many-branches
+    if id(obj) in _FINGERPRINTS:
+        if _FINGERPRINTS[id(obj)][1] is None:
+            raise _NotCacheable(type(obj))
+        hasher.update(_FINGERPRINTS[id(obj)][1].encode())
+    elif obj is None or isinstance(
+        obj, (bool, int, float, complex, str, bytes, np.generic)
+    ):
+        hasher.update(f"{type(obj).__name__}:{obj!r}".encode())
+    elif isinstance(obj, tuple):
+        hasher.update(f"{type(obj).__name__}{getattr(obj, '_fields', '')}(".encode())
+        for item in obj:
+            _feed(hasher, item, seen)
+        hasher.update(b")")
+    elif isinstance(obj, (set, frozenset)):
+        _feed(hasher, tuple(sorted(obj, key=repr)), seen)
+    elif isinstance(obj, dict):
+        _feed(hasher, tuple(sorted(obj.items(), key=lambda item: repr(item[0]))), seen)
+    elif isinstance(obj, np.ndarray):
+        hasher.update(f"ndarray:{obj.dtype}:{obj.shape}".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, types.ModuleType):
+        hasher.update(f"module:{obj.__name__}".encode())
+    elif isinstance(obj, type):
+        hasher.update(f"type:{obj.__module__}.{obj.__qualname__}".encode())
+        _feed(hasher, getattr(obj, "_fields", None), seen)
+    elif id(obj) in seen:
+        hasher.update(b"<recursion>")
+    elif isinstance(obj, Dispatcher):
+        seen.add(id(obj))
+        hasher.update(b"dispatcher:")
+        _feed(hasher, obj.targetoptions, seen)
+        _feed_function(hasher, obj.py_func, seen)
+    elif isinstance(obj, types.FunctionType):
+        seen.add(id(obj))
+        _feed_function(hasher, obj, seen)
+    elif isinstance(obj, (types.BuiltinFunctionType, np.ufunc)):
+        hasher.update(f"builtin:{obj.__name__}".encode())
+    else:
+        raise _NotCacheable(type(obj))
+
+
+class _ContentAddressedLocator(_CacheLocator):
+    def __init__(self, py_func, fingerprint):
+        self._py_func = py_func
+        self._py_file = py_func.__code__.co_filename  # used in Numba's warnings
+        self._fingerprint = fingerprint
+        self._cache_path = conf.JIT_CACHE_DIR
+
+    def get_cache_path(self):
+        return self._cache_path
+
+    def get_source_stamp(self):
+        return numba.__version__
+
+    def get_disambiguator(self):
+        return self._fingerprint[:32]
+
+    @classmethod
+    def from_function(cls, py_func, py_file):
+        raise NotImplementedError()
+
+
+class _ContentAddressedCacheImpl(CompileResultCacheImpl):
+    # pylint: disable=super-init-not-called
+    def __init__(self, py_func, fingerprint):
+        self._lineno = py_func.__code__.co_firstlineno
+        self._locator = _ContentAddressedLocator(py_func, fingerprint)
+        self._filename_base = self.get_filename_base(
+            py_func.__qualname__.replace(".", "_"), ""
+        )
+
+
+class _ContentAddressedCache(FunctionCache):
+    # pylint: disable=super-init-not-called
+    def __init__(self, py_func, fingerprint):
+        self._name = repr(py_func)
+        self._py_func = py_func
+        self._fingerprint = fingerprint
+        self._impl = _ContentAddressedCacheImpl(py_func, fingerprint)
+        self._cache_path = self._impl.locator.get_cache_path()
+        self._cache_file = IndexDataCacheFile(
+            cache_path=self._cache_path,
+            filename_base=self._impl.filename_base,
+            source_stamp=self._impl.locator.get_source_stamp(),
+        )
+        self.enable()
+
+    def _index_key(self, sig, codegen):
+        return sig, codegen.magic_tuple(), self._fingerprint
+
+    @staticmethod
+    def _sig_cacheable(sig):
+        """signatures involving function-typed arguments embed references to
+        process-local objects, hence these are never cached"""
+        return not any(
+            isinstance(arg, (numba.types.Dispatcher, numba.types.FunctionType))
+            for arg in getattr(sig, "args", sig)
+        )
+
+    def load_overload(self, sig, target_context):
+        if not self._sig_cacheable(sig):
+            return None
+        return super().load_overload(sig, target_context)
+
+    def save_overload(self, sig, data):
+        if self._sig_cacheable(sig):
+            self._impl.locator.ensure_cache_path()
+            super().save_overload(sig, data)
+
+
+def _register_dynamic_module(func, fingerprint):
+    """functions generated with `exec()` (e.g., formulae) have no module, what makes
+    Numba refuse to serialise them - here a module is registered with a copy of their
+    globals so that the compiled code can be looked up upon loading from cache"""
+    name = f"{__name__}._dynamic_{fingerprint[:32]}"
+    if name not in sys.modules:
+        module = types.ModuleType(name)
+        module.__dict__.update(func.__globals__)
+        module.__name__ = name
+        sys.modules[name] = module
+    func.__module__ = name
+
+
+def njit(*args, **jit_flags):
+    """drop-in replacement for `numba.njit` that, if `conf.JIT_CACHE_DIR` is set,
+    equips the resultant dispatcher with the content-addressed on-disk cache"""
+    if not conf.JIT_CACHE_DIR or numba.config.DISABLE_JIT:  # pylint: disable=no-member
+        return numba.njit(*args, **jit_flags)
+
+    def decorator(func):
+        dispatcher = numba.njit(**{**jit_flags, "cache": False})(func)
+        try:
+            fingerprint = _hash(dispatcher)
+        except _NotCacheable:
+            return dispatcher
+        if func.__module__ is None:
+            _register_dynamic_module(func, fingerprint)
+        dispatcher._cache = _ContentAddressedCache(  # pylint: disable=protected-access
+            func, fingerprint
+        )
+        return dispatcher
+
+    if len(args) == 1 and callable(args[0]):
+        return decorator(args[0])
+    assert len(args) == 0
+    return decorator
@@ -8,7 +8,7 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 from PySDM.backends.impl_numba.toms748 import toms748_solve
 from PySDM.dynamics.impl.chemistry_utils import (
     DIFFUSION_CONST,
@@ -31,6 +31,10 @@ _QUITE_CLOSE_MULTIPLIER = 2
 
 _K = namedtuple("_K", ("NH3", "SO2", "HSO3", "HSO4", "HCO3", "CO2", "HNO3"))
 _conc = namedtuple("_conc", ("N_mIII", "N_V", "C_IV", "S_IV", "S_VI"))
+_DissolutionParams = namedtuple(
+    "_DissolutionParams",
+    ("specific_gravity", "alpha", "diffusion_const"),
+)
 
 
 class ChemistryMethods(BackendMethods):
@@ -41,11 +45,104 @@ class ChemistryMethods(BackendMethods):
         self.EQUILIBRIUM_CONST = EquilibriumConsts(self.formulae)
         self.specific_gravities = SpecificGravities(self.formulae.constants)
 
-    def dissolution(  # pylint:disable=too-many-locals
+        self._dissolution_params = _DissolutionParams(
+            specific_gravity=np.asarray(
+                [
+                    self.specific_gravities[compound]
+                    for compound in GASEOUS_COMPOUNDS.values()
+                ]
+            ),
+            alpha=np.asarray(
+                [
+                    MASS_ACCOMMODATION_COEFFICIENTS[compound]
+                    for compound in GASEOUS_COMPOUNDS.values()
+                ]
+            ),
+            diffusion_const=np.asarray(
+                [DIFFUSION_CONST[compound] for compound in GASEOUS_COMPOUNDS.values()]
+            ),
+        )
+
+        radius = self.formulae.trivia.radius
+        const = self.formulae.constants
+
+        @jit_cache.njit(**conf.JIT_FLAGS)
+        def dissolution_body(  # pylint: disable=too-many-arguments,too-many-locals
+            n_threads,
+            cell_order,
+            cell_start_arg,
+            idx,
+            do_chemistry_flag,
+            mole_amounts,
+            env_mixing_ratio,
+            env_p,
+            env_T,
+            env_rho_d,
+            henrys_constant,
+            timestep,
+            dv,
+            droplet_volume,
+            multiplicity,
+            system_type_closed,
+            dissociation_factor,
+            params,
+            success,
+        ):
+            n_cell = len(cell_order)
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                for i in range(thread_id, n_cell, n_threads):
+                    cell_id = cell_order[i]
+                    cell_start = cell_start_arg[cell_id]
+                    cell_end = cell_start_arg[cell_id + 1]
+                    for c, moles in enumerate(mole_amounts):
+                        Mc = params.specific_gravity[c] * const.Md
+                        Rc = const.R_str / Mc
+                        cinf = (
+                            env_p[cell_id]
+                            / env_T[cell_id]
+                            / (const.Rd / env_mixing_ratio[c][cell_id] + Rc)
+                            / Mc
+                        )
+                        v_avg = np.sqrt(8 * const.R_str * env_T[cell_id] / (np.pi * Mc))
+                        mole_amount_taken = 0.0
+                        for sd_id in idx[cell_start:cell_end]:
+                            if not do_chemistry_flag[sd_id]:
+                                continue
+                            r_w = radius(volume=droplet_volume[sd_id])
+                            dt_over_scale = timestep / (
+                                4 * r_w / (3 * v_avg * params.alpha[c])
+                                + r_w**2 / (3 * params.diffusion_const[c])
+                            )
+                            A_old = moles[sd_id] / droplet_volume[sd_id]
+                            H_eff = (
+                                henrys_constant[c, cell_id]
+                                * dissociation_factor[c][sd_id]
+                            )
+                            A_new = (A_old + dt_over_scale * cinf) / (
+                                1 + dt_over_scale / H_eff / const.R_str / env_T[cell_id]
+                            )
+                            new_mole_amount_per_real_droplet = (
+                                A_new * droplet_volume[sd_id]
+                            )
+                            if new_mole_amount_per_real_droplet < 0:
+                                success[cell_id] = False
+
+                            mole_amount_taken += multiplicity[sd_id] * (
+                                new_mole_amount_per_real_droplet - moles[sd_id]
+                            )
+                            moles[sd_id] = new_mole_amount_per_real_droplet
+                        delta_mr = mole_amount_taken * Mc / (dv * env_rho_d[cell_id])
+                        if delta_mr > env_mixing_ratio[c][cell_id]:
+                            success[cell_id] = False
+                        if system_type_closed:
+                            env_mixing_ratio[c][cell_id] -= delta_mr
+
+        self.dissolution_body = dissolution_body
+
+    def dissolution(  # pylint: disable=too-many-locals
         self,
         *,
         n_cell,
-        n_threads,
         cell_order,
         cell_start_arg,
         idx,
@@ -62,99 +159,42 @@ class ChemistryMethods(BackendMethods):
         droplet_volume,
         multiplicity,
     ):
-        for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
-            for i in range(thread_id, n_cell, n_threads):
-                cell_id = cell_order[i]
-
-                cell_start = cell_start_arg[cell_id]
-                cell_end = cell_start_arg[cell_id + 1]
-                n_sd_in_cell = cell_end - cell_start
-                if n_sd_in_cell == 0:
-                    continue
-
-                super_droplet_ids = numba.typed.List()
-                for sd_id in idx[cell_start:cell_end]:
-                    if do_chemistry_flag.data[sd_id]:
-                        super_droplet_ids.append(sd_id)
-
-                if len(super_droplet_ids) == 0:
-                    return
-
-                for key, compound in GASEOUS_COMPOUNDS.items():
-                    ChemistryMethods.dissolution_body(
-                        super_droplet_ids=super_droplet_ids,
-                        mole_amounts=mole_amounts[key].data,
-                        env_mixing_ratio=env_mixing_ratio[compound][
-                            cell_id : cell_id + 1
-                        ],
-                        henrysConstant=self.HENRY_CONST.HENRY_CONST[compound].at(
-                            env_T[cell_id]
-                        ),
-                        env_p=env_p[cell_id],
-                        env_T=env_T[cell_id],
-                        env_rho_d=env_rho_d[cell_id],
-                        timestep=timestep,
-                        dv=dv,
-                        droplet_volume=droplet_volume.data,
-                        multiplicity=multiplicity.data,
-                        system_type=system_type,
-                        specific_gravity=self.specific_gravities[compound],
-                        alpha=MASS_ACCOMMODATION_COEFFICIENTS[compound],
-                        diffusion_const=DIFFUSION_CONST[compound],
-                        dissociation_factor=dissociation_factors[compound].data,
-                        radius=self.formulae.trivia.radius,
-                        const=self.formulae.constants,
-                    )
-
-    @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-    def dissolution_body(  # pylint: disable=too-many-locals
-        *,
-        super_droplet_ids,
-        mole_amounts,
-        env_mixing_ratio,
-        henrysConstant,
-        env_p,
-        env_T,
-        env_rho_d,
-        timestep,
-        dv,
-        droplet_volume,
-        multiplicity,
-        system_type,
-        specific_gravity,
-        alpha,
-        diffusion_const,
-        dissociation_factor,
-        radius,
-        const,
-    ):
-        mole_amount_taken = 0
-        for i in super_droplet_ids:
-            Mc = specific_gravity * const.Md
-            Rc = const.R_str / Mc
-            cinf = env_p / env_T / (const.Rd / env_mixing_ratio[0] + Rc) / Mc
-            r_w = radius(volume=droplet_volume[i])
-            v_avg = np.sqrt(8 * const.R_str * env_T / (np.pi * Mc))
-            dt_over_scale = timestep / (
-                4 * r_w / (3 * v_avg * alpha) + r_w**2 / (3 * diffusion_const)
-            )
-            A_old = mole_amounts[i] / droplet_volume[i]
-            H_eff = henrysConstant * dissociation_factor[i]
-            A_new = (A_old + dt_over_scale * cinf) / (
-                1 + dt_over_scale / H_eff / const.R_str / env_T
-            )
-            new_mole_amount_per_real_droplet = A_new * droplet_volume[i]
-            assert new_mole_amount_per_real_droplet >= 0
-
-            mole_amount_taken += multiplicity[i] * (
-                new_mole_amount_per_real_droplet - mole_amounts[i]
-            )
-            mole_amounts[i] = new_mole_amount_per_real_droplet
-        delta_mr = mole_amount_taken * specific_gravity * const.Md / (dv * env_rho_d)
-        assert delta_mr <= env_mixing_ratio
-        if system_type == "closed":
-            env_mixing_ratio -= delta_mr
+        """cells are processed in the order given by `cell_order` by all Numba
+        threads, each taking every `n_threads`-th cell (hence, expensive cells
+        should be placed first to balance the load)"""
+        success = np.ones(n_cell, dtype=bool)
+        self.dissolution_body(
+            min(numba.get_num_threads(), n_cell),
+            cell_order,
+            cell_start_arg.data,
+            idx.data,
+            do_chemistry_flag.data,
+            tuple(mole_amounts[key].data for key in GASEOUS_COMPOUNDS),
+            tuple(
+                env_mixing_ratio[compound] for compound in GASEOUS_COMPOUNDS.values()
+            ),
+            env_p.data,
+            env_T.data,
+            env_rho_d.data,
+            np.asarray(
+                [
+                    self.HENRY_CONST.HENRY_CONST[compound].at(env_T.data)
+                    for compound in GASEOUS_COMPOUNDS.values()
+                ]
+            ),
+            timestep,
+            dv,
+            droplet_volume.data,
+            multiplicity.data,
+            system_type == "closed",
+            tuple(
+                dissociation_factors[compound].data
+                for compound in GASEOUS_COMPOUNDS.values()
+            ),
+            self._dissolution_params,
+            success,
+        )
+        assert success.all()
 
     def oxidation(  # pylint: disable=too-many-locals
         self,
@@ -313,6 +353,7 @@ class ChemistryMethods(BackendMethods):
         conc,
         do_chemistry_flag,
         pH,
+        n_iters,
         H_min,
         H_max,
         ionic_strength_threshold,
@@ -342,6 +383,7 @@ class ChemistryMethods(BackendMethods):
             # output
             do_chemistry_flag=do_chemistry_flag.data,
             pH=pH.data,
+            n_iters=n_iters.data,
             # params
             H_min=H_min,
             H_max=H_max,
@@ -360,6 +402,7 @@ class ChemistryMethods(BackendMethods):
         K,
         do_chemistry_flag,
         pH,
+        n_iters,
         # params
         H_min,
         H_max,
@@ -425,6 +468,7 @@ class ChemistryMethods(BackendMethods):
                 within_tolerance=within_tolerance,
             )
             assert _iters_taken != max_iter
+            n_iters[cid] += _iters_taken
             pH[i] = H2pH(H)
             ionic_strength = calc_ionic_strength(H, *args)
             do_chemistry_flag[i] = ionic_strength <= ionic_strength_threshold
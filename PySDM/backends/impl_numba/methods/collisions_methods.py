@@ -7,7 +7,7 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
 from PySDM.backends.impl_numba.storage import Storage
 from PySDM.backends.impl_numba.warnings import warn
@@ -306,6 +306,78 @@ def ll82_Nr(  # pylint: disable=too-many-arguments,unused-argument
         Rd[i] = 1.0 - Rs[i] - Rf[i]
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def linear_collection_efficiency(  # pylint: disable=too-many-locals
+    params, radius_1, radius_2, unit
+):
+    """collection efficiency of a pair of droplets given Berry's parameterization
+    coefficients, returns zero for equal radii and for zero-radius droplets"""
+    A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg = params
+    if radius_1 > radius_2:
+        r = radius_1 / unit
+        r_s = radius_2 / unit
+    else:
+        r = radius_2 / unit
+        r_s = radius_1 / unit
+    p = r_s / r
+    if p not in (0, 1):
+        G = (G1 / r) ** Mg + G2 + G3 * r
+        Gp = (1 - p) ** G
+        if Gp != 0:
+            D = D1 / r**D2
+            E = E1 / r**E2
+            F = (F1 / r) ** Mf + F2
+            return max(0.0, A + B * p + D / p**F + E / Gp)
+    return 0.0
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def compute_norm_factor(cell_start, norm_factor, timestep, dv):
+    n_cell = cell_start.shape[0] - 1
+    for i in range(n_cell):
+        sd_num = cell_start[i + 1] - cell_start[i]
+        if sd_num < 2:
+            norm_factor[i] = 0
+        else:
+            norm_factor[i] = timestep / dv * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
+
+
+FUSED_COLLISION_KERNELS = (
+    "Geometric",
+    "Golovin",
+    "Linear",
+    "ConstantK",
+    "Parameterized",
+)
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def fused_collision_kernel(
+    kernel_id, params, x, y, j, k
+):  # pylint: disable=too-many-arguments
+    """pairwise value of the collision kernel identified by its index
+    in `FUSED_COLLISION_KERNELS` (with `x` and `y` being the attributes
+    listed in the kernel's `fused_spec`), arithmetic order matches the one
+    of the unfused kernel implementations"""
+    if kernel_id == 0:
+        value = (x[j] + x[k]) ** 2
+        value *= params[0]
+        value *= np.abs(y[j] - y[k])
+    elif kernel_id == 1:
+        value = (x[j] + x[k]) * params[0]
+    elif kernel_id == 2:
+        value = (x[j] + x[k]) * params[1] + params[0]
+    elif kernel_id == 3:
+        value = params[0]
+    else:
+        value = linear_collection_efficiency(params[2:], x[j], x[k], params[1])
+        value **= 2
+        value *= params[0]
+        value *= max(x[j], x[k]) ** 2
+        value *= np.abs(y[j] - y[k])
+    return value
+
+
 class CollisionsMethods(BackendMethods):
     def __init__(self):  # pylint: disable=too-many-statements,too-many-locals
         BackendMethods.__init__(self)
@@ -313,7 +385,7 @@ class CollisionsMethods(BackendMethods):
         _break_up = break_up_while if self.formulae.handle_all_breakups else break_up
         const = self.formulae.constants
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def __collision_coalescence_breakup_body(
             *,
             multiplicity,
@@ -375,7 +447,7 @@ class CollisionsMethods(BackendMethods):
 
         self.__collision_coalescence_breakup_body = __collision_coalescence_breakup_body
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def __ll82_coalescence_check_body(*, Ec, dl):
             for i in numba.prange(len(Ec)):  # pylint: disable=not-an-iterable
                 if dl[i] < 0.4e-3:
@@ -392,7 +464,7 @@ class CollisionsMethods(BackendMethods):
             straub_mu3 = self.formulae.fragmentation_function.params_mu3
             straub_erfinv = self.formulae.trivia.erfinv_approx
 
-            @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+            @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
             def __straub_fragmentation_body(
                 *, CW, gam, ds, v_max, frag_volume, rand, Nr1, Nr2, Nr3, Nr4, Nrt, d34
             ):  # pylint: disable=too-many-arguments,too-many-locals
@@ -453,7 +525,7 @@ class CollisionsMethods(BackendMethods):
             ll82_params_d2 = self.formulae.fragmentation_function.params_d2
             ll82_erfinv = self.formulae.fragmentation_function.erfinv
 
-            @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+            @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
             def __ll82_fragmentation_body(
                 *, CKE, W, W2, St, ds, dl, dcoal, frag_volume, rand, Rf, Rs, Rd, tol
             ):  # pylint: disable=too-many-branches,too-many-locals,too-many-statements
@@ -540,7 +612,7 @@ class CollisionsMethods(BackendMethods):
         elif self.formulae.fragmentation_function.__name__ == "Gaussian":
             erfinv_approx = self.formulae.trivia.erfinv_approx
 
-            @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+            @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
             def __gauss_fragmentation_body(
                 *, mu, sigma, frag_volume, rand
             ):  # pylint: disable=too-many-arguments
@@ -553,7 +625,7 @@ class CollisionsMethods(BackendMethods):
         elif self.formulae.fragmentation_function.__name__ == "Feingold1988":
             feingold1988_frag_volume = self.formulae.fragmentation_function.frag_volume
 
-            @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+            @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
             # pylint: disable=too-many-arguments
             def __feingold1988_fragmentation_body(
                 *, scale, frag_volume, x_plus_y, rand, fragtol
@@ -648,12 +720,17 @@ class CollisionsMethods(BackendMethods):
         )
 
     @staticmethod
-    # @numba.njit(**conf.JIT_FLAGS)  # note: as of Numba 0.51, np.dot() does not support ints
+    @numba.njit(**conf.JIT_FLAGS)
     def __cell_id_body(cell_id, cell_origin, strides):
-        cell_id[:] = np.dot(strides, cell_origin)
+        for i in numba.prange(len(cell_id)):  # pylint: disable=not-an-iterable
+            cell_id[i] = 0
+            for dim in range(cell_origin.shape[0]):
+                cell_id[i] += cell_origin[dim, i] * strides[dim]
 
     def cell_id(self, cell_id, cell_origin, strides):
-        return self.__cell_id_body(cell_id.data, cell_origin.data, strides.data)
+        return self.__cell_id_body(
+            cell_id.data, cell_origin.data, strides.data.reshape(-1)
+        )
 
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
@@ -704,6 +781,128 @@ class CollisionsMethods(BackendMethods):
             is_first_in_pair=is_first_in_pair.indicator.data,
         )
 
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    # pylint: disable=too-many-arguments,too-many-locals
+    def __fused_collision_coalescence_body(
+        *,
+        compute_probabilities,
+        coalescence,
+        kernel_id,
+        kernel_params,
+        x,
+        y,
+        multiplicity,
+        idx,
+        length,
+        attributes,
+        rand,
+        prob,
+        healthy,
+        cell_id,
+        cell_idx,
+        norm_factor,
+        n_substeps,
+        collision_rate,
+        collision_rate_deficit,
+        coalescence_rate,
+        is_first_in_pair,
+    ):
+        for i in numba.prange(  # pylint: disable=not-an-iterable,too-many-nested-blocks
+            length // 2
+        ):
+            if compute_probabilities:
+                prob[i] = 0
+                if is_first_in_pair[2 * i]:
+                    first = 2 * i
+                elif is_first_in_pair[2 * i + 1]:
+                    first = 2 * i + 1
+                else:
+                    continue
+                if multiplicity[idx[first]] < multiplicity[idx[first + 1]]:
+                    idx[first], idx[first + 1] = idx[first + 1], idx[first]
+                j, k = idx[first], idx[first + 1]
+                prob[i] = multiplicity[j] * fused_collision_kernel(
+                    kernel_id, kernel_params, x, y, j, k
+                )
+                prob[i] *= norm_factor[cell_idx[cell_id[j]]]
+                prob[i] /= n_substeps
+            if coalescence:
+                prob[i] = np.ceil(prob[i] - rand[i])
+                j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, prob)
+                if skip_pair:
+                    continue
+                prop = multiplicity[j] // multiplicity[k]
+                g = min(int(prob[i]), prop)
+                cid = cell_id[j]
+                atomic_add(collision_rate, cid, g * multiplicity[k])
+                atomic_add(
+                    collision_rate_deficit, cid, (int(prob[i]) - g) * multiplicity[k]
+                )
+                prob[i] = g
+                if g == 0:
+                    continue
+                coalesce(i, j, k, cid, multiplicity, prob, attributes, coalescence_rate)
+                flag_zero_multiplicity(j, k, multiplicity, healthy)
+
+    def fused_collision_coalescence(
+        self,
+        *,
+        kernel,
+        kernel_params,
+        x,
+        y,
+        multiplicity,
+        idx,
+        attributes,
+        rand,
+        prob,
+        healthy,
+        cell_id,
+        cell_idx,
+        cell_start,
+        norm_factor,
+        timestep,
+        dv,
+        n_substeps,
+        collision_rate,
+        collision_rate_deficit,
+        coalescence_rate,
+        is_first_in_pair,
+        compute_probabilities=True,
+        coalescence=True,
+    ):
+        """single pass over candidate pairs doing (if `compute_probabilities`)
+        the within-pair sort by multiplicity, kernel evaluation and normalisation,
+        and (if `coalescence`) the gamma computation and the coalescence itself;
+        in the latter case, `prob` is overwritten with gamma"""
+        # pylint: disable=too-many-locals
+        if compute_probabilities:
+            compute_norm_factor(cell_start.data, norm_factor.data, timestep, dv)
+        self.__fused_collision_coalescence_body(
+            compute_probabilities=compute_probabilities,
+            coalescence=coalescence,
+            kernel_id=FUSED_COLLISION_KERNELS.index(kernel),
+            kernel_params=kernel_params,
+            x=x.data,
+            y=y.data,
+            multiplicity=multiplicity.data,
+            idx=idx.data,
+            length=len(idx),
+            attributes=attributes.data,
+            rand=rand.data,
+            prob=prob.data,
+            healthy=healthy.data,
+            cell_id=cell_id.data,
+            cell_idx=cell_idx.data,
+            norm_factor=norm_factor.data,
+            n_substeps=n_substeps,
+            collision_rate=collision_rate.data,
+            collision_rate_deficit=collision_rate_deficit.data,
+            coalescence_rate=coalescence_rate.data,
+            is_first_in_pair=is_first_in_pair.indicator.data,
+        )
+
     def collision_coalescence_breakup(
         self,
         *,
@@ -1038,17 +1237,32 @@ class CollisionsMethods(BackendMethods):
 
     @staticmethod
     def make_cell_caretaker(idx_shape, idx_dtype, cell_start_len, scheme="default"):
-        class CellCaretaker:  # pylint: disable=too-few-public-methods
+        class CellCaretaker:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+            # with the "incremental" scheme, if more than this fraction of particles
+            # changed cells since the previous call, the full counting sort is used
+            max_moved_fraction = 0.1
+
             def __init__(self, idx_shape, idx_dtype, cell_start_len, scheme):
                 if scheme == "default":
                     if conf.JIT_FLAGS["parallel"]:
                         scheme = "counting_sort_parallel"
                     else:
                         scheme = "counting_sort"
+                if scheme == "incremental":
+                    self.fallback = (
+                        "counting_sort_parallel"
+                        if conf.JIT_FLAGS["parallel"]
+                        else "counting_sort"
+                    )
+                    self.sorted_length = -1
+                    self.n_stay = Storage.empty(cell_start_len - 1, dtype=int)
+                    self.n_in = Storage.empty(cell_start_len - 1, dtype=int)
+                    self.new_cell_start = Storage.empty(cell_start_len, dtype=int)
+                else:
+                    self.fallback = scheme
                 self.scheme = scheme
-                if scheme in ("counting_sort", "counting_sort_parallel"):
-                    self.tmp_idx = Storage.empty(idx_shape, idx_dtype)
-                if scheme == "counting_sort_parallel":
+                self.tmp_idx = Storage.empty(idx_shape, idx_dtype)
+                if self.fallback == "counting_sort_parallel":
                     self.cell_starts = Storage.empty(
                         (
                             numba.config.NUMBA_NUM_THREADS,  # pylint: disable=no-member
@@ -1058,8 +1272,36 @@ class CollisionsMethods(BackendMethods):
                     )
 
             def __call__(self, cell_id, cell_idx, cell_start, idx):
+                if self.scheme == "incremental":
+                    status = 0
+                    if self.sorted_length == len(idx):
+                        status = self.__incremental_sort(
+                            cell_id, cell_idx, cell_start, idx
+                        )
+                    self.sorted_length = len(idx)
+                    if status == 1:
+                        return
+                    if status == 2:
+                        idx.data, self.tmp_idx.data = self.tmp_idx.data, idx.data
+                        return
+                self.__full_sort(cell_id, cell_idx, cell_start, idx)
+
+            def __incremental_sort(self, cell_id, cell_idx, cell_start, idx):
+                return CollisionsMethods._incremental_sort_by_cell_id_and_update_cell_start(
+                    self.tmp_idx.data,
+                    idx.data,
+                    cell_id.data,
+                    cell_idx.data,
+                    cell_start.data,
+                    self.n_stay.data,
+                    self.n_in.data,
+                    self.new_cell_start.data,
+                    int(self.max_moved_fraction * len(idx)),
+                )
+
+            def __full_sort(self, cell_id, cell_idx, cell_start, idx):
                 length = len(idx)
-                if self.scheme == "counting_sort":
+                if self.fallback == "counting_sort":
                     CollisionsMethods._counting_sort_by_cell_id_and_update_cell_start(
                         self.tmp_idx.data,
                         idx.data,
@@ -1068,7 +1310,7 @@ class CollisionsMethods(BackendMethods):
                         length,
                         cell_start.data,
                     )
-                elif self.scheme == "counting_sort_parallel":
+                elif self.fallback == "counting_sort_parallel":
                     CollisionsMethods._parallel_counting_sort_by_cell_id_and_update_cell_start(
                         self.tmp_idx.data,
                         idx.data,
@@ -1088,15 +1330,7 @@ class CollisionsMethods(BackendMethods):
     def __normalize_body(
         prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv
     ):
-        n_cell = cell_start.shape[0] - 1
-        for i in range(n_cell):
-            sd_num = cell_start[i + 1] - cell_start[i]
-            if sd_num < 2:
-                norm_factor[i] = 0
-            else:
-                norm_factor[i] = (
-                    timestep / dv * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
-                )
+        compute_norm_factor(cell_start, norm_factor, timestep, dv)
         for d in numba.prange(prob.shape[0]):  # pylint: disable=not-an-iterable
             prob[d] *= norm_factor[cell_idx[cell_id[d]]]
 
@@ -1188,32 +1422,91 @@ class CollisionsMethods(BackendMethods):
 
         cell_start[:] = cell_end_thread[0, :]
 
+    @staticmethod
+    @numba.njit(**conf.JIT_FLAGS)
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+    def _incremental_sort_by_cell_id_and_update_cell_start(
+        new_idx,
+        idx,
+        cell_id,
+        cell_idx,
+        cell_start,
+        n_stay,
+        n_in,
+        new_cell_start,
+        max_moved,
+    ):
+        """patches an `idx` sorted by cell (as described by `cell_start`) after some
+        of the particles changed cells; returns 0 if more than `max_moved` particles
+        moved (leaving `idx` permuted only within the previous cells and `cell_start`
+        intact, i.e. to be followed by the full sort), 1 if the patch was done
+        in-place in `idx` and 2 if the patched index was written into `new_idx`"""
+        n_cell = len(cell_start) - 1
+        for c in numba.prange(n_cell):  # pylint: disable=not-an-iterable
+            stay_end = cell_start[c]
+            for i in range(cell_start[c], cell_start[c + 1]):
+                if cell_idx[cell_id[idx[i]]] == c:
+                    idx[stay_end], idx[i] = idx[i], idx[stay_end]
+                    stay_end += 1
+            n_stay[c] = stay_end - cell_start[c]
+
+        n_moved = cell_start[n_cell] - np.sum(n_stay)
+        if n_moved > max_moved:
+            return 0
+        if n_moved == 0:
+            return 1
+
+        n_in[:] = 0
+        balanced = True
+        for c in range(n_cell):
+            for i in range(cell_start[c] + n_stay[c], cell_start[c + 1]):
+                n_in[cell_idx[cell_id[idx[i]]]] += 1
+        for c in range(n_cell):
+            new_cell_start[c] = cell_start[c] + n_stay[c]
+            if n_in[c] != cell_start[c + 1] - new_cell_start[c]:
+                balanced = False
+
+        if balanced:
+            n_moved = 0
+            for c in range(n_cell):
+                for i in range(new_cell_start[c], cell_start[c + 1]):
+                    new_idx[n_moved] = idx[i]
+                    n_moved += 1
+            for j in range(n_moved):
+                c = cell_idx[cell_id[new_idx[j]]]
+                idx[new_cell_start[c]] = new_idx[j]
+                new_cell_start[c] += 1
+            return 1
+
+        new_cell_start[0] = 0
+        for c in range(n_cell):
+            new_cell_start[c + 1] = new_cell_start[c] + n_stay[c] + n_in[c]
+        for c in numba.prange(n_cell):  # pylint: disable=not-an-iterable
+            new_idx[new_cell_start[c] : new_cell_start[c] + n_stay[c]] = idx[
+                cell_start[c] : cell_start[c] + n_stay[c]
+            ]
+        for c in range(n_cell):
+            n_in[c] = new_cell_start[c] + n_stay[c]
+        for c in range(n_cell):
+            for i in range(cell_start[c] + n_stay[c], cell_start[c + 1]):
+                target = cell_idx[cell_id[idx[i]]]
+                new_idx[n_in[target]] = idx[i]
+                n_in[target] += 1
+        cell_start[:] = new_cell_start
+        return 2
+
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
     # pylint: disable=too-many-arguments,too-many-locals
     def linear_collection_efficiency_body(
         params, output, radii, is_first_in_pair, idx, length, unit
     ):
-        A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg = params
         output[:] = 0
         for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
             if is_first_in_pair[i]:
-                if radii[idx[i]] > radii[idx[i + 1]]:
-                    r = radii[idx[i]] / unit
-                    r_s = radii[idx[i + 1]] / unit
-                else:
-                    r = radii[idx[i + 1]] / unit
-                    r_s = radii[idx[i]] / unit
-                p = r_s / r
-                if p not in (0, 1):
-                    G = (G1 / r) ** Mg + G2 + G3 * r
-                    Gp = (1 - p) ** G
-                    if Gp != 0:
-                        D = D1 / r**D2
-                        E = E1 / r**E2
-                        F = (F1 / r) ** Mf + F2
-                        output[i // 2] = A + B * p + D / p**F + E / Gp
-                        output[i // 2] = max(0, output[i // 2])
+                output[i // 2] = linear_collection_efficiency(
+                    params, radii[idx[i]], radii[idx[i + 1]], unit
+                )
 
     def linear_collection_efficiency(
         self, *, params, output, radii, is_first_in_pair, unit
@@ -10,13 +10,20 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
-from PySDM.backends.impl_numba.toms748 import toms748_solve
+from PySDM.backends.impl_numba import conf, condensation_solver, jit_cache
+from PySDM.backends.impl_numba.atomic_operations import atomic_add
 from PySDM.backends.impl_numba.warnings import warn
 
 _Counters = namedtuple(
     typename="_Counters",
-    field_names=("n_substeps", "n_activating", "n_deactivating", "n_ripening"),
+    field_names=(
+        "n_substeps",
+        "n_activating",
+        "n_deactivating",
+        "n_ripening",
+        "n_solves_saved",
+        "thread_load",
+    ),
 )
 _Attributes = namedtuple(
     typename="_Attributes",
@@ -49,15 +56,139 @@ _RelativeTolerances = namedtuple(
 )
 
 
+def _condensation_impl(  # pylint: disable=too-many-locals
+    *,
+    solver,
+    n_threads,
+    n_cell,
+    cell_start_arg,
+    attributes,
+    cell_data,
+    idx,
+    rtols,
+    timestep,
+    counters,
+    cell_order,
+    work_stealing,
+    RH_max,
+    success,
+):
+    """solves condensation cell by cell with `n_threads` workers, each taking
+    either every `n_threads`-th cell from `cell_order` (round-robin) or,
+    if `work_stealing`, the next not-yet-taken cell (shared atomic counter);
+    the per-worker sum of `n_substeps * n_sd_in_cell` is stored in
+    `counters.thread_load`; compiled twice: as a parallel loop over cells
+    and as a serial one (for solvers parallelised over droplets within a cell,
+    as nested parallel regions are not supported by all Numba threading layers)"""
+    # arrays within namedtuples in prange loops do not work
+    # https://github.com/numba/numba/issues/5872
+    cdt_predicted_water_vapour_mixing_ratio = (
+        cell_data.predicted_water_vapour_mixing_ratio
+    )
+    cdt_pthd = cell_data.pthd
+    cnt_n_substeps = counters.n_substeps
+    cnt_n_activating = counters.n_activating
+    cnt_n_deactivating = counters.n_deactivating
+    cnt_n_ripening = counters.n_ripening
+    cnt_n_solves_saved = counters.n_solves_saved
+    cnt_thread_load = counters.thread_load
+
+    cnt_thread_load[:] = 0
+    next_in_queue = np.full(1, n_threads)
+    for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+        i = np.int64(thread_id)  # note: parallel loop index cannot be overwritten
+        while i < n_cell:
+            cell_id = cell_order[i]
+            cell_start = cell_start_arg[cell_id]
+            cell_end = cell_start_arg[cell_id + 1]
+            n_sd_in_cell = cell_end - cell_start
+            if n_sd_in_cell != 0:
+                (
+                    success[cell_id],
+                    cdt_predicted_water_vapour_mixing_ratio[cell_id],
+                    cdt_pthd[cell_id],
+                    cnt_n_substeps[cell_id],
+                    cnt_n_activating[cell_id],
+                    cnt_n_deactivating[cell_id],
+                    cnt_n_ripening[cell_id],
+                    RH_max[cell_id],
+                    cnt_n_solves_saved[cell_id],
+                ) = solver(
+                    attributes=attributes,
+                    cell_idx=idx[cell_start:cell_end],
+                    thd=cell_data.thd[cell_id],
+                    water_vapour_mixing_ratio=cell_data.water_vapour_mixing_ratio[
+                        cell_id
+                    ],
+                    rhod=cell_data.rhod[cell_id],
+                    dthd_dt=(cell_data.pthd[cell_id] - cell_data.thd[cell_id])
+                    / timestep,
+                    d_water_vapour_mixing_ratio__dt=(
+                        cell_data.predicted_water_vapour_mixing_ratio[cell_id]
+                        - cell_data.water_vapour_mixing_ratio[cell_id]
+                    )
+                    / timestep,
+                    drhod_dt=(cell_data.prhod[cell_id] - cell_data.rhod[cell_id])
+                    / timestep,
+                    m_d=(
+                        (cell_data.prhod[cell_id] + cell_data.rhod[cell_id])
+                        / 2
+                        * cell_data.dv_mean[cell_id]
+                    ),
+                    air_density=cell_data.air_density[cell_id],
+                    air_dynamic_viscosity=cell_data.air_dynamic_viscosity[cell_id],
+                    rtols=rtols,
+                    timestep=timestep,
+                    n_substeps=counters.n_substeps[cell_id],
+                )
+                cnt_thread_load[thread_id] += cnt_n_substeps[cell_id] * n_sd_in_cell
+            if work_stealing:
+                i = atomic_add(next_in_queue, 0, 1)
+            else:
+                i += n_threads
+
+
 class CondensationMethods(BackendMethods):
-    # pylint: disable=unused-argument
-    @staticmethod
-    def condensation(**kwargs):
-        n_threads = min(numba.get_num_threads(), kwargs["n_cell"])
-        CondensationMethods._condensation(
-            solver=kwargs["solver"],
+    def __init__(self):
+        BackendMethods.__init__(self)
+        self.__droplet_parallel_solvers = {}
+
+    @property
+    def n_threads(self):
+        """upper bound on the number of threads the condensation kernel may use
+        (i.e., the length of the `thread_load` counter)"""
+        return numba.config.NUMBA_NUM_THREADS  # pylint: disable=no-member
+
+    _condensation = staticmethod(
+        numba.njit(**{**conf.JIT_FLAGS, **{"cache": False}})(_condensation_impl)
+    )
+    _condensation_serial = staticmethod(
+        numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})(
+            _condensation_impl
+        )
+    )
+
+    def condensation(self, **kwargs):
+        """with `parallel_droplets=None` (default), the droplet-parallel variant
+        of the solver (see `make_condensation_solver()`) is used if there are fewer
+        cells than threads, in which case cells are processed one after another
+        with the per-droplet implicit solve within each cell split across threads"""
+        n_cell = kwargs["n_cell"]
+        parallel_droplets = kwargs.get("parallel_droplets", None)
+        if parallel_droplets is None:
+            parallel_droplets = n_cell < numba.get_num_threads()
+        solver = kwargs["solver"]
+        if parallel_droplets and solver in self.__droplet_parallel_solvers:
+            solver = self.__droplet_parallel_solvers[solver]
+            impl = CondensationMethods._condensation_serial
+            n_threads = 1
+        else:
+            impl = CondensationMethods._condensation
+            n_threads = min(numba.get_num_threads(), n_cell)
+        impl(
+            solver=solver,
             n_threads=n_threads,
-            n_cell=kwargs["n_cell"],
+            n_cell=n_cell,
             cell_start_arg=kwargs["cell_start_arg"].data,
             attributes=_Attributes(
                 water_mass=kwargs["water_mass"].data,
@@ -73,7 +204,11 @@ class CondensationMethods(BackendMethods):
                 rhod=kwargs["rhod"].data,
                 thd=kwargs["thd"].data,
                 water_vapour_mixing_ratio=kwargs["water_vapour_mixing_ratio"].data,
-                dv_mean=kwargs["dv"],
+                dv_mean=(
+                    np.full(kwargs["n_cell"], kwargs["dv"])
+                    if np.ndim(kwargs["dv"]) == 0
+                    else np.asarray(kwargs["dv"], dtype=float)
+                ),
                 prhod=kwargs["prhod"].data,
                 pthd=kwargs["pthd"].data,
                 predicted_water_vapour_mixing_ratio=(
@@ -92,102 +227,34 @@ class CondensationMethods(BackendMethods):
                 n_activating=kwargs["counters"]["n_activating"].data,
                 n_deactivating=kwargs["counters"]["n_deactivating"].data,
                 n_ripening=kwargs["counters"]["n_ripening"].data,
+                n_solves_saved=kwargs["counters"]["n_solves_saved"].data,
+                thread_load=kwargs["counters"]["thread_load"].data,
             ),
             cell_order=kwargs["cell_order"],
+            work_stealing=kwargs["work_stealing"],
             RH_max=kwargs["RH_max"].data,
             success=kwargs["success"].data,
         )
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"cache": False}})
-    def _condensation(  # pylint: disable=too-many-locals
-        *,
-        solver,
-        n_threads,
-        n_cell,
-        cell_start_arg,
-        attributes,
-        cell_data,
-        idx,
-        rtols,
-        timestep,
-        counters,
-        cell_order,
-        RH_max,
-        success,
-    ):
-        # arrays within namedtuples in prange loops do not work
-        # https://github.com/numba/numba/issues/5872
-        cdt_predicted_water_vapour_mixing_ratio = (
-            cell_data.predicted_water_vapour_mixing_ratio
-        )
-        cdt_pthd = cell_data.pthd
-        cnt_n_substeps = counters.n_substeps
-        cnt_n_activating = counters.n_activating
-        cnt_n_deactivating = counters.n_deactivating
-        cnt_n_ripening = counters.n_ripening
-
-        for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
-            for i in range(thread_id, n_cell, n_threads):
-                cell_id = cell_order[i]
-                cell_start = cell_start_arg[cell_id]
-                cell_end = cell_start_arg[cell_id + 1]
-                n_sd_in_cell = cell_end - cell_start
-                if n_sd_in_cell == 0:
-                    continue
-
-                (
-                    success[cell_id],
-                    cdt_predicted_water_vapour_mixing_ratio[cell_id],
-                    cdt_pthd[cell_id],
-                    cnt_n_substeps[cell_id],
-                    cnt_n_activating[cell_id],
-                    cnt_n_deactivating[cell_id],
-                    cnt_n_ripening[cell_id],
-                    RH_max[cell_id],
-                ) = solver(
-                    attributes=attributes,
-                    cell_idx=idx[cell_start:cell_end],
-                    thd=cell_data.thd[cell_id],
-                    water_vapour_mixing_ratio=cell_data.water_vapour_mixing_ratio[
-                        cell_id
-                    ],
-                    rhod=cell_data.rhod[cell_id],
-                    dthd_dt=(cell_data.pthd[cell_id] - cell_data.thd[cell_id])
-                    / timestep,
-                    d_water_vapour_mixing_ratio__dt=(
-                        cell_data.predicted_water_vapour_mixing_ratio[cell_id]
-                        - cell_data.water_vapour_mixing_ratio[cell_id]
-                    )
-                    / timestep,
-                    drhod_dt=(cell_data.prhod[cell_id] - cell_data.rhod[cell_id])
-                    / timestep,
-                    m_d=(
-                        (cell_data.prhod[cell_id] + cell_data.rhod[cell_id])
-                        / 2
-                        * cell_data.dv_mean
-                    ),
-                    air_density=cell_data.air_density[cell_id],
-                    air_dynamic_viscosity=cell_data.air_dynamic_viscosity[cell_id],
-                    rtols=rtols,
-                    timestep=timestep,
-                    n_substeps=counters.n_substeps[cell_id],
-                )
-
-    @staticmethod
-    def make_adapt_substeps(
-        *, jit_flags, formulae, timestep, step_fake, dt_range, fuse, multiplier
-    ):
+    def _n_substeps_range(*, timestep, dt_range, multiplier):
         if not isinstance(multiplier, int):
             raise ValueError()
         if dt_range[1] > timestep:
             dt_range = (dt_range[0], timestep)
         if dt_range[0] == 0:
             raise NotImplementedError()
-        n_substeps_max = math.floor(timestep / dt_range[0])
-        n_substeps_min = math.ceil(timestep / dt_range[1])
+        return math.ceil(timestep / dt_range[1]), math.floor(timestep / dt_range[0])
+
+    @staticmethod
+    def make_adapt_substeps(
+        *, jit_flags, formulae, timestep, step_fake, dt_range, fuse, multiplier
+    ):
+        n_substeps_min, n_substeps_max = CondensationMethods._n_substeps_range(
+            timestep=timestep, dt_range=dt_range, multiplier=multiplier
+        )
 
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**jit_flags)
         def adapt_substeps(args, n_substeps, thd, rtol_thd):
             n_substeps = np.maximum(n_substeps_min, n_substeps // multiplier)
             success = False
@@ -229,7 +296,7 @@ class CondensationMethods(BackendMethods):
 
     @staticmethod
     def make_step_fake(jit_flags, step_impl):
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**jit_flags)
         def step_fake(args, dt, n_substeps):
             dt /= n_substeps
             _, thd_new, _, _, _, _, success = step_impl(*args, dt, 1, True)
@@ -239,21 +306,287 @@ class CondensationMethods(BackendMethods):
 
     @staticmethod
     def make_step(jit_flags, step_impl):
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**jit_flags)
         def step(args, dt, n_substeps):
             return step_impl(*args, dt, n_substeps, False)
 
         return step
 
     @staticmethod
-    def make_step_impl(
+    def make_step_embedded(  # pylint: disable=too-many-arguments
         *,
         jit_flags,
         formulae,
+        substep,
         calculate_ml_old,
+        timestep,
+        dt_range,
+        fuse,
+        multiplier,
+    ):
+        """single-pass alternative to `make_adapt_substeps()` + `make_step()`:
+        each substep is taken for real and accepted or rejected (with droplet
+        masses restored) based on the error estimate returned by `substep()`;
+        the substep count is multiplied by `multiplier` upon rejection and
+        divided by it after substeps with the error estimate below the tolerance
+        by a margin of `multiplier**2` (the estimate being quadratic in substep
+        length), the resultant count is carried to the next timestep;
+        also returned is the number of trial solves that step doubling would have
+        needed to arrive at the same substep count, less the rejected substeps"""
+        n_substeps_min, n_substeps_max = CondensationMethods._n_substeps_range(
+            timestep=timestep, dt_range=dt_range, multiplier=multiplier
+        )
+
+        @jit_cache.njit(**jit_flags)
+        def step_embedded(  # pylint: disable=too-many-locals,too-many-branches
+            args, n_substeps, rtol_thd
+        ):
+            attributes, cell_idx, thd, water_vapour_mixing_ratio, rhod = args[:5]
+            n_substeps_guess = max(n_substeps_min, n_substeps // multiplier)
+            n_substeps = min(n_substeps_max, max(n_substeps_min, n_substeps))
+            water_mass_backup = np.empty(len(cell_idx))
+            ml_old = calculate_ml_old(
+                attributes.water_mass, attributes.multiplicity, cell_idx
+            )
+            count_activating, count_deactivating, count_ripening = 0, 0, 0
+            RH_max = 0.0
+            n_rejected, n_rejected_in_a_row = 0, 0
+            t = 0.0
+            last = False
+            while not last:
+                dt = timestep / n_substeps
+                if timestep - t - dt < dt * 1e-6:
+                    dt = timestep - t
+                    last = True
+                for i, drop in enumerate(cell_idx):
+                    water_mass_backup[i] = attributes.water_mass[drop]
+                (
+                    thd_new,
+                    water_vapour_mixing_ratio_new,
+                    rhod_new,
+                    ml_new,
+                    error_estimate,
+                    RH,
+                    success,
+                    n_activating,
+                    n_deactivating,
+                    n_ripening,
+                ) = substep(
+                    *args[:2],
+                    thd,
+                    water_vapour_mixing_ratio,
+                    rhod,
+                    *args[5:],
+                    dt,
+                    False,
+                    ml_old,
+                )
+                if n_substeps < n_substeps_max and not (
+                    success
+                    and formulae.trivia__within_tolerance(error_estimate, thd, rtol_thd)
+                ):
+                    for i, drop in enumerate(cell_idx):
+                        attributes.water_mass[drop] = water_mass_backup[i]
+                    n_rejected += 1
+                    n_rejected_in_a_row += 1
+                    if n_rejected_in_a_row > fuse:
+                        return warn(
+                            "burnout (embedded)",
+                            __file__,
+                            context=("thd", thd),
+                            return_value=(
+                                water_vapour_mixing_ratio,
+                                thd,
+                                -1,
+                                -1,
+                                -1,
+                                -1.0,
+                                False,
+                                n_substeps,
+                                -n_rejected,
+                            ),
+                        )
+                    n_substeps = min(n_substeps_max, n_substeps * multiplier)
+                    last = False
+                    continue
+                if not success:
+                    break
+                n_rejected_in_a_row = 0
+                t += dt
+                thd = thd_new
+                water_vapour_mixing_ratio = water_vapour_mixing_ratio_new
+                rhod = rhod_new
+                ml_old = ml_new
+                count_activating += n_activating
+                count_deactivating += n_deactivating
+                count_ripening += n_ripening
+                RH_max = max(RH_max, RH)
+                if n_substeps // multiplier >= n_substeps_min and (
+                    formulae.trivia__within_tolerance(
+                        error_estimate * multiplier**2, thd, rtol_thd
+                    )
+                ):
+                    n_substeps //= multiplier
+
+            n_step_doubling_trials = 2
+            n_substeps_doubled = n_substeps_guess
+            while n_substeps_doubled < n_substeps:
+                n_substeps_doubled *= multiplier
+                n_step_doubling_trials += 1
+            return (
+                water_vapour_mixing_ratio,
+                thd,
+                count_activating,
+                count_deactivating,
+                count_ripening,
+                RH_max,
+                success,
+                n_substeps,
+                n_step_doubling_trials - n_rejected,
+            )
+
+        return step_embedded
+
+    @staticmethod
+    def make_substep(
+        *,
+        jit_flags,
+        formulae,
         calculate_ml_new,
     ):
-        @numba.njit(**jit_flags)
+        """the returned error estimate is the `thd` change due to the droplets
+        growing at the relative humidity evaluated without accounting for the
+        vapour condensed within the substep, as compared with the one evaluated
+        at the corrected mid-substep state, linearised using the sensitivity
+        of the condensation rate to relative humidity (no extra droplet solves)"""
+
+        @jit_cache.njit(**jit_flags)
+        def substep(  # pylint: disable=too-many-arguments,too-many-locals
+            attributes,
+            cell_idx,
+            thd,
+            water_vapour_mixing_ratio,
+            rhod,
+            dthd_dt_pred,
+            d_water_vapour_mixing_ratio__dt_predicted,
+            drhod_dt,
+            m_d,
+            air_density,
+            air_dynamic_viscosity,
+            rtol_x,
+            invariants,
+            timestep,
+            fake,
+            ml_old,
+        ):
+            # note: no example yet showing that the trapezoidal scheme brings any improvement
+            thd += timestep * dthd_dt_pred / 2
+            water_vapour_mixing_ratio += (
+                timestep * d_water_vapour_mixing_ratio__dt_predicted / 2
+            )
+            rhod += timestep * drhod_dt / 2
+            T = formulae.state_variable_triplet__T(rhod, thd)
+            p = formulae.state_variable_triplet__p(rhod, T, water_vapour_mixing_ratio)
+            pv = formulae.state_variable_triplet__pv(p, water_vapour_mixing_ratio)
+            lv = formulae.latent_heat__lv(T)
+            pvs = formulae.saturation_vapour_pressure__pvs_Celsius(
+                T - formulae.constants.T0
+            )
+            DTp = formulae.diffusion_thermics__D(T, p)
+            RH = pv / pvs
+            Sc = formulae.trivia__air_schmidt_number(
+                dynamic_viscosity=air_dynamic_viscosity,
+                diffusivity=DTp,
+                density=air_density,
+            )
+            (
+                ml_new,
+                dml_dt__dRH,
+                success,
+                n_activating,
+                n_deactivating,
+                n_ripening,
+            ) = calculate_ml_new(
+                attributes,
+                timestep,
+                fake,
+                T,
+                p,
+                RH,
+                Sc,
+                cell_idx,
+                invariants,
+                lv,
+                pvs,
+                DTp,
+                formulae.diffusion_thermics__K(T, p),
+                rtol_x,
+            )
+            dml_dt = (ml_new - ml_old) / timestep
+            d_water_vapour_mixing_ratio__dt_corrected = -dml_dt / m_d
+            dthd_dt_corr = formulae.state_variable_triplet__dthd_dt(
+                rhod=rhod,
+                thd=thd,
+                T=T,
+                d_water_vapour_mixing_ratio__dt=d_water_vapour_mixing_ratio__dt_corrected,
+                lv=lv,
+            )
+
+            T_corr = formulae.state_variable_triplet__T(
+                rhod, thd + timestep * dthd_dt_corr / 2
+            )
+            p_corr = formulae.state_variable_triplet__p(
+                rhod,
+                T_corr,
+                water_vapour_mixing_ratio
+                + timestep * d_water_vapour_mixing_ratio__dt_corrected / 2,
+            )
+            RH_corr = formulae.state_variable_triplet__pv(
+                p_corr,
+                water_vapour_mixing_ratio
+                + timestep * d_water_vapour_mixing_ratio__dt_corrected / 2,
+            ) / formulae.saturation_vapour_pressure__pvs_Celsius(
+                T_corr - formulae.constants.T0
+            )
+            error_estimate = timestep * np.abs(
+                formulae.state_variable_triplet__dthd_dt(
+                    rhod=rhod,
+                    thd=thd,
+                    T=T,
+                    d_water_vapour_mixing_ratio__dt=dml_dt__dRH * (RH - RH_corr) / m_d,
+                    lv=lv,
+                )
+            )
+
+            thd += timestep * (dthd_dt_pred / 2 + dthd_dt_corr)
+            water_vapour_mixing_ratio += timestep * (
+                d_water_vapour_mixing_ratio__dt_predicted / 2
+                + d_water_vapour_mixing_ratio__dt_corrected
+            )
+            rhod += timestep * drhod_dt / 2
+            return (
+                thd,
+                water_vapour_mixing_ratio,
+                rhod,
+                ml_new,
+                error_estimate,
+                RH,
+                success,
+                n_activating,
+                n_deactivating,
+                n_ripening,
+            )
+
+        return substep
+
+    @staticmethod
+    def make_step_impl(
+        *,
+        jit_flags,
+        calculate_ml_old,
+        substep,
+    ):
+        @jit_cache.njit(**jit_flags)
         def step_impl(  # pylint: disable=too-many-arguments,too-many-locals
             attributes,
             cell_idx,
@@ -267,6 +600,7 @@ class CondensationMethods(BackendMethods):
             air_density,
             air_dynamic_viscosity,
             rtol_x,
+            invariants,
             timestep,
             n_substeps,
             fake,
@@ -279,66 +613,35 @@ class CondensationMethods(BackendMethods):
             RH_max = 0
             success = True
             for _ in range(n_substeps):
-                # note: no example yet showing that the trapezoidal scheme brings any improvement
-                thd += timestep * dthd_dt_pred / 2
-                water_vapour_mixing_ratio += (
-                    timestep * d_water_vapour_mixing_ratio__dt_predicted / 2
-                )
-                rhod += timestep * drhod_dt / 2
-                T = formulae.state_variable_triplet__T(rhod, thd)
-                p = formulae.state_variable_triplet__p(
-                    rhod, T, water_vapour_mixing_ratio
-                )
-                pv = formulae.state_variable_triplet__pv(p, water_vapour_mixing_ratio)
-                lv = formulae.latent_heat__lv(T)
-                pvs = formulae.saturation_vapour_pressure__pvs_Celsius(
-                    T - formulae.constants.T0
-                )
-                DTp = formulae.diffusion_thermics__D(T, p)
-                RH = pv / pvs
-                Sc = formulae.trivia__air_schmidt_number(
-                    dynamic_viscosity=air_dynamic_viscosity,
-                    diffusivity=DTp,
-                    density=air_density,
-                )
                 (
-                    ml_new,
+                    thd,
+                    water_vapour_mixing_ratio,
+                    rhod,
+                    ml_old,
+                    _,
+                    RH,
                     success_within_substep,
                     n_activating,
                     n_deactivating,
                     n_ripening,
-                ) = calculate_ml_new(
+                ) = substep(
                     attributes,
-                    timestep,
-                    fake,
-                    T,
-                    p,
-                    RH,
-                    Sc,
                     cell_idx,
-                    lv,
-                    pvs,
-                    DTp,
-                    formulae.diffusion_thermics__K(T, p),
+                    thd,
+                    water_vapour_mixing_ratio,
+                    rhod,
+                    dthd_dt_pred,
+                    d_water_vapour_mixing_ratio__dt_predicted,
+                    drhod_dt,
+                    m_d,
+                    air_density,
+                    air_dynamic_viscosity,
                     rtol_x,
+                    invariants,
+                    timestep,
+                    fake,
+                    ml_old,
                 )
-                dml_dt = (ml_new - ml_old) / timestep
-                d_water_vapour_mixing_ratio__dt_corrected = -dml_dt / m_d
-                dthd_dt_corr = formulae.state_variable_triplet__dthd_dt(
-                    rhod=rhod,
-                    thd=thd,
-                    T=T,
-                    d_water_vapour_mixing_ratio__dt=d_water_vapour_mixing_ratio__dt_corrected,
-                    lv=lv,
-                )
-
-                thd += timestep * (dthd_dt_pred / 2 + dthd_dt_corr)
-                water_vapour_mixing_ratio += timestep * (
-                    d_water_vapour_mixing_ratio__dt_predicted / 2
-                    + d_water_vapour_mixing_ratio__dt_corrected
-                )
-                rhod += timestep * drhod_dt / 2
-                ml_old = ml_new
                 count_activating += n_activating
                 count_deactivating += n_deactivating
                 count_ripening += n_ripening
@@ -356,235 +659,7 @@ class CondensationMethods(BackendMethods):
 
         return step_impl
 
-    @staticmethod
-    def make_calculate_ml_old(jit_flags):
-        @numba.njit(**jit_flags)
-        def calculate_ml_old(water_mass, multiplicity, cell_idx):
-            result = 0
-            for drop in cell_idx:
-                if water_mass[drop] > 0:
-                    result += multiplicity[drop] * water_mass[drop]
-            return result
-
-        return calculate_ml_old
-
-    @staticmethod
-    def make_calculate_ml_new(  # pylint: disable=too-many-statements
-        *,
-        formulae,
-        jit_flags,
-        max_iters,
-        RH_rtol,
-    ):
-        @numba.njit(**jit_flags)
-        def minfun(  # pylint: disable=too-many-arguments,too-many-locals
-            x_new,
-            x_old,
-            timestep,
-            kappa,
-            f_org,
-            rd3,
-            temperature,
-            RH,
-            lv,
-            pvs,
-            D,
-            K,
-            ventilation_factor,
-        ):
-            volume = formulae.condensation_coordinate__volume(x_new)
-            RH_eq = formulae.hygroscopicity__RH_eq(
-                formulae.trivia__radius(volume),
-                temperature,
-                kappa,
-                rd3,
-                formulae.surface_tension__sigma(
-                    temperature, volume, formulae.constants.PI_4_3 * rd3, f_org
-                ),
-            )
-            r_dr_dt = formulae.drop_growth__r_dr_dt(
-                RH_eq,
-                temperature,
-                RH,
-                lv,
-                pvs,
-                D,
-                K,
-                ventilation_factor,
-            )
-            return (
-                x_old
-                - x_new
-                + timestep * formulae.condensation_coordinate__dx_dt(x_new, r_dr_dt)
-            )
-
-        @numba.njit(**jit_flags)
-        def calculate_ml_new(  # pylint: disable=too-many-branches,too-many-arguments,too-many-locals
-            attributes,
-            timestep,
-            fake,
-            T,
-            p,
-            RH,
-            Sc,
-            cell_idx,
-            lv,
-            pvs,
-            DTp,
-            KTp,
-            rtol_x,
-        ):
-            result = 0
-            n_activating = 0
-            n_deactivating = 0
-            n_activated_and_growing = 0
-            success = True
-            lambdaK = formulae.diffusion_kinetics__lambdaK(T, p)
-            lambdaD = formulae.diffusion_kinetics__lambdaD(DTp, T)
-            for drop in cell_idx:
-                v_drop = formulae.particle_shape_and_density__mass_to_volume(
-                    attributes.water_mass[drop]
-                )
-                if v_drop < 0:
-                    continue
-                x_old = formulae.condensation_coordinate__x(v_drop)
-                r_old = formulae.trivia__radius(v_drop)
-                x_insane = formulae.condensation_coordinate__x(
-                    attributes.vdry[drop] / 100
-                )
-                rd3 = attributes.vdry[drop] / formulae.constants.PI_4_3
-                sgm = formulae.surface_tension__sigma(
-                    T, v_drop, attributes.vdry[drop], attributes.f_org[drop]
-                )
-                RH_eq = formulae.hygroscopicity__RH_eq(
-                    r_old, T, attributes.kappa[drop], rd3, sgm
-                )
-                if not formulae.trivia__within_tolerance(
-                    np.abs(RH - RH_eq), RH, RH_rtol
-                ):
-                    Dr = formulae.diffusion_kinetics__D(DTp, r_old, lambdaD)
-                    Kr = formulae.diffusion_kinetics__K(KTp, r_old, lambdaK)
-                    ventilation_factor = formulae.ventilation__ventilation_coefficient(
-                        sqrt_re_times_cbrt_sc=formulae.trivia__sqrt_re_times_cbrt_sc(
-                            Re=attributes.reynolds_number[drop],
-                            Sc=Sc,
-                        )
-                    )
-                    args = (
-                        x_old,
-                        timestep,
-                        attributes.kappa[drop],
-                        attributes.f_org[drop],
-                        rd3,
-                        T,
-                        RH,
-                        lv,
-                        pvs,
-                        Dr,
-                        Kr,
-                        ventilation_factor,
-                    )
-                    r_dr_dt_old = formulae.drop_growth__r_dr_dt(
-                        RH_eq,
-                        T,
-                        RH,
-                        lv,
-                        pvs,
-                        Dr,
-                        Kr,
-                        ventilation_factor,
-                    )
-                    dx_old = timestep * formulae.condensation_coordinate__dx_dt(
-                        x_old, r_dr_dt_old
-                    )
-                else:
-                    dx_old = 0.0
-                if dx_old == 0:
-                    x_new = x_old
-                else:
-                    a = x_old
-                    b = max(x_insane, a + dx_old)
-                    fa = minfun(a, *args)
-                    fb = minfun(b, *args)
-
-                    counter = 0
-                    while not fa * fb < 0:
-                        counter += 1
-                        if counter > max_iters:
-                            if not fake:
-                                warn(
-                                    "failed to find interval",
-                                    __file__,
-                                    context=(
-                                        "T",
-                                        T,
-                                        "p",
-                                        p,
-                                        "RH",
-                                        RH,
-                                        "a",
-                                        a,
-                                        "b",
-                                        b,
-                                        "fa",
-                                        fa,
-                                        "fb",
-                                        fb,
-                                    ),
-                                )
-                            success = False
-                            break
-                        b = max(x_insane, a + math.ldexp(dx_old, counter))
-                        fb = minfun(b, *args)
-
-                    if not success:
-                        break
-                    if a != b:
-                        if a > b:
-                            a, b = b, a
-                            fa, fb = fb, fa
-
-                        x_new, iters_taken = toms748_solve(
-                            minfun,
-                            args,
-                            a,
-                            b,
-                            fa,
-                            fb,
-                            rtol_x,
-                            max_iters,
-                            formulae.trivia__within_tolerance,
-                        )
-                        if iters_taken in (-1, max_iters):
-                            if not fake:
-                                warn("TOMS failed", __file__)
-                            success = False
-                            break
-                    else:
-                        x_new = x_old
-
-                mass_new = formulae.particle_shape_and_density__volume_to_mass(
-                    formulae.condensation_coordinate__volume(x_new)
-                )
-                mass_cr = formulae.particle_shape_and_density__volume_to_mass(
-                    attributes.v_cr[drop]
-                )
-                result += attributes.multiplicity[drop] * mass_new
-                if not fake:
-                    if mass_new > mass_cr and mass_new > attributes.water_mass[drop]:
-                        n_activated_and_growing += attributes.multiplicity[drop]
-                    if mass_new > mass_cr > attributes.water_mass[drop]:
-                        n_activating += attributes.multiplicity[drop]
-                    if mass_new < mass_cr < attributes.water_mass[drop]:
-                        n_deactivating += attributes.multiplicity[drop]
-                    attributes.water_mass[drop] = mass_new
-            n_ripening = n_activated_and_growing if n_deactivating > 0 else 0
-            return result, success, n_activating, n_deactivating, n_ripening
-
-        return calculate_ml_new
-
-    # pylint disable=unused-argument
-    def make_condensation_solver(
+    def make_condensation_solver(  # pylint: disable=unused-argument
         self,
         timestep,
         n_cell,
@@ -595,21 +670,31 @@ class CondensationMethods(BackendMethods):
         multiplier,
         RH_rtol,
         max_iters,
+        substep_control="step_doubling",
     ):
-        return CondensationMethods.make_condensation_solver_impl(
-            formulae=self.formulae.flatten,
-            timestep=timestep,
-            dt_range=dt_range,
-            adaptive=adaptive,
-            fuse=fuse,
-            multiplier=multiplier,
-            RH_rtol=RH_rtol,
-            max_iters=max_iters,
-        )
+        """returns the cell-parallel solver; its droplet-parallel counterpart
+        (see `condensation()`) is built alongside and looked up by the former"""
+        solvers = {
+            parallel_droplets: CondensationMethods.make_condensation_solver_impl(
+                formulae=self.formulae.flatten,
+                timestep=timestep,
+                dt_range=dt_range,
+                adaptive=adaptive,
+                fuse=fuse,
+                multiplier=multiplier,
+                RH_rtol=RH_rtol,
+                max_iters=max_iters,
+                embedded=substep_control == "embedded",
+                parallel_droplets=parallel_droplets,
+            )
+            for parallel_droplets in (False, True)
+        }
+        self.__droplet_parallel_solvers[solvers[False]] = solvers[True]
+        return solvers[False]
 
     @staticmethod
     @lru_cache()
-    def make_condensation_solver_impl(
+    def make_condensation_solver_impl(  # pylint: disable=too-many-locals
         *,
         formulae,
         timestep,
@@ -619,23 +704,41 @@ class CondensationMethods(BackendMethods):
         multiplier,
         RH_rtol,
         max_iters,
+        embedded=False,
+        parallel_droplets=False,
     ):
         jit_flags = {
             **conf.JIT_FLAGS,
             **{"parallel": False, "cache": False, "fastmath": formulae.fastmath},
         }
 
-        step_impl = CondensationMethods.make_step_impl(
+        calculate_ml_old = condensation_solver.make_calculate_ml_old(jit_flags)
+        substep = CondensationMethods.make_substep(
             jit_flags=jit_flags,
             formulae=formulae,
-            calculate_ml_old=CondensationMethods.make_calculate_ml_old(jit_flags),
-            calculate_ml_new=CondensationMethods.make_calculate_ml_new(
+            calculate_ml_new=condensation_solver.make_calculate_ml_new(
                 jit_flags=jit_flags,
                 formulae=formulae,
                 max_iters=max_iters,
                 RH_rtol=RH_rtol,
+                parallel=parallel_droplets,
             ),
         )
+        step_impl = CondensationMethods.make_step_impl(
+            jit_flags=jit_flags,
+            calculate_ml_old=calculate_ml_old,
+            substep=substep,
+        )
+        step_embedded = CondensationMethods.make_step_embedded(
+            jit_flags=jit_flags,
+            formulae=formulae,
+            substep=substep,
+            calculate_ml_old=calculate_ml_old,
+            timestep=timestep,
+            dt_range=dt_range,
+            fuse=fuse,
+            multiplier=multiplier,
+        )
         step_fake = CondensationMethods.make_step_fake(jit_flags, step_impl)
         adapt_substeps = CondensationMethods.make_adapt_substeps(
             jit_flags=jit_flags,
@@ -647,8 +750,11 @@ class CondensationMethods(BackendMethods):
             multiplier=multiplier,
         )
         step = CondensationMethods.make_step(jit_flags, step_impl)
+        droplet_invariants = condensation_solver.make_droplet_invariants(
+            jit_flags, formulae
+        )
 
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**jit_flags)
         def solve(  # pylint: disable=too-many-arguments,too-many-locals
             attributes,
             cell_idx,
@@ -678,7 +784,31 @@ class CondensationMethods(BackendMethods):
                 air_density,
                 air_dynamic_viscosity,
                 rtols.x,
+                droplet_invariants(attributes, cell_idx),
             )
+            if adaptive and embedded:
+                (
+                    water_vapour_mixing_ratio,
+                    thd,
+                    n_activating,
+                    n_deactivating,
+                    n_ripening,
+                    RH_max,
+                    success,
+                    n_substeps,
+                    n_solves_saved,
+                ) = step_embedded(args, n_substeps, rtols.thd)
+                return (
+                    success,
+                    water_vapour_mixing_ratio,
+                    thd,
+                    n_substeps,
+                    n_activating,
+                    n_deactivating,
+                    n_ripening,
+                    RH_max,
+                    n_solves_saved,
+                )
             success = True
             if adaptive:
                 n_substeps, success = adapt_substeps(args, n_substeps, thd, rtols.thd)
@@ -703,6 +833,7 @@ class CondensationMethods(BackendMethods):
                 n_deactivating,
                 n_ripening,
                 RH_max,
+                0,
             )
 
         return solve
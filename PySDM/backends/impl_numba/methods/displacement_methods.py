@@ -2,14 +2,17 @@
 CPU implementation of backend methods for particle displacement (advection and sedimentation)
 """
 
+from functools import lru_cache
+
 import numba
+import numpy as np
 
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 
 from ...impl_common.backend_methods import BackendMethods
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@jit_cache.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 # pylint: disable=too-many-arguments
 def calculate_displacement_body_common(
     dim, droplet, scheme, _l, _r, displacement, courant, position_in_cell, n_substeps
@@ -23,7 +26,7 @@ def calculate_displacement_body_common(
 
 class DisplacementMethods(BackendMethods):
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+    @jit_cache.njit(**{**conf.JIT_FLAGS, **{"cache": False}})
     # pylint: disable=too-many-arguments
     def calculate_displacement_body_1d(
         dim, scheme, displacement, courant, cell_origin, position_in_cell, n_substeps
@@ -46,7 +49,7 @@ class DisplacementMethods(BackendMethods):
             )
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+    @jit_cache.njit(**{**conf.JIT_FLAGS, **{"cache": False}})
     # pylint: disable=too-many-arguments
     def calculate_displacement_body_2d(
         dim, scheme, displacement, courant, cell_origin, position_in_cell, n_substeps
@@ -75,7 +78,7 @@ class DisplacementMethods(BackendMethods):
             )
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+    @jit_cache.njit(**{**conf.JIT_FLAGS, **{"cache": False}})
     # pylint: disable=too-many-arguments
     def calculate_displacement_body_3d(
         dim, scheme, displacement, courant, cell_origin, position_in_cell, n_substeps
@@ -144,7 +147,34 @@ class DisplacementMethods(BackendMethods):
             raise NotImplementedError()
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    @jit_cache.njit(**conf.JIT_FLAGS)
+    def update_cell_origin_and_id_body(
+        cell_id, cell_origin, position_in_cell, grid, strides
+    ):
+        for droplet in numba.prange(len(cell_id)):  # pylint: disable=not-an-iterable
+            cell_id[droplet] = 0
+            for dim in range(cell_origin.shape[0]):
+                floor_of_position = np.int64(np.floor(position_in_cell[dim, droplet]))
+                position_in_cell[dim, droplet] -= floor_of_position
+                cell_origin[dim, droplet] = (
+                    cell_origin[dim, droplet] + floor_of_position
+                ) % grid[dim]
+                cell_id[droplet] += cell_origin[dim, droplet] * strides[dim]
+
+    @staticmethod
+    def update_cell_origin_and_id(
+        *, cell_id, cell_origin, position_in_cell, grid, strides
+    ):
+        DisplacementMethods.update_cell_origin_and_id_body(
+            cell_id.data,
+            cell_origin.data,
+            position_in_cell.data,
+            grid.data,
+            strides.data.reshape(-1),
+        )
+
+    @staticmethod
+    @jit_cache.njit(**conf.JIT_FLAGS)
     # pylint: disable=too-many-arguments
     def flag_precipitated_body(
         cell_origin,
@@ -159,7 +189,7 @@ class DisplacementMethods(BackendMethods):
     ):
         rainfall = 0.0
         flag = len(idx)
-        for i in range(length):
+        for i in numba.prange(length):  # pylint: disable=not-an-iterable
             position_within_column = (
                 cell_origin[-1, idx[i]] + position_in_cell[-1, idx[i]]
             )
@@ -176,13 +206,13 @@ class DisplacementMethods(BackendMethods):
         return rainfall
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    @jit_cache.njit(**conf.JIT_FLAGS)
     # pylint: disable=too-many-arguments
     def flag_out_of_column_body(
         cell_origin, position_in_cell, idx, length, healthy, domain_top_level_index
     ):
         flag = len(idx)
-        for i in range(length):
+        for i in numba.prange(length):  # pylint: disable=not-an-iterable
             position_within_column = (
                 cell_origin[-1, idx[i]] + position_in_cell[-1, idx[i]]
             )
@@ -231,3 +261,157 @@ class DisplacementMethods(BackendMethods):
             healthy.data,
             domain_top_level_index,
         )
+
+    @staticmethod
+    @lru_cache()
+    def make_displacement_step(n_dims):
+        """returns a kernel (specialised for `n_dims` so that the loops over
+        dimensions get unrolled) advancing each live particle through all its
+        substeps (the number of which is taken from the cell the particle is in
+        at the beginning of the step) in a single parallel pass"""
+
+        @jit_cache.njit(**{**conf.JIT_FLAGS, **{"cache": False}})
+        # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+        def body(
+            scheme,
+            courant,
+            courant_offsets,
+            courant_strides,
+            cell_origin,
+            position_in_cell,
+            cell_id,
+            displacement,
+            idx,
+            length,
+            healthy,
+            grid,
+            strides,
+            n_substeps,
+            relative_fall_velocity,
+            timestep,
+            dz,
+            volume,
+            multiplicity,
+            precipitation_counting_level_index,
+            domain_top_level_index,
+        ):
+            flag = len(idx)
+            rainfall = 0.0
+            for i in numba.prange(length):  # pylint: disable=not-an-iterable
+                droplet = idx[i]
+                n_substeps_droplet = n_substeps[cell_id[droplet]]
+                for _ in range(n_substeps_droplet):
+                    for dim in range(n_dims):
+                        # Arakawa-C grid (components flattened, see `courant_offsets`)
+                        _l = courant_offsets[dim]
+                        for axis in range(n_dims):
+                            _l += (
+                                cell_origin[axis, droplet] * courant_strides[dim, axis]
+                            )
+                        _r = _l + courant_strides[dim, dim]
+                        displacement[dim, droplet] = scheme(
+                            position_in_cell[dim, droplet],
+                            courant[_l] / n_substeps_droplet,
+                            courant[_r] / n_substeps_droplet,
+                        )
+                    if relative_fall_velocity is not None:
+                        dt_over_dz = timestep / n_substeps_droplet / dz
+                        displacement[-1, droplet] = (
+                            displacement[-1, droplet] * (1 / dt_over_dz)
+                            - relative_fall_velocity[droplet]
+                        ) * dt_over_dz
+                    for dim in range(n_dims):
+                        position_in_cell[dim, droplet] += displacement[dim, droplet]
+
+                    position_within_column = (
+                        cell_origin[-1, droplet] + position_in_cell[-1, droplet]
+                    )
+                    removed = False
+                    if relative_fall_velocity is not None:
+                        if (
+                            # falling
+                            displacement[-1, droplet] < 0
+                            and
+                            # and crossed precip-counting level
+                            position_within_column < precipitation_counting_level_index
+                        ):
+                            # TODO #599
+                            rainfall += volume[droplet] * multiplicity[droplet]
+                            removed = True
+                    if (
+                        removed
+                        or position_within_column < 0
+                        or position_within_column > domain_top_level_index
+                    ):
+                        idx[i] = flag
+                        healthy[0] = 0
+                        break
+
+                    # cell origin and id change only for particles crossing cell boundaries
+                    crossed = False
+                    for dim in range(n_dims):
+                        if not 0 <= position_in_cell[dim, droplet] < 1:
+                            crossed = True
+                            floor_of_position = np.int64(
+                                np.floor(position_in_cell[dim, droplet])
+                            )
+                            position_in_cell[dim, droplet] -= floor_of_position
+                            cell_origin[dim, droplet] = (
+                                cell_origin[dim, droplet] + floor_of_position
+                            ) % grid[dim]
+                    if crossed:
+                        cell_id[droplet] = 0
+                        for dim in range(n_dims):
+                            cell_id[droplet] += cell_origin[dim, droplet] * strides[dim]
+            return rainfall
+
+        return body
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def displacement_step(
+        self,
+        *,
+        courant,
+        courant_offsets,
+        courant_strides,
+        cell_origin,
+        position_in_cell,
+        cell_id,
+        displacement,
+        idx,
+        length,
+        healthy,
+        grid,
+        strides,
+        n_substeps,
+        relative_fall_velocity,
+        timestep,
+        dz,
+        volume,
+        multiplicity,
+        precipitation_counting_level_index,
+        domain_top_level_index,
+    ) -> float:
+        return DisplacementMethods.make_displacement_step(cell_origin.shape[0])(
+            self.formulae.particle_advection.displacement,
+            courant.data,
+            courant_offsets.data,
+            courant_strides.data,
+            cell_origin.data,
+            position_in_cell.data,
+            cell_id.data,
+            displacement.data,
+            idx.data,
+            length,
+            healthy.data,
+            grid.data,
+            strides.data.reshape(-1),
+            n_substeps.data,
+            None if relative_fall_velocity is None else relative_fall_velocity.data,
+            timestep,
+            dz,
+            None if volume is None else volume.data,
+            multiplicity.data,
+            precipitation_counting_level_index,
+            domain_top_level_index,
+        )
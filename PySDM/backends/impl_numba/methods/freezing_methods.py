@@ -11,7 +11,7 @@ from ...impl_common.freezing_attributes import (
     SingularAttributes,
     TimeDependentAttributes,
 )
-from ...impl_numba import conf
+from ...impl_numba import conf, jit_cache
 
 
 class FreezingMethods(BackendMethods):
@@ -22,21 +22,21 @@ class FreezingMethods(BackendMethods):
             self.formulae.trivia.frozen_and_above_freezing_point
         )
 
-        @numba.njit(
+        @jit_cache.njit(
             **{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath, "parallel": False}
         )
         def _freeze(water_mass, i):
             water_mass[i] = -1 * water_mass[i]
             # TODO #599: change thd (latent heat)!
 
-        @numba.njit(
+        @jit_cache.njit(
             **{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath, "parallel": False}
         )
         def _thaw(water_mass, i):
             water_mass[i] = -1 * water_mass[i]
             # TODO #599: change thd (latent heat)!
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def freeze_singular_body(
             attributes, temperature, relative_humidity, cell, thaw
         ):
@@ -60,7 +60,7 @@ class FreezingMethods(BackendMethods):
 
         j_het = self.formulae.heterogeneous_ice_nucleation_rate.j_het
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def freeze_time_dependent_body(  # pylint: disable=unused-argument,too-many-arguments
             rand,
             attributes,
@@ -3,27 +3,76 @@ CPU implementation of shuffling and sorting backend methods
 """
 
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
+
+_SHUFFLE_BUCKET_SIZE = 1024
 
 
 class IndexMethods(BackendMethods):
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def identity_index(idx):
         for i in numba.prange(len(idx)):  # pylint: disable=not-an-iterable
             idx[i] = i
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    @jit_cache.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
     def shuffle_global(idx, length, u01):
         for i in range(length - 1, 0, -1):
             j = int(u01[i] * (i + 1))
             idx[i], idx[j] = idx[j], idx[i]
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
+    def shuffle_global_parallel(idx, length, u01):  # pylint: disable=too-many-locals
+        """multi-threaded alternative to `shuffle_global` sorting `idx[:length]`
+        using `u01` as random keys (i.e., resulting in the same permutation as the
+        ThrustRTC implementation, different from the Fisher-Yates one): elements are
+        first scattered into buckets of ~`_SHUFFLE_BUCKET_SIZE` by the leading
+        digits of the keys and then each bucket is sorted separately; stable sorting
+        makes the result independent of the number of threads"""
+        n_buckets = max(1, length // _SHUFFLE_BUCKET_SIZE)
+        n_chunks = numba.get_num_threads()
+        chunk_size = (length + n_chunks - 1) // n_chunks
+
+        bucket = np.empty(length, dtype=np.int64)
+        offsets = np.zeros((n_chunks, n_buckets), dtype=np.int64)
+        for chunk in numba.prange(n_chunks):  # pylint: disable=not-an-iterable
+            for i in range(chunk * chunk_size, min((chunk + 1) * chunk_size, length)):
+                bucket[i] = min(np.int64(u01[i] * n_buckets), n_buckets - 1)
+                offsets[chunk, bucket[i]] += 1
+
+        bucket_start = np.empty(n_buckets + 1, dtype=np.int64)
+        bucket_start[0] = 0
+        for b in range(n_buckets):
+            bucket_start[b + 1] = bucket_start[b] + np.sum(offsets[:, b])
+        for b in numba.prange(n_buckets):  # pylint: disable=not-an-iterable
+            offset = bucket_start[b]
+            for chunk in range(n_chunks):
+                count = offsets[chunk, b]
+                offsets[chunk, b] = offset
+                offset += count
+
+        keys = np.empty(length, dtype=u01.dtype)
+        values = np.empty(length, dtype=idx.dtype)
+        for chunk in numba.prange(n_chunks):  # pylint: disable=not-an-iterable
+            for i in range(chunk * chunk_size, min((chunk + 1) * chunk_size, length)):
+                j = offsets[chunk, bucket[i]]
+                offsets[chunk, bucket[i]] += 1
+                keys[j] = u01[i]
+                values[j] = idx[i]
+
+        for b in numba.prange(n_buckets):  # pylint: disable=not-an-iterable
+            start = bucket_start[b]
+            order = np.argsort(keys[start : bucket_start[b + 1]], kind="mergesort")
+            for j, k in enumerate(order):
+                idx[start + j] = values[start + k]
+
+    @staticmethod
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def shuffle_local(idx, u01, cell_start):
         for c in numba.prange(len(cell_start) - 1):  # pylint: disable=not-an-iterable
             for i in range(cell_start[c + 1] - 1, cell_start[c], -1):
@@ -33,3 +82,19 @@ class IndexMethods(BackendMethods):
     @staticmethod
     def sort_by_key(idx, attr):
         idx.data[:] = attr.data.argsort(kind="stable")[::-1]
+
+    @staticmethod
+    def reorder_by_index(idx, storages):
+        length = idx.length
+        for storage in storages:
+            storage.data[..., :length] = storage.data[..., idx.data[:length]]
+        idx.data[:length] = np.arange(length)
+
+    @staticmethod
+    @jit_cache.njit(**conf.JIT_FLAGS)
+    def index_locality(idx, length):
+        n_contiguous = 0
+        for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
+            if idx[i + 1] == idx[i] + 1:
+                n_contiguous += 1
+        return n_contiguous / max(length - 1, 1)
@@ -7,7 +7,7 @@ from functools import cached_property
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 
 
 class IsotopeMethods(BackendMethods):
@@ -15,7 +15,7 @@ class IsotopeMethods(BackendMethods):
     def __isotopic_delta_body(self):
         phys_isotopic_delta = self.formulae.trivia.isotopic_ratio_2_delta
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def isotopic_delta(output, ratio, reference_ratio):
             for i in numba.prange(output.shape[0]):  # pylint: disable=not-an-iterable
                 output[i] = phys_isotopic_delta(ratio[i], reference_ratio)
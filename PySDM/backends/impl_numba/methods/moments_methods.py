@@ -3,15 +3,62 @@ CPU implementation of moment calculation backend methods
 """
 
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
 
+BINS_SPACING = {None: 0, "monotonic": 1, "linear": 2, "logarithmic": 3}
+
+
+def bin_index_params(x_bins, spacing):
+    """returns the integer code of the `spacing` (see `BINS_SPACING`) of the bin
+    edges and the parameters for `bin_index()`: the first edge (or its logarithm)
+    and the inverse of the bin width (or of the logarithmic bin width)"""
+    if spacing == "linear":
+        return BINS_SPACING[spacing], (
+            x_bins[0],
+            (len(x_bins) - 1) / (x_bins[-1] - x_bins[0]),
+        )
+    if spacing == "logarithmic":
+        return BINS_SPACING[spacing], (
+            np.log(x_bins[0]),
+            (len(x_bins) - 1) / np.log(x_bins[-1] / x_bins[0]),
+        )
+    return BINS_SPACING[spacing], (0.0, 0.0)
+
+
+@jit_cache.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def bin_index(x, x_bins, spacing, params):
+    """index `k` of the bin for which `x_bins[k] <= x < x_bins[k + 1]` or -1 if none:
+    found with a linear scan for arbitrary edges, by bisection for monotonic ones,
+    or in closed form (corrected for round-off) for linear and logarithmic bins"""
+    n_bins = x_bins.shape[0] - 1
+    if spacing == 0:
+        for k in range(n_bins):
+            if x_bins[k] <= x < x_bins[k + 1]:
+                return k
+        return -1
+    if not x_bins[0] <= x < x_bins[n_bins]:
+        return -1
+    if spacing == 1:
+        return np.searchsorted(x_bins, x, side="right") - 1
+    if spacing == 2:
+        k = int((x - params[0]) * params[1])
+    else:
+        k = int((np.log(x) - params[0]) * params[1])
+    k = min(max(k, 0), n_bins - 1)
+    while x < x_bins[k]:
+        k -= 1
+    while x >= x_bins[k + 1]:
+        k += 1
+    return k
+
 
 class MomentsMethods(BackendMethods):
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def moments_body(
         *,
         moment_0,
@@ -30,19 +77,20 @@ class MomentsMethods(BackendMethods):
         skip_division_by_m0,
     ):
         # pylint: disable=too-many-locals
-        moment_0[:] = 0
-        moments[:, :] = 0
+        # sums accumulated in double precision regardless of the output dtype
+        acc_0 = np.zeros(moment_0.shape)
+        acc = np.zeros(moments.shape)
         for idx_i in numba.prange(length):  # pylint: disable=not-an-iterable
             i = idx[idx_i]
             if min_x <= x_attr[i] < max_x:
                 atomic_add(
-                    moment_0,
+                    acc_0,
                     cell_id[i],
                     multiplicity[i] * weighting_attribute[i] ** weighting_rank,
                 )
                 for k in range(ranks.shape[0]):
                     atomic_add(
-                        moments,
+                        acc,
                         (k, cell_id[i]),
                         (
                             multiplicity[i]
@@ -50,11 +98,14 @@ class MomentsMethods(BackendMethods):
                             * attr_data[i] ** ranks[k]
                         ),
                     )
-        if not skip_division_by_m0:
-            for c_id in range(moment_0.shape[0]):
-                for k in range(ranks.shape[0]):
+        for c_id in range(moment_0.shape[0]):
+            moment_0[c_id] = acc_0[c_id]
+            for k in range(ranks.shape[0]):
+                if skip_division_by_m0:
+                    moments[k, c_id] = acc[k, c_id]
+                else:
                     moments[k, c_id] = (
-                        moments[k, c_id] / moment_0[c_id] if moment_0[c_id] != 0 else 0
+                        acc[k, c_id] / acc_0[c_id] if acc_0[c_id] != 0 else 0
                     )
 
     @staticmethod
@@ -93,7 +144,99 @@ class MomentsMethods(BackendMethods):
         )
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
+    def batched_moments_body(
+        moment_0,
+        moments,
+        multiplicity,
+        attributes,
+        cell_id,
+        idx,
+        length,
+        filter_attr,
+        min_x,
+        max_x,
+        weighting_attr,
+        weighting_rank,
+        group_start,
+        moment_attr,
+        moment_rank,
+    ):
+        # pylint: disable=too-many-arguments,too-many-locals
+        n_groups = moment_0.shape[0]
+        n_cell = moment_0.shape[1]
+        n_threads = min(numba.get_num_threads(), max(1, length))
+        buffer = np.empty((n_threads, n_groups + moments.shape[0], n_cell))
+        for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+            acc = buffer[thread_id]
+            acc[:, :] = 0
+            for idx_i in range(
+                thread_id * length // n_threads, (thread_id + 1) * length // n_threads
+            ):
+                i = idx[idx_i]
+                for g in range(n_groups):
+                    if min_x[g] <= attributes[filter_attr[g]][i] < max_x[g]:
+                        weight = (
+                            multiplicity[i]
+                            * attributes[weighting_attr[g]][i] ** weighting_rank[g]
+                        )
+                        acc[g, cell_id[i]] += weight
+                        for k in range(group_start[g], group_start[g + 1]):
+                            acc[n_groups + k, cell_id[i]] += (
+                                weight * attributes[moment_attr[k]][i] ** moment_rank[k]
+                            )
+        for c_id in numba.prange(n_cell):  # pylint: disable=not-an-iterable
+            for g in range(n_groups):
+                moment_0[g, c_id] = np.sum(buffer[:, g, c_id])
+            for k in range(moments.shape[0]):
+                moments[k, c_id] = np.sum(buffer[:, n_groups + k, c_id])
+
+    @staticmethod
+    def batched_moments(
+        *,
+        moment_0,
+        moments,
+        multiplicity,
+        attributes,
+        cell_id,
+        idx,
+        length,
+        filter_attr,
+        min_x,
+        max_x,
+        weighting_attr,
+        weighting_rank,
+        group_start,
+        moment_attr,
+        moment_rank,
+    ):
+        """computes in a single pass over particles the (not normalised) moments for
+        several filtering/weighting groups: `moment_0[g]` is the sum of multiplicity
+        times `attributes[weighting_attr[g]]` to the power of `weighting_rank[g]` over
+        particles for which `attributes[filter_attr[g]]` is within `[min_x[g], max_x[g])`,
+        while `moments[k]` (for `group_start[g] <= k < group_start[g+1]`) are the sums
+        of the same weights times `attributes[moment_attr[k]]` to the power of
+        `moment_rank[k]`; partial sums are accumulated in thread-private buffers"""
+        return MomentsMethods.batched_moments_body(
+            moment_0.data,
+            moments.data,
+            multiplicity.data,
+            tuple(attr.data.astype(float, copy=False) for attr in attributes),
+            cell_id.data,
+            idx.data,
+            length,
+            filter_attr.data,
+            min_x.data,
+            max_x.data,
+            weighting_attr.data,
+            weighting_rank.data,
+            group_start.data,
+            moment_attr.data,
+            moment_rank.data,
+        )
+
+    @staticmethod
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def spectrum_moments_body(
         *,
         moment_0,
@@ -102,41 +245,54 @@ class MomentsMethods(BackendMethods):
         attr_data,
         cell_id,
         idx,
+        cell_start,
         length,
         rank,
         x_bins,
         x_attr,
         weighting_attribute,
         weighting_rank,
+        x_bins_spacing,
+        x_bins_params,
     ):
         # pylint: disable=too-many-locals
-        moment_0[:, :] = 0
-        moments[:, :] = 0
-        for idx_i in numba.prange(length):  # pylint: disable=not-an-iterable
-            i = idx[idx_i]
-            for k in range(x_bins.shape[0] - 1):
-                if x_bins[k] <= x_attr[i] < x_bins[k + 1]:
-                    atomic_add(
-                        moment_0,
-                        (k, cell_id[i]),
-                        multiplicity[i] * weighting_attribute[i] ** weighting_rank,
-                    )
-                    atomic_add(
-                        moments,
-                        (k, cell_id[i]),
-                        (
-                            multiplicity[i]
-                            * weighting_attribute[i] ** weighting_rank
-                            * attr_data[i] ** rank
-                        ),
-                    )
-                    break
-        for c_id in range(moment_0.shape[1]):
-            for k in range(x_bins.shape[0] - 1):
+        n_bins, n_cell = moment_0.shape
+        n_threads = min(numba.get_num_threads(), max(1, length))
+        if n_cell >= n_threads:
+            # each thread handles a disjoint range of cells (of `idx` sorted by cell)
+            n_buffers = 1
+        else:
+            # each thread accumulates into its own histogram
+            n_buffers = n_threads
+        # sums accumulated in double precision regardless of the output dtype
+        buffer = np.zeros((n_buffers, 2, n_bins, n_cell))
+        for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+            if n_buffers == 1:
+                idx_range = range(
+                    cell_start[thread_id * n_cell // n_threads],
+                    cell_start[(thread_id + 1) * n_cell // n_threads],
+                )
+                acc_0, acc = buffer[0, 0], buffer[0, 1]
+            else:
+                idx_range = range(
+                    thread_id * length // n_threads,
+                    (thread_id + 1) * length // n_threads,
+                )
+                acc_0, acc = buffer[thread_id, 0], buffer[thread_id, 1]
+            for idx_i in idx_range:
+                i = idx[idx_i]
+                k = bin_index(x_attr[i], x_bins, x_bins_spacing, x_bins_params)
+                if k < 0:
+                    continue
+                weight = multiplicity[i] * weighting_attribute[i] ** weighting_rank
+                acc_0[k, cell_id[i]] += weight
+                acc[k, cell_id[i]] += weight * attr_data[i] ** rank
+        for c_id in numba.prange(n_cell):  # pylint: disable=not-an-iterable
+            for k in range(n_bins):
+                sum_0 = np.sum(buffer[:, 0, k, c_id])
+                moment_0[k, c_id] = sum_0
                 moments[k, c_id] = (
-                    moments[k, c_id] / moment_0[k, c_id]
-                    if moment_0[k, c_id] != 0
-                    else 0
+                    np.sum(buffer[:, 1, k, c_id]) / sum_0 if sum_0 != 0 else 0
                 )
 
     @staticmethod
@@ -148,15 +304,20 @@ class MomentsMethods(BackendMethods):
         attr_data,
         cell_id,
         idx,
+        cell_start,
         length,
         rank,
         x_bins,
         x_attr,
         weighting_attribute,
         weighting_rank,
+        x_bins_spacing=None,
     ):
         assert moments.shape[0] == x_bins.shape[0] - 1
         assert moment_0.shape == moments.shape
+        x_bins_spacing, x_bins_params = bin_index_params(
+            x_bins.to_ndarray(), x_bins_spacing
+        )
         return MomentsMethods.spectrum_moments_body(
             moment_0=moment_0.data,
             moments=moments.data,
@@ -164,10 +325,13 @@ class MomentsMethods(BackendMethods):
             attr_data=attr_data.data,
             cell_id=cell_id.data,
             idx=idx.data,
+            cell_start=cell_start.data,
             length=length,
             rank=rank,
             x_bins=x_bins.data,
             x_attr=x_attr.data,
             weighting_attribute=weighting_attribute.data,
             weighting_rank=weighting_rank,
+            x_bins_spacing=x_bins_spacing,
+            x_bins_params=x_bins_params,
         )
@@ -6,12 +6,12 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 
 
 class PairMethods(BackendMethods):
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def distance_pair_body(data_out, data_in, is_first_in_pair, idx, length):
         data_out[:] = 0
         for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
@@ -29,7 +29,7 @@ class PairMethods(BackendMethods):
         )
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def find_pairs_body(
         *, cell_start, is_first_in_pair, cell_id, cell_idx, idx, length
     ):
@@ -51,7 +51,7 @@ class PairMethods(BackendMethods):
         )
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def max_pair_body(data_out, data_in, is_first_in_pair, idx, length):
         data_out[:] = 0
         for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
@@ -69,7 +69,7 @@ class PairMethods(BackendMethods):
         )
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def min_pair_body(data_out, data_in, is_first_in_pair, idx, length):
         data_out[:] = 0
         for i in numba.prange(length):  # pylint: disable=not-an-iterable
@@ -87,7 +87,7 @@ class PairMethods(BackendMethods):
         )
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def sort_pair_body(data_out, data_in, is_first_in_pair, idx, length):
         data_out[:] = 0
         for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
@@ -108,7 +108,7 @@ class PairMethods(BackendMethods):
         )
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def sort_within_pair_by_attr_body(idx, length, is_first_in_pair, attr):
         for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
             if is_first_in_pair[i]:
@@ -122,7 +122,7 @@ class PairMethods(BackendMethods):
         )
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def sum_pair_body(data_out, data_in, is_first_in_pair, idx, length):
         data_out[:] = 0
         for i in numba.prange(length):  # pylint: disable=not-an-iterable
@@ -140,7 +140,7 @@ class PairMethods(BackendMethods):
         )
 
     @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
+    @jit_cache.njit(**conf.JIT_FLAGS)
     def multiply_pair_body(data_out, data_in, is_first_in_pair, idx, length):
         data_out[:] = 0
         for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
@@ -8,7 +8,7 @@ import numba
 from numba import prange
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 
 
 class PhysicsMethods(BackendMethods):
@@ -27,13 +27,13 @@ class PhysicsMethods(BackendMethods):
         phys_volume_to_mass = self.formulae.particle_shape_and_density.volume_to_mass
         const = self.formulae.constants
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def explicit_euler_body(y, dt, dy_dt):
             y[:] = explicit_euler(y, dt, dy_dt)
 
         self.explicit_euler_body = explicit_euler_body
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def critical_volume(*, v_cr, kappa, f_org, v_dry, v_wet, T, cell):
             for i in prange(len(v_cr)):  # pylint: disable=not-an-iterable
                 sigma = phys_sigma(T[cell[i]], v_wet[i], v_dry[i], f_org[i])
@@ -48,7 +48,7 @@ class PhysicsMethods(BackendMethods):
 
         self.critical_volume_body = critical_volume
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def temperature_pressure_RH_body(
             *, rhod, thd, water_vapour_mixing_ratio, T, p, RH
         ):
@@ -61,7 +61,7 @@ class PhysicsMethods(BackendMethods):
 
         self.temperature_pressure_RH_body = temperature_pressure_RH_body
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def a_w_ice_body(
             *, T_in, p_in, RH_in, water_vapour_mixing_ratio_in, a_w_ice_out
         ):
@@ -73,14 +73,14 @@ class PhysicsMethods(BackendMethods):
 
         self.a_w_ice_body = a_w_ice_body
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def volume_of_mass(volume, mass):
             for i in prange(volume.shape[0]):  # pylint: disable=not-an-iterable
                 volume[i] = phys_mass_to_volume(mass[i])
 
         self.volume_of_mass_body = volume_of_mass
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def mass_of_volume(mass, volume):
             for i in prange(volume.shape[0]):  # pylint: disable=not-an-iterable
                 mass[i] = phys_volume_to_mass(volume[i])
@@ -132,7 +132,7 @@ class PhysicsMethods(BackendMethods):
     def __air_density_body(self):
         formulae = self.formulae.flatten
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def body(output, rhod, water_vapour_mixing_ratio):
             for i in numba.prange(output.shape[0]):  # pylint: disable=not-an-iterable
                 output[i] = (
@@ -150,7 +150,7 @@ class PhysicsMethods(BackendMethods):
     def __air_dynamic_viscosity_body(self):
         formulae = self.formulae.flatten
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def body(output, temperature):
             for i in numba.prange(output.shape[0]):  # pylint: disable=not-an-iterable
                 output[i] = formulae.air_dynamic_viscosity__eta_air(temperature[i])
@@ -164,7 +164,7 @@ class PhysicsMethods(BackendMethods):
     def __reynolds_number_body(self):
         formulae = self.formulae.flatten
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": formulae.fastmath})
         def body(  # pylint: disable=too-many-arguments
             output,
             cell_id,
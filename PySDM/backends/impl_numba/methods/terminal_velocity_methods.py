@@ -5,34 +5,43 @@ CPU implementation of backend methods for terminal velocities
 from functools import cached_property
 
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 
 
 class TerminalVelocityMethods(BackendMethods):
     @cached_property
     def interpolation_body(self):
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def interpolation_body(output, radius, factor, b, c):
+            out_of_range = 0
             for i in numba.prange(len(radius)):  # pylint: disable=not-an-iterable
                 if radius[i] < 0:
                     output[i] = 0
                 else:
                     r_id = int(factor * radius[i])
-                    r_rest = ((factor * radius[i]) % 1) / factor
-                    output[i] = b[r_id] + r_rest * c[r_id]
+                    if r_id >= len(b):
+                        output[i] = np.nan
+                        out_of_range += 1
+                    else:
+                        r_rest = ((factor * radius[i]) % 1) / factor
+                        output[i] = b[r_id] + r_rest * c[r_id]
+            return out_of_range
 
         return interpolation_body
 
     def interpolation(self, *, output, radius, factor, b, c):
+        """returns the number of radii beyond the table range
+        (for which `output` is set to NaN)"""
         return self.interpolation_body(output.data, radius.data, factor, b.data, c.data)
 
     @cached_property
     def terminal_velocity_body(self):
         v_term = self.formulae.terminal_velocity.v_term
 
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def terminal_velocity_body(*, values, radius):
             for i in numba.prange(len(values)):  # pylint: disable=not-an-iterable
                 values[i] = v_term(radius[i])
@@ -44,7 +53,7 @@ class TerminalVelocityMethods(BackendMethods):
 
     @cached_property
     def power_series_body(self):
-        @numba.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
         def power_series_body(*, values, radius, num_terms, prefactors, powers):
             for i in numba.prange(len(values)):  # pylint: disable=not-an-iterable
                 values[i] = 0.0
@@ -61,3 +70,64 @@ class TerminalVelocityMethods(BackendMethods):
             prefactors=prefactors,
             powers=powers,
         )
+
+    @cached_property
+    def water_mass_derived_attributes_body(self):
+        mass_to_volume = self.formulae.particle_shape_and_density.mass_to_volume
+        one_over_pi_4_3 = 1 / self.formulae.constants.PI_4_3
+        v_term = getattr(self.formulae.terminal_velocity, "v_term", None)
+        if v_term is None:
+
+            @numba.njit(**{**conf.JIT_FLAGS, "parallel": False})
+            def v_term(_):
+                return np.nan
+
+        @jit_cache.njit(**{**conf.JIT_FLAGS, "fastmath": self.formulae.fastmath})
+        def water_mass_derived_attributes_body(
+            *, water_mass, volume, radius, terminal_velocity, factor, b, c
+        ):  # pylint: disable=too-many-arguments
+            out_of_range = 0
+            for i in numba.prange(len(water_mass)):  # pylint: disable=not-an-iterable
+                v = mass_to_volume(water_mass[i])
+                r = (v * one_over_pi_4_3) ** (1 / 3)
+                if volume is not None:
+                    volume[i] = v
+                if radius is not None:
+                    radius[i] = r
+                if terminal_velocity is not None:
+                    if b is None:
+                        terminal_velocity[i] = v_term(r)
+                    elif r < 0:
+                        terminal_velocity[i] = 0
+                    else:
+                        r_id = int(factor * r)
+                        if r_id >= len(b):
+                            terminal_velocity[i] = np.nan
+                            out_of_range += 1
+                        else:
+                            r_rest = ((factor * r) % 1) / factor
+                            terminal_velocity[i] = b[r_id] + r_rest * c[r_id]
+            return out_of_range
+
+        return water_mass_derived_attributes_body
+
+    def water_mass_derived_attributes(
+        self, *, water_mass, volume, radius, terminal_velocity, table=None
+    ):
+        """computes in a single pass over particles the volume, the radius and
+        the terminal velocity (using the `v_term` formula or, if `table` is given,
+        interpolating in a `(factor, b, c)` table as in `interpolation()`);
+        outputs passed as `None` are not stored; returns the number of radii
+        beyond the table range"""
+        factor, b, c = table or (0, None, None)
+        return self.water_mass_derived_attributes_body(
+            water_mass=water_mass.data,
+            volume=None if volume is None else volume.data,
+            radius=None if radius is None else radius.data,
+            terminal_velocity=(
+                None if terminal_velocity is None else terminal_velocity.data
+            ),
+            factor=factor,
+            b=None if b is None else b.data,
+            c=None if c is None else c.data,
+        )
@@ -10,14 +10,98 @@ from PySDM.backends.impl_common.storage_utils import (
     empty,
     get_data_from_ndarray,
 )
+from PySDM.backends.impl_numba import storage_expression as expr
 from PySDM.backends.impl_numba import storage_impl as impl
 
 
-class Storage(StorageBase):
+class Storage(StorageBase):  # pylint: disable=too-many-public-methods
     FLOAT = np.float64
     INT = np.int64
     BOOL = np.bool_
 
+    def __init__(self, signature):
+        self.__statements = None
+        self.__constants = None
+        self.expression_arrays = None
+        super().__init__(signature)
+
+    @property
+    def data(self):
+        if expr.PENDING:
+            expr.flush_overlapping(self._data, operands=True)
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        if self.__statements is not None:
+            self.evaluate()
+        self._data = value
+
+    @property
+    def expression_output(self):
+        return self._data
+
+    @staticmethod
+    def deferred():
+        """context manager within which element-wise arithmetics is deferred
+        and fused (see `PySDM.backends.impl_numba.storage_expression`)"""
+        return expr.deferred()
+
+    def evaluate(self):
+        """evaluates the deferred operations recorded for this storage (if any)"""
+        if self.__statements is None:
+            return
+        statements, arrays, constants = (
+            tuple(self.__statements),
+            self.expression_arrays,
+            self.__constants,
+        )
+        self.__statements = None
+        self.expression_arrays = None
+        self.__constants = None
+        expr.PENDING.remove(self)
+        expr.kernel(statements, len(arrays), len(constants))(
+            self._data, *arrays, *constants
+        )
+
+    def _defer(self, statement, *operands, assignment=False):
+        """records `statement` (in which `{0}`, `{1}`, ... stand for `operands`)
+        if in deferred mode and if applicable, otherwise returns False"""
+        if not expr.enabled() or self._data.ndim != 1 or self.dtype != self.FLOAT:
+            return False
+        for operand in operands:
+            if isinstance(operand, Storage):
+                if operand.shape != self.shape or len(operand._data.shape) != 1:
+                    return False
+            elif not isinstance(operand, (int, float, np.number)):
+                return False
+
+        expr.flush_overlapping(self._data, operands=True, exclude=self)
+        for operand in operands:
+            if isinstance(operand, Storage):
+                expr.flush_overlapping(operand._data, operands=False)
+        if assignment or self.__statements is None:
+            self.__statements = []
+            self.expression_arrays = []
+            self.__constants = []
+        names = []
+        for operand in operands:
+            if isinstance(operand, Storage):
+                names.append(f"a{len(self.expression_arrays)}[i]")
+                self.expression_arrays.append(operand._data)
+            else:
+                names.append(f"c{len(self.__constants)}")
+                self.__constants.append(operand)
+        self.__statements.append(statement.format(*names))
+        if self not in expr.PENDING:
+            expr.PENDING.append(self)
+        return True
+
+    @property
+    def __view_class(self):
+        """the (non-indexed, non-pairwise) storage class matching the precision"""
+        return SinglePrecisionStorage if self.FLOAT == np.float32 else Storage
+
     def __getitem__(self, item):
         dim = len(self.shape)
         if isinstance(item, slice):
@@ -42,9 +126,11 @@ class Storage(StorageBase):
                     f"requested a slice ({start}:{stop}) of Storage"
                     f" with first dim of length {self.data.shape[0]}"
                 )
-            result = Storage(StorageSignature(result_data, result_shape, self.dtype))
+            result = self.__view_class(
+                StorageSignature(result_data, result_shape, self.dtype)
+            )
         elif isinstance(item, tuple) and dim == 2 and isinstance(item[1], slice):
-            result = Storage(
+            result = self.__view_class(
                 StorageSignature(self.data[item[0]], (*self.shape[1:],), self.dtype)
             )
         else:
@@ -59,6 +145,11 @@ class Storage(StorageBase):
         return self
 
     def __iadd__(self, other):
+        if isinstance(other, tuple) and len(other) == 3 and other[1] == "*":
+            if self._defer("v = v + {0} * {1}", other[0], other[2]):
+                return self
+        elif self._defer("v = v + {0}", other):
+            return self
         if isinstance(other, Storage):
             impl.add(self.data, other.data)
         elif (
@@ -74,10 +165,14 @@ class Storage(StorageBase):
         return self
 
     def __isub__(self, other):
+        if self._defer("v = v - {0}", other):
+            return self
         impl.subtract(self.data, other.data)
         return self
 
     def __imul__(self, other):
+        if self._defer("v = v * {0}", other):
+            return self
         if hasattr(other, "data"):
             impl.multiply(self.data, other.data)
         else:
@@ -85,6 +180,8 @@ class Storage(StorageBase):
         return self
 
     def __itruediv__(self, other):
+        if self._defer("v = v / {0}", other):
+            return self
         if hasattr(other, "data"):
             self.data[:] /= other.data[:]
         else:
@@ -96,6 +193,8 @@ class Storage(StorageBase):
         return self
 
     def __ipow__(self, other):
+        if self._defer("v = np.sign(v) * np.power(np.abs(v), {0})", other):
+            return self
         impl.power(self.data, other)
         return self
 
@@ -117,31 +216,31 @@ class Storage(StorageBase):
             data = self.data
         np.copyto(target, data, casting="safe")
 
-    @staticmethod
-    def _get_empty_data(shape, dtype):
-        if dtype in (float, Storage.FLOAT):
-            data = np.full(shape, np.nan, dtype=Storage.FLOAT)
-            dtype = Storage.FLOAT
-        elif dtype in (int, Storage.INT):
-            data = np.full(shape, -1, dtype=Storage.INT)
-            dtype = Storage.INT
-        elif dtype in (bool, Storage.BOOL):
-            data = np.full(shape, -1, dtype=Storage.BOOL)
-            dtype = Storage.BOOL
+    @classmethod
+    def _get_empty_data(cls, shape, dtype):
+        if dtype in (float, cls.FLOAT):
+            data = np.full(shape, np.nan, dtype=cls.FLOAT)
+            dtype = cls.FLOAT
+        elif dtype in (int, cls.INT):
+            data = np.full(shape, -1, dtype=cls.INT)
+            dtype = cls.INT
+        elif dtype in (bool, cls.BOOL):
+            data = np.full(shape, -1, dtype=cls.BOOL)
+            dtype = cls.BOOL
         else:
             raise NotImplementedError()
 
         return StorageSignature(data, shape, dtype)
 
-    @staticmethod
-    def empty(shape, dtype):
-        return empty(shape, dtype, Storage)
+    @classmethod
+    def empty(cls, shape, dtype):
+        return empty(shape, dtype, cls)
 
-    @staticmethod
-    def _get_data_from_ndarray(array):
+    @classmethod
+    def _get_data_from_ndarray(cls, array):
         return get_data_from_ndarray(
             array=array,
-            storage_class=Storage,
+            storage_class=cls,
             copy_fun=lambda array_astype: array_astype.copy(),
         )
 
@@ -154,12 +253,17 @@ class Storage(StorageBase):
     def all(self):
         return self.data.all()
 
-    @staticmethod
-    def from_ndarray(array):
-        result = Storage(Storage._get_data_from_ndarray(array))
+    @classmethod
+    def from_ndarray(cls, array):
+        result = cls(cls._get_data_from_ndarray(array))
         return result
 
     def floor(self, other=None):
+        if other is None:
+            if self._defer("v = np.floor(v)"):
+                return self
+        elif self._defer("v = np.floor({0})", other, assignment=True):
+            return self
         if other is None:
             impl.floor(self.data)
         else:
@@ -167,6 +271,8 @@ class Storage(StorageBase):
         return self
 
     def product(self, multiplicand, multiplier):
+        if self._defer("v = {0} * {1}", multiplicand, multiplier, assignment=True):
+            return self
         if hasattr(multiplier, "data"):
             impl.multiply_out_of_place(self.data, multiplicand.data, multiplier.data)
         else:
@@ -174,6 +280,8 @@ class Storage(StorageBase):
         return self
 
     def ratio(self, dividend, divisor):
+        if self._defer("v = {0} / {1}", dividend, divisor, assignment=True):
+            return self
         impl.divide_out_of_place(self.data, dividend.data, divisor.data)
         return self
 
@@ -182,6 +290,8 @@ class Storage(StorageBase):
         return self
 
     def sum(self, arg_a, arg_b):
+        if self._defer("v = {0} + {1}", arg_a, arg_b, assignment=True):
+            return self
         impl.sum_out_of_place(self.data, arg_a.data, arg_b.data)
         return self
 
@@ -198,9 +308,15 @@ class Storage(StorageBase):
         return self.data.copy()
 
     def upload(self, data):
-        np.copyto(self.data, data, casting="safe")
+        np.copyto(
+            self.data,
+            data,
+            casting="same_kind" if self.dtype == self.FLOAT != np.float64 else "safe",
+        )
 
     def fill(self, other):
+        if self._defer("v = {0}", other, assignment=True):
+            return
         if isinstance(other, Storage):
             self.data[:] = other.data
         else:
@@ -208,3 +324,10 @@ class Storage(StorageBase):
 
     def exp(self):
         self.data[:] = np.exp(self.data)
+
+
+class SinglePrecisionStorage(Storage):
+    """`Storage` variant keeping floating-point data in single precision
+    (integer data, e.g. multiplicities, is kept in 64 bits)"""
+
+    FLOAT = np.float32
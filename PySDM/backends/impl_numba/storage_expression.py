@@ -0,0 +1,80 @@
+"""
+deferred evaluation of element-wise `PySDM.backends.impl_numba.storage.Storage`
+ arithmetics: within the `deferred()` context, in-place operations on 1D float
+ storages (`+=`, `-=`, `*=`, `/=`, `**=`, `floor()`, `fill()`, `product()`,
+ `ratio()`, `sum()`) are recorded as a chain of statements instead of being
+ executed; the chain is compiled (once per distinct chain, see `kernel()`) into
+ a single parallel loop and evaluated when the storage data is accessed, when
+ another operation could alter its operands, or upon exiting the context
+"""
+
+from contextlib import contextmanager
+from functools import lru_cache
+
+import numba
+import numpy as np
+
+from PySDM.backends.impl_numba import conf
+
+PENDING = []
+""" storages with recorded but not yet evaluated operations (in recording order) """
+
+_STATE = {"level": 0}
+
+
+def enabled():
+    return _STATE["level"] > 0
+
+
+@contextmanager
+def deferred():
+    _STATE["level"] += 1
+    try:
+        yield
+    finally:
+        _STATE["level"] -= 1
+        if _STATE["level"] == 0:
+            flush_all()
+
+
+def flush_all():
+    while PENDING:
+        PENDING[0].evaluate()
+
+
+def flush_overlapping(array, *, operands, exclude=None):
+    """evaluates pending expressions writing to memory overlapping with `array`
+    and, if `operands` is set, also those reading from it"""
+    for storage in tuple(PENDING):
+        if storage is exclude or storage not in PENDING:
+            continue
+        if np.may_share_memory(storage.expression_output, array) or (
+            operands
+            and any(
+                np.may_share_memory(operand, array)
+                for operand in storage.expression_arrays
+            )
+        ):
+            storage.evaluate()
+
+
+@lru_cache(maxsize=None)
+def kernel(statements, n_arrays, n_constants):
+    """compiles a loop applying `statements` (in which `v` denotes the value
+    being computed, `a{k}` the k-th array operand and `c{k}` the k-th scalar)"""
+    args = ", ".join(
+        ("out",)
+        + tuple(f"a{k}" for k in range(n_arrays))
+        + tuple(f"c{k}" for k in range(n_constants))
+    )
+    body = "\n".join(f"        {statement}" for statement in statements)
+    source = f"""
+def fused({args}):
+    for i in numba.prange(out.shape[0]):
+        v = out[i]
+{body}
+        out[i] = v
+"""
+    namespace = {"numba": numba, "np": np}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return numba.njit(**conf.JIT_FLAGS)(namespace["fused"])
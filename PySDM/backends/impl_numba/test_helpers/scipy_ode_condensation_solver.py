@@ -30,8 +30,17 @@ def patch_particulator(particulator):
     particulator.condensation = types.MethodType(_condensation, particulator)
 
 
-def _condensation(
-    particulator, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order
+def _condensation(  # pylint: disable=unused-argument
+    particulator,
+    *,
+    rtol_x,
+    rtol_thd,
+    counters,
+    RH_max,
+    success,
+    cell_order,
+    work_stealing=False,
+    parallel_droplets=None,
 ):
     func = Numba._condensation
     if not numba.config.DISABLE_JIT:  # pylint: disable=no-member
@@ -57,7 +66,7 @@ def _condensation(
             water_vapour_mixing_ratio=particulator.environment[
                 "water_vapour_mixing_ratio"
             ].data,
-            dv_mean=particulator.environment.dv,
+            dv_mean=np.full(particulator.mesh.n_cell, particulator.environment.dv),
             prhod=particulator.environment.get_predicted("rhod").data,
             pthd=particulator.environment.get_predicted("thd").data,
             predicted_water_vapour_mixing_ratio=particulator.environment.get_predicted(
@@ -78,8 +87,11 @@ def _condensation(
             n_activating=counters["n_activating"],
             n_deactivating=counters["n_deactivating"],
             n_ripening=counters["n_ripening"],
+            n_solves_saved=counters["n_solves_saved"],
+            thread_load=counters["thread_load"].data,
         ),
         cell_order=cell_order,
+        work_stealing=work_stealing,
         RH_max=RH_max.data,
         success=success.data,
     )
@@ -319,6 +331,7 @@ def _make_solve(formulae):  # pylint: disable=too-many-statements,too-many-local
             1,
             1,
             np.nan,
+            0,
         )
 
     return solve
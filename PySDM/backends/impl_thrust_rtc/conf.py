@@ -6,9 +6,12 @@ default nice_thrust flags
 import os
 from warnings import warn
 
-from PySDM.backends.impl_thrust_rtc.test_helpers.flag import fakeThrustRTC
+from PySDM.backends import probe_cuda
+from PySDM.backends.impl_thrust_rtc.test_helpers import flag
 
-if not fakeThrustRTC:
+probe_cuda()
+
+if not flag.fakeThrustRTC:
     try:
         # noinspection PyUnresolvedReferences
         import ThrustRTC as trtc  # pylint: disable=unused-import
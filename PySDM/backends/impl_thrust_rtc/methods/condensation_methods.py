@@ -5,6 +5,8 @@ GPU implementation of backend methods for water condensation/evaporation
 from functools import cached_property
 from typing import Dict, Optional
 
+import numpy as np
+
 from PySDM.backends.impl_common.storage_utils import StorageBase
 from PySDM.backends.impl_thrust_rtc.bisection import BISECTION
 from PySDM.backends.impl_thrust_rtc.conf import NICE_THRUST_FLAGS
@@ -61,6 +63,11 @@ class CondensationMethods(
             ),
         )
 
+    @property
+    def n_threads(self):
+        """the whole GPU counts as a single thread for the `thread_load` counter"""
+        return 1
+
     def __init__(self):
         ThrustRTCBackendMethods.__init__(self)
         self.RH_rtol = None
@@ -411,6 +418,8 @@ class CondensationMethods(
         timestep,
         counters,
         cell_order,
+        work_stealing,
+        parallel_droplets,
         RH_max,
         success,
         cell_id,
@@ -444,9 +453,11 @@ class CondensationMethods(
                 self.rhod_copy.data,
                 dvfloat(timestep),
                 RH_max.data,
-                dvfloat(dv),
+                dvfloat(dv if np.ndim(dv) == 0 else 1),
             ),
         )
+        if np.ndim(dv) != 0:
+            self.m_d *= self.Storage.from_ndarray(np.asarray(dv, dtype=float))
         timestep /= n_substeps
         self.calculate_m_l(self.ml_old, water_mass, multiplicity, cell_id)
 
@@ -514,7 +525,10 @@ class CondensationMethods(
         multiplier,
         RH_rtol,
         max_iters,
+        substep_control="step_doubling",
     ):
+        if substep_control != "step_doubling":
+            raise NotImplementedError()
         self.adaptive = adaptive
         self.RH_rtol = RH_rtol
         self.max_iters = max_iters
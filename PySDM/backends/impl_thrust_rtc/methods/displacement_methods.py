@@ -91,6 +91,51 @@ class DisplacementMethods(ThrustRTCBackendMethods):
             ),
         )
 
+    @cached_property
+    def __update_cell_origin_and_id_body(self):
+        return trtc.For(
+            param_names=(
+                "cell_id",
+                "cell_origin",
+                "position_in_cell",
+                "grid",
+                "strides",
+                "n_dims",
+                "n_sd",
+            ),
+            name_iter="i",
+            body="""
+            cell_id[i] = 0;
+            for (auto dim = 0; dim < n_dims; dim += 1) {
+                auto k = n_sd * dim + i;
+                auto floor_of_position = (int64_t)(floor(position_in_cell[k]));
+                position_in_cell[k] -= floor_of_position;
+                auto origin = (cell_origin[k] + floor_of_position) % grid[dim];
+                cell_origin[k] = (origin + grid[dim]) % grid[dim];
+                cell_id[i] += cell_origin[k] * strides[dim];
+            }
+            """,
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def update_cell_origin_and_id(
+        self, *, cell_id, cell_origin, position_in_cell, grid, strides
+    ):
+        if len(cell_id) == 0:
+            return
+        self.__update_cell_origin_and_id_body.launch_n(
+            n=len(cell_id),
+            args=(
+                cell_id.data,
+                cell_origin.data,
+                position_in_cell.data,
+                grid.data,
+                strides.data,
+                trtc.DVInt64(cell_origin.shape[0]),
+                trtc.DVInt64(cell_origin.shape[1]),
+            ),
+        )
+
     @nice_thrust(**NICE_THRUST_FLAGS)
     def calculate_displacement(
         self, *, dim, displacement, courant, cell_origin, position_in_cell, n_substeps
@@ -36,6 +36,11 @@ class IndexMethods(ThrustRTCBackendMethods):
 
         trtc.Sort_By_Key(u01.range(0, length), idx.range(0, length))
 
+    @staticmethod
+    def shuffle_global_parallel(idx, length, u01):
+        # note: the random-key sort used in `shuffle_global` is a parallel one
+        IndexMethods.shuffle_global(idx, length, u01)
+
     @cached_property
     def __shuffle_local_body(self):
         return trtc.For(
@@ -63,3 +68,52 @@ class IndexMethods(ThrustRTCBackendMethods):
     def sort_by_key(idx, attr):
         d_attr_data_copy, _, _ = attr._get_empty_data(attr.shape, attr.dtype)
         trtc.Sort_By_Key(d_attr_data_copy, idx.data)
+
+    @cached_property
+    def __reorder_by_index_body(self):
+        return trtc.For(
+            param_names=("data", "data_copy", "idx", "length", "n_sd"),
+            name_iter="i",
+            body="""
+            auto row = (int64_t)(i / length);
+            auto j = i - row * length;
+            data[row * n_sd + j] = data_copy[row * n_sd + idx[j]];
+            """,
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def reorder_by_index(self, idx, storages):
+        length = int(idx.length)
+        if length == 0:
+            return
+        for storage in storages:
+            data_copy, _, _ = storage._get_empty_data(storage.shape, storage.dtype)
+            trtc.Copy(storage.data, data_copy)
+            n_sd = storage.shape[-1]
+            self.__reorder_by_index_body.launch_n(
+                storage.data.size() // n_sd * length,
+                (
+                    storage.data,
+                    data_copy,
+                    idx.data,
+                    trtc.DVInt64(length),
+                    trtc.DVInt64(n_sd),
+                ),
+            )
+        self.__identity_index_body.launch_n(length, (idx.data,))
+
+    @cached_property
+    def __index_locality_body(self):
+        return trtc.For(
+            param_names=("is_contiguous", "idx"),
+            name_iter="i",
+            body="is_contiguous[i] = idx[i + 1] == idx[i] + 1;",
+        )
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def index_locality(self, idx, length):
+        if length < 2:
+            return 0.0
+        is_contiguous = trtc.device_vector("int64_t", length - 1)
+        self.__index_locality_body.launch_n(length - 1, (is_contiguous, idx))
+        return trtc.Reduce(is_contiguous, trtc.DVInt64(0), trtc.Plus()) / (length - 1)
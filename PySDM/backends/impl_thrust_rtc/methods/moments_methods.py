@@ -114,22 +114,45 @@ class MomentsMethods(ThrustRTCBackendMethods):
                 "rank",
                 "n_sd",
                 "n_cell",
+                "bisection",
             ),
             "fake_i",
             self.commons
             + """
             auto i = idx[fake_i];
-            for (auto k = 0; k < n_bins; k+=1) {
-                if (x_bins[k] <= x_attr[i] and x_attr[i] < x_bins[k + 1]) {
-                    atomicAdd(
-                        (real_type*)&moment_0[n_cell * k + cell_id[i]],
-                        (real_type)(multiplicity[i])
-                    );
-                    auto val = multiplicity[i] * pow((real_type)(attr_data[i]), (real_type)(rank));
-                    atomicAdd((real_type*) &moments[n_cell * k + cell_id[i]], val);
-                    break;
+            auto bin = -1;
+            if (bisection) {
+                if (x_bins[0] <= x_attr[i] and x_attr[i] < x_bins[n_bins]) {
+                    auto lo = 0;
+                    auto hi = n_bins;
+                    while (hi - lo > 1) {
+                        auto mid = (lo + hi) >> 1;
+                        if (x_bins[mid] <= x_attr[i]) {
+                            lo = mid;
+                        }
+                        else {
+                            hi = mid;
+                        }
+                    }
+                    bin = lo;
                 }
             }
+            else {
+                for (auto k = 0; k < n_bins; k+=1) {
+                    if (x_bins[k] <= x_attr[i] and x_attr[i] < x_bins[k + 1]) {
+                        bin = k;
+                        break;
+                    }
+                }
+            }
+            if (bin != -1) {
+                atomicAdd(
+                    (real_type*)&moment_0[n_cell * bin + cell_id[i]],
+                    (real_type)(multiplicity[i])
+                );
+                auto val = multiplicity[i] * pow((real_type)(attr_data[i]), (real_type)(rank));
+                atomicAdd((real_type*) &moments[n_cell * bin + cell_id[i]], val);
+            }
         """.replace(
                 "real_type", self._get_c_type()
             ),
@@ -216,6 +239,68 @@ class MomentsMethods(ThrustRTCBackendMethods):
                 moment_0.shape[0], (n_ranks, moments.data, moment_0.data, n_cell)
             )
 
+    # pylint: disable=too-many-locals
+    def batched_moments(
+        self,
+        *,
+        moment_0,
+        moments,
+        multiplicity,
+        attributes,
+        cell_id,
+        idx,
+        length,
+        filter_attr,
+        min_x,
+        max_x,
+        weighting_attr,
+        weighting_rank,
+        group_start,
+        moment_attr,
+        moment_rank,
+    ):
+        """see `PySDM.backends.impl_numba.methods.moments_methods.MomentsMethods.batched_moments`;
+        here implemented with one `moments()` call per group and moment attribute"""
+        filter_attr = filter_attr.to_ndarray().tolist()
+        weighting_attr = weighting_attr.to_ndarray().tolist()
+        group_start = group_start.to_ndarray().tolist()
+        moment_attr = moment_attr.to_ndarray().tolist()
+        moment_rank = moment_rank.to_ndarray()
+        min_x, max_x = min_x.to_ndarray().tolist(), max_x.to_ndarray().tolist()
+        weighting_rank = weighting_rank.to_ndarray().tolist()
+        tmp_moment_0 = self.Storage.empty(moment_0.shape[1], dtype=float)
+        for group in range(moment_0.shape[0]):
+            start = group_start[group]
+            while start < group_start[group + 1]:
+                stop = start + 1
+                while (
+                    stop < group_start[group + 1]
+                    and moment_attr[stop] == moment_attr[start]
+                ):
+                    stop += 1
+                tmp_moments = self.Storage.empty(
+                    (stop - start, moments.shape[1]), dtype=float
+                )
+                self.moments(
+                    moment_0=tmp_moment_0,
+                    moments=tmp_moments,
+                    multiplicity=multiplicity,
+                    attr_data=attributes[moment_attr[start]],
+                    cell_id=cell_id,
+                    idx=idx,
+                    length=length,
+                    ranks=self.Storage.from_ndarray(moment_rank[start:stop]),
+                    min_x=min_x[group],
+                    max_x=max_x[group],
+                    x_attr=attributes[filter_attr[group]],
+                    weighting_attribute=attributes[weighting_attr[group]],
+                    weighting_rank=weighting_rank[group],
+                    skip_division_by_m0=True,
+                )
+                moment_0[group, :].fill(tmp_moment_0)
+                moments[start:stop].fill(tmp_moments)
+                start = stop
+
     # TODO #684
     # pylint: disable=unused-argument,too-many-locals
     @nice_thrust(**NICE_THRUST_FLAGS)
@@ -228,12 +313,14 @@ class MomentsMethods(ThrustRTCBackendMethods):
         attr_data,
         cell_id,
         idx,
+        cell_start,
         length,
         rank,
         x_bins,
         x_attr,
         weighting_attribute,
         weighting_rank,
+        x_bins_spacing=None,
     ):
         assert moments.shape[0] == x_bins.shape[0] - 1
         assert moment_0.shape == moments.shape
@@ -266,6 +353,7 @@ class MomentsMethods(ThrustRTCBackendMethods):
                 d_rank,
                 n_sd,
                 n_cell,
+                trtc.DVBool(x_bins_spacing is not None),
             ),
         )
 
@@ -72,10 +72,14 @@ class TerminalVelocityMethods(ThrustRTCBackendMethods):
     def __interpolation_body(self):
         # TODO #599 r<0
         return trtc.For(
-            ("output", "radius", "factor", "a", "b"),
+            ("output", "radius", "factor", "a", "b", "n_table", "out_of_range"),
             "i",
             """
             auto r_id = (int64_t)(factor * radius[i]);
+            if (r_id >= n_table) {
+                out_of_range[0] = 1;
+                return;
+            }
             auto r_rest = (factor * radius[i] - r_id) / factor;
             output[i] = a[r_id] + r_rest * b[r_id];
             """,
@@ -128,9 +132,22 @@ class TerminalVelocityMethods(ThrustRTCBackendMethods):
     @nice_thrust(**NICE_THRUST_FLAGS)
     def interpolation(self, *, output, radius, factor, b, c):
         factor_device = trtc.DVInt64(factor)
+        n_table = trtc.DVInt64(len(b))
+        out_of_range = trtc.device_vector("int64_t", 1)
+        trtc.Fill(out_of_range, trtc.DVInt64(0))
         self.__interpolation_body.launch_n(
-            len(radius), (output.data, radius.data, factor_device, b.data, c.data)
+            len(radius),
+            (
+                output.data,
+                radius.data,
+                factor_device,
+                b.data,
+                c.data,
+                n_table,
+                out_of_range,
+            ),
         )
+        return out_of_range.to_host()[0]
 
     @cached_property
     def __power_series_body(self):
@@ -16,6 +16,7 @@ from PySDM.backends.impl_numba.methods.terminal_velocity_methods import (
     TerminalVelocityMethods,
 )
 from PySDM.backends.impl_numba.random import Random as ImportedRandom
+from PySDM.backends.impl_numba.storage import SinglePrecisionStorage
 from PySDM.backends.impl_numba.storage import Storage as ImportedStorage
 from PySDM.formulae import Formulae
 
@@ -40,7 +41,7 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
 
     def __init__(self, formulae=None, double_precision=True):
         if not double_precision:
-            raise NotImplementedError()
+            self.Storage = SinglePrecisionStorage
         self.formulae = formulae or Formulae()
         CollisionsMethods.__init__(self)
         PairMethods.__init__(self)
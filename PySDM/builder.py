@@ -11,6 +11,7 @@ from PySDM.attributes.impl.mapper import get_class as attr_class
 from PySDM.attributes.numerics.cell_id import CellID
 from PySDM.attributes.physics import WaterMass
 from PySDM.attributes.physics.multiplicities import Multiplicities
+from PySDM.impl.fused_derived_attributes import FusedDerivedAttributes
 from PySDM.impl.particle_attributes_factory import ParticleAttributesFactory
 from PySDM.impl.wall_timer import WallTimer
 from PySDM.initialisation.discretise_multiplicities import (  # TODO #324
@@ -37,6 +38,8 @@ class Builder:
             "water mass": WaterMass(self),
             "cell id": CellID(self),
         }
+        self.attribute_requesters = {}
+        self.__requesting = []
         self.aerosol_radius_threshold = 0
         self.condensation_params = None
 
@@ -82,10 +85,17 @@ class Builder:
         return self.req_attr[attribute_name]
 
     def request_attribute(self, attribute, variant=None):
+        """`attribute_requesters` keeps track of which attributes requested
+        a given one (`None` standing for requests by dynamics, products or user)"""
+        self.attribute_requesters.setdefault(attribute, set()).add(
+            self.__requesting[-1] if self.__requesting else None
+        )
         if attribute not in self.req_attr:
+            self.__requesting.append(attribute)
             self.req_attr[attribute] = attr_class(
                 attribute, self.particulator.dynamics, self.formulae
             )(self)
+            self.__requesting.pop()
         if variant is not None:
             assert variant == self.req_attr[attribute]
 
@@ -135,8 +145,15 @@ class Builder:
                     **self.condensation_params,
                 )
             )
+        if self.particulator.derived_attributes_fusion is not None:
+            assert self.particulator.derived_attributes_fusion in ("fused", "virtual")
+            FusedDerivedAttributes(
+                self.req_attr,
+                requesters=self.attribute_requesters,
+                virtual=self.particulator.derived_attributes_fusion == "virtual",
+            )
         attributes["multiplicity"] = int_caster(attributes["multiplicity"])
-        if self.particulator.mesh.dimension == 0:
+        if self.particulator.mesh.dimension == 0 and "cell id" not in attributes:
             attributes["cell id"] = np.zeros_like(
                 attributes["multiplicity"], dtype=np.int64
             )
@@ -53,15 +53,22 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         self.dissociation_factors = {}
         self.do_chemistry_flag = None
         self.specific_gravities = None
+        self.counters = {}
+        self.cell_order = None
 
     def register(self, builder):
         self.particulator = builder.particulator
+        if np.ndim(self.particulator.mesh.dv) != 0:
+            raise NotImplementedError(
+                "aqueous chemistry in environments with per-cell volumes"
+                " (e.g., ParcelEnsemble) is not supported"
+            )
         self.specific_gravities = SpecificGravities(
             self.particulator.formulae.constants
         )
 
         for key, compound in GASEOUS_COMPOUNDS.items():
-            shape = (1,)
+            shape = (self.particulator.mesh.n_cell,)
             self.environment_mixing_ratios[compound] = np.full(
                 shape,
                 self.particulator.formulae.trivia.mole_fraction_2_mixing_ratio(
@@ -95,8 +102,24 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         self.do_chemistry_flag = self.particulator.Storage.empty(
             self.particulator.n_sd, dtype=bool
         )
+        self.counters["n_pH_iterations"] = self.particulator.Storage.empty(
+            self.particulator.mesh.n_cell, dtype=int
+        )
+        self.counters["n_pH_iterations"][:] = 0
+        self.cell_order = np.arange(self.particulator.mesh.n_cell)
+
+    def _update_cell_order(self):
+        """orders cells for dissolution by decreasing expected cost estimated as
+        the number of super-droplets in a cell plus the number of pH-equilibration
+        iterations taken there in the previous timestep (the latter reflecting how
+        many droplets are chemically active)"""
+        load = np.diff(self.particulator.attributes.cell_start.to_ndarray())
+        load += self.counters["n_pH_iterations"].to_ndarray()
+        self.cell_order = np.argsort(-load, kind="stable")
+        self.counters["n_pH_iterations"][:] = 0
 
     def __call__(self):
+        self._update_cell_order()
         self.particulator.chem_recalculate_cell_data(
             equilibrium_consts=self.equilibrium_consts,
             kinetic_consts=self.kinetic_consts,
@@ -113,6 +136,7 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
                 environment_mixing_ratios=self.environment_mixing_ratios,
                 timestep=self.particulator.dt / self.n_substep,
                 do_chemistry_flag=self.do_chemistry_flag,
+                cell_order=self.cell_order,
             )
             self.particulator.chem_recalculate_drop_data(
                 equilibrium_consts=self.equilibrium_consts,
@@ -51,8 +51,11 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         dt_coal_range=DEFAULTS.dt_coal_range,
         enable_breakup: bool = True,
         warn_overflows: bool = True,
+        fused: bool = False,
     ):
         assert substeps == 1 or adaptive is False
+        if fused and enable_breakup:
+            raise ValueError("the fused collision step does not support breakup")
 
         self.particulator = None
 
@@ -79,6 +82,8 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.stats_n_substep = None
         self.stats_dt_min = None
         self.dt_coal_range = tuple(dt_coal_range)
+        self.fused = fused
+        self.fused_spec = None
 
         self.kernel_temp = None
         self.n_fragment = None
@@ -96,7 +101,7 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.breakup_rate = None
         self.breakup_rate_deficit = None
 
-    def register(self, builder):
+    def register(self, builder):  # pylint: disable=too-many-statements
         self.particulator = builder.particulator
         rnd_args = {
             "optimized_random": self.optimized_random,
@@ -110,6 +115,11 @@ class Collision:  # pylint: disable=too-many-instance-attributes
 
         if self.particulator.n_sd < 2:
             raise ValueError("No one to collide with!")
+        if np.ndim(self.particulator.mesh.dv) != 0:
+            raise NotImplementedError(
+                "collisions in environments with per-cell volumes"
+                " (e.g., ParcelEnsemble) are not supported"
+            )
         if self.dt_coal_range[1] > self.particulator.dt:
             self.dt_coal_range = (self.dt_coal_range[0], self.particulator.dt)
         assert self.dt_coal_range[0] <= self.dt_coal_range[1]
@@ -136,8 +146,24 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.rnd_opt_coll.register(builder)
         self.collision_kernel.register(builder)
 
+        if self.fused:
+            if not hasattr(self.collision_kernel, "fused_spec"):
+                raise ValueError(
+                    f"{type(self.collision_kernel).__name__} kernel does not support"
+                    " the fused collision step"
+                )
+            kernel, params, attributes = self.collision_kernel.fused_spec()
+            for attribute in attributes:
+                builder.request_attribute(attribute)
+            self.fused_spec = {
+                "kernel": kernel,
+                "kernel_params": np.asarray(params, dtype=float),
+                "kernel_attributes": attributes,
+            }
+
         if self.croupier is None:
             self.croupier = self.particulator.backend.default_croupier
+        assert self.croupier in ("local", "global", "global_parallel")
 
         counter_args = (np.zeros(self.particulator.mesh.n_cell, dtype=int),)
         self.collision_rate = self.particulator.Storage.from_ndarray(*counter_args)
@@ -192,6 +218,10 @@ class Collision:  # pylint: disable=too-many-instance-attributes
                 self.rnd_opt_frag.reset()
 
     def step(self):
+        if self.fused:
+            self.fused_step()
+            return
+
         pairs_rand, rand = self.rnd_opt_coll.get_random_arrays()
 
         self.toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
@@ -231,10 +261,53 @@ class Collision:  # pylint: disable=too-many-instance-attributes
             max_multiplicity=self.max_multiplicity,
         )
 
+    def fused_step(self):
+        """same as `step()` (for coalescence only) but with the within-pair sort,
+        probability evaluation, gamma computation and coalescence done in a single
+        pass over candidate pairs (two passes with the adaptive timestepping
+        which needs a per-cell reduction of probabilities in-between)"""
+        pairs_rand, rand = self.rnd_opt_coll.get_random_arrays()
+        self.particulator.attributes.permutation(
+            pairs_rand,
+            local=self.croupier == "local",
+            parallel=self.croupier == "global_parallel",
+        )
+        self.is_first_in_pair.update(
+            self.particulator.attributes.cell_start,
+            self.particulator.attributes.cell_idx,
+            self.particulator.attributes["cell id"],
+        )
+
+        args = {
+            **self.fused_spec,
+            "rand": rand,
+            "prob": self.gamma,
+            "norm_factor": self.norm_factor_temp,
+            "n_substeps": 1.0 if self.adaptive else float(self.__substeps),
+            "collision_rate": self.collision_rate,
+            "collision_rate_deficit": self.collision_rate_deficit,
+            "coalescence_rate": self.coalescence_rate,
+            "is_first_in_pair": self.is_first_in_pair,
+        }
+        if self.adaptive:
+            self.particulator.fused_collision_coalescence(**args, coalescence=False)
+            self.scale_probabilities_for_adaptive_timestep(
+                prob=self.gamma, is_first_in_pair=self.is_first_in_pair
+            )
+            self.particulator.fused_collision_coalescence(
+                **args, compute_probabilities=False
+            )
+        else:
+            self.particulator.fused_collision_coalescence(**args)
+
     def toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
         self, is_first_in_pair, u01
     ):
-        self.particulator.attributes.permutation(u01, self.croupier == "local")
+        self.particulator.attributes.permutation(
+            u01,
+            local=self.croupier == "local",
+            parallel=self.croupier == "global_parallel",
+        )
         is_first_in_pair.update(
             self.particulator.attributes.cell_start,
             self.particulator.attributes.cell_idx,
@@ -260,19 +333,9 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         for droplets without a pair (i.e. odd number of particles within a grid cell)
         """
         if self.adaptive:
-            self.particulator.backend.scale_prob_for_adaptive_sdm_gamma(
-                prob=prob,
-                multiplicity=self.particulator.attributes["multiplicity"],
-                cell_id=self.particulator.attributes["cell id"],
-                dt_left=self.dt_left,
-                dt=self.particulator.dt,
-                dt_range=self.dt_coal_range,
-                is_first_in_pair=is_first_in_pair,
-                stats_n_substep=self.stats_n_substep,
-                stats_dt_min=self.stats_dt_min,
+            self.scale_probabilities_for_adaptive_timestep(
+                prob=prob, is_first_in_pair=is_first_in_pair
             )
-            if self.stats_dt_min.amin() == self.dt_coal_range[0]:
-                warnings.warn("adaptive time-step reached dt_min")
         else:
             prob /= self.__substeps
 
@@ -287,6 +350,21 @@ class Collision:  # pylint: disable=too-many-instance-attributes
             out=out,
         )
 
+    def scale_probabilities_for_adaptive_timestep(self, prob, is_first_in_pair):
+        self.particulator.backend.scale_prob_for_adaptive_sdm_gamma(
+            prob=prob,
+            multiplicity=self.particulator.attributes["multiplicity"],
+            cell_id=self.particulator.attributes["cell id"],
+            dt_left=self.dt_left,
+            dt=self.particulator.dt,
+            dt_range=self.dt_coal_range,
+            is_first_in_pair=is_first_in_pair,
+            stats_n_substep=self.stats_n_substep,
+            stats_dt_min=self.stats_dt_min,
+        )
+        if self.stats_dt_min.amin() == self.dt_coal_range[0]:
+            warnings.warn("adaptive time-step reached dt_min")
+
 
 class Coalescence(Collision):
     def __init__(
@@ -299,6 +377,7 @@ class Coalescence(Collision):
         substeps: int = DEFAULTS.substeps,
         adaptive: bool = DEFAULTS.adaptive,
         dt_coal_range=DEFAULTS.dt_coal_range,
+        fused: bool = False,
     ):
         breakup_efficiency = ConstEb(Eb=0)
         fragmentation_function = AlwaysN(n=1)
@@ -313,6 +392,7 @@ class Coalescence(Collision):
             adaptive=adaptive,
             dt_coal_range=dt_coal_range,
             enable_breakup=False,
+            fused=fused,
         )
 
 
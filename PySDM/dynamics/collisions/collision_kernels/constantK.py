@@ -11,5 +11,8 @@ class ConstantK:
     def __call__(self, output, is_first_in_pair):
         output.fill(self.a)
 
+    def fused_spec(self):
+        return "ConstantK", (self.a,), ("multiplicity", "multiplicity")
+
     def register(self, builder):
         self.particulator = builder.particulator
@@ -13,10 +13,21 @@ class Geometric(Gravitational):
         self.x = x
 
     def __call__(self, output, is_first_in_pair):
-        output.sum(self.particulator.attributes["radius"], is_first_in_pair)
-        output **= 2
-        output *= const.PI * self.collection_efficiency
-        self.pair_tmp.distance(
-            self.particulator.attributes["relative fall velocity"], is_first_in_pair
+        with self.particulator.Storage.deferred():
+            output.sum(self.particulator.attributes["radius"], is_first_in_pair)
+            output **= 2
+            output *= const.PI * self.collection_efficiency
+            self.pair_tmp.distance(
+                self.particulator.attributes["relative fall velocity"],
+                is_first_in_pair,
+            )
+            output *= self.pair_tmp
+
+    def fused_spec(self):
+        """kernel name, parameters and the two attributes (`x` & `y`)
+        used by the fused collision step (see `Collision(fused=True)`)"""
+        return (
+            "Geometric",
+            (const.PI * self.collection_efficiency,),
+            ("radius", "relative fall velocity"),
         )
-        output *= self.pair_tmp
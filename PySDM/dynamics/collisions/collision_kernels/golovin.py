@@ -15,6 +15,9 @@ class Golovin:
         output.sum(self.particulator.attributes["volume"], is_first_in_pair)
         output *= self.b
 
+    def fused_spec(self):
+        return "Golovin", (self.b,), ("volume", "volume")
+
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("volume")
@@ -18,13 +18,22 @@ class Parameterized(Gravitational):
             is_first_in_pair=is_first_in_pair,
             unit=const.si.um,
         )
-        output **= 2
-        output *= const.PI
-        self.pair_tmp.max(self.particulator.attributes["radius"], is_first_in_pair)
-        self.pair_tmp **= 2
-        output *= self.pair_tmp
+        with self.particulator.Storage.deferred():
+            output **= 2
+            output *= const.PI
+            self.pair_tmp.max(self.particulator.attributes["radius"], is_first_in_pair)
+            self.pair_tmp **= 2
+            output *= self.pair_tmp
 
-        self.pair_tmp.distance(
-            self.particulator.attributes["relative fall velocity"], is_first_in_pair
+            self.pair_tmp.distance(
+                self.particulator.attributes["relative fall velocity"],
+                is_first_in_pair,
+            )
+            output *= self.pair_tmp
+
+    def fused_spec(self):
+        return (
+            "Parameterized",
+            (const.PI, const.si.um, *self.params),
+            ("radius", "relative fall velocity"),
         )
-        output *= self.pair_tmp
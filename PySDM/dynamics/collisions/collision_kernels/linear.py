@@ -10,10 +10,13 @@ class Linear:
         self.particulator = None
 
     def __call__(self, output, is_first_in_pair):
-        output.sum_pair(self.particulator.attributes["volume"], is_first_in_pair)
+        output.sum(self.particulator.attributes["volume"], is_first_in_pair)
         output *= self.b
         output += self.a
 
+    def fused_spec(self):
+        return "Linear", (self.a, self.b), ("volume", "volume")
+
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("volume")
@@ -9,13 +9,18 @@ import numpy as np
 
 from ..physics import si
 
-DEFAULTS = namedtuple("_", ("rtol_x", "rtol_thd", "cond_range", "schedule"))(
+DEFAULTS = namedtuple(
+    "_", ("rtol_x", "rtol_thd", "cond_range", "schedule", "substep_control")
+)(
     rtol_x=1e-6,
     rtol_thd=1e-6,
     cond_range=(1e-4 * si.second, 1 * si.second),
     schedule="dynamic",
+    substep_control="step_doubling",
 )
 
+SUBSTEP_CONTROLS = ("step_doubling", "embedded")
+
 
 class Condensation:  # pylint: disable=too-many-instance-attributes
     def __init__(
@@ -29,11 +34,20 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         schedule: str = DEFAULTS.schedule,
         max_iters: int = 16,
         update_thd: bool = True,
+        parallel_droplets: bool = None,
+        substep_control: str = DEFAULTS.substep_control,
     ):
         if adaptive and substeps != 1:
             raise ValueError(
                 "if specifying substeps count manually, adaptivity must be disabled"
             )
+        if substep_control not in SUBSTEP_CONTROLS:
+            raise ValueError(
+                f"substep_control must be one of {SUBSTEP_CONTROLS}"
+                f" (got {substep_control})"
+            )
+        if substep_control == "embedded" and not adaptive:
+            raise ValueError("embedded substep control requires adaptivity")
 
         self.particulator = None
         self.enable = True
@@ -55,6 +69,13 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
 
         self.update_thd = update_thd
 
+        # None: parallelise over droplets within cells if n_cell < number of threads
+        self.parallel_droplets = parallel_droplets
+
+        # "step_doubling": substep count found with trial solves prior to the actual one
+        # "embedded": substeps accepted/rejected on the fly (see n_solves_saved counter)
+        self.substep_control = substep_control
+
     def register(self, builder):
         self.particulator = builder.particulator
 
@@ -65,6 +86,7 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
             multiplier=2,
             RH_rtol=1e-7,
             max_iters=self.max_iters,
+            substep_control=self.substep_control,
         )
         builder.request_attribute("critical volume")
         builder.request_attribute("kappa")
@@ -79,6 +101,14 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
                 self.counters[counter][:] = self.__substeps if not self.adaptive else -1
             else:
                 self.counters[counter][:] = -1
+        self.counters["n_solves_saved"] = self.particulator.Storage.empty(
+            self.particulator.mesh.n_cell, dtype=int
+        )
+        self.counters["n_solves_saved"][:] = 0
+        self.counters["thread_load"] = self.particulator.Storage.empty(
+            self.particulator.backend.n_threads, dtype=int
+        )
+        self.counters["thread_load"][:] = 0
 
         self.rh_max = self.particulator.Storage.empty(
             self.particulator.mesh.n_cell, dtype=float
@@ -94,6 +124,12 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         if self.enable:
             if self.schedule == "dynamic":
                 self.cell_order = np.argsort(self.counters["n_substeps"])
+            elif self.schedule == "work_stealing":
+                # largest expected workload first, threads take next cell when idle
+                load = np.maximum(
+                    self.counters["n_substeps"].to_ndarray(), 1
+                ) * np.diff(self.particulator.attributes.cell_start.to_ndarray())
+                self.cell_order = np.argsort(-load, kind="stable")
             elif self.schedule == "static":
                 pass
             else:
@@ -106,6 +142,8 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
                 RH_max=self.rh_max,
                 success=self.success,
                 cell_order=self.cell_order,
+                work_stealing=self.schedule == "work_stealing",
+                parallel_droplets=self.parallel_droplets,
             )
             if not self.success.all():
                 raise RuntimeError("Condensation failed")
@@ -5,13 +5,22 @@ adaptive time-stepping controlled by comparing implicit-Euler (I)
 and explicit-Euler (E) maximal displacements with:
 rtol > |(I - E) / E|
 (see eqs 13-16 in [Arabas et al. 2015](https://doi.org/10.5194/gmd-8-1677-2015))
+
+with `fused=True` (CPU backend only), each timestep is a single parallel pass over
+live particles covering, substep by substep, all dimensions, sedimentation, position
+update, precipitation/out-of-domain flagging and cell origin/id update; in this mode,
+with `local_substeps=True`, the number of substeps is chosen for each cell (from
+the Courant-number differences within the cell and its neighbours) instead of for
+the whole domain, and applies to the particles starting the timestep in the cell
 """
 
 from collections import namedtuple
 
 import numpy as np
 
-DEFAULTS = namedtuple("_", ("rtol", "adaptive"))(rtol=1e-2, adaptive=True)
+DEFAULTS = namedtuple("_", ("rtol", "adaptive", "local_substeps"))(
+    rtol=1e-2, adaptive=True, local_substeps=False
+)
 
 
 class Displacement:  # pylint: disable=too-many-instance-attributes
@@ -21,11 +30,16 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         precipitation_counting_level_index: int = 0,
         adaptive=DEFAULTS.adaptive,
         rtol=DEFAULTS.rtol,
+        fused: bool = False,
+        local_substeps: bool = DEFAULTS.local_substeps,
     ):  # pylint: disable=too-many-arguments
+        if local_substeps and not (adaptive and fused):
+            raise ValueError("local_substeps requires adaptive=True and fused=True")
         self.particulator = None
         self.enable_sedimentation = enable_sedimentation
         self.dimension = None
         self.grid = None
+        self.strides = None
         self.courant = None
         self.displacement = None
         self.temp = None
@@ -35,6 +49,13 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.adaptive = adaptive
         self.rtol = rtol
         self._n_substeps = 1
+        self.local_substeps = local_substeps
+        self.n_substeps_per_cell = None
+
+        self.fused = fused
+        self.courant_flat = None
+        self.courant_offsets = None
+        self.courant_strides = None
 
     def register(self, builder):
         builder.request_attribute("relative fall velocity")
@@ -43,6 +64,9 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.grid = self.particulator.Storage.from_ndarray(
             np.array(builder.particulator.environment.mesh.grid, dtype=np.int64)
         )
+        self.strides = self.particulator.Storage.from_ndarray(
+            builder.particulator.environment.mesh.strides
+        )
         if self.dimension == 1:
             courant_field = (np.full(self.grid[0] + 1, np.nan),)
         elif self.dimension == 2:
@@ -68,12 +92,51 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.temp = self.particulator.Storage.from_ndarray(
             np.zeros((self.dimension, self.particulator.n_sd), dtype=np.int64)
         )
+        self.n_substeps_per_cell = self.particulator.Storage.from_ndarray(
+            np.full(self.particulator.mesh.n_cell, self._n_substeps, dtype=np.int64)
+        )
+        if self.fused:
+            if not hasattr(self.particulator.backend, "displacement_step"):
+                raise NotImplementedError(
+                    f"{type(self.particulator.backend).__name__} backend does not"
+                    " support the fused displacement step"
+                )
+            sizes = [component.size for component in courant_field]
+            self.courant_flat = self.particulator.Storage.from_ndarray(
+                np.full(sum(sizes), np.nan)
+            )
+            self.courant_offsets = self.particulator.Storage.from_ndarray(
+                np.cumsum([0] + sizes[:-1]).astype(np.int64)
+            )
+            self.courant_strides = self.particulator.Storage.from_ndarray(
+                np.array(
+                    [
+                        np.array(component.strides) // component.itemsize
+                        for component in courant_field
+                    ],
+                    dtype=np.int64,
+                )
+            )
 
     def upload_courant_field(self, courant_field):
         for i, component in enumerate(courant_field):
             self.courant[i].upload(component)
+        if self.fused:
+            self.courant_flat.upload(
+                np.concatenate(
+                    [
+                        np.asarray(component, dtype=float).ravel()
+                        for component in courant_field
+                    ]
+                )
+            )
+
+        if self.local_substeps:
+            n_substeps = self.__n_substeps_per_cell(courant_field)
+            self._n_substeps = int(np.amax(n_substeps))
+            self.n_substeps_per_cell.upload(n_substeps.ravel())
+            return
 
-        # note: to be improved, should make n_substeps variable in space as in cond/coal
         if self.adaptive:
             error_estimate = self.rtol
             self._n_substeps = 0.5
@@ -93,6 +156,38 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
                             else 1 / (1 / max_abs_delta_courant - 1)
                         ),
                     )
+        self.n_substeps_per_cell[:] = self._n_substeps
+
+    def __n_substeps_per_cell(self, courant_field):
+        """the same criterion as for the global substep count, evaluated in each cell
+        with the maximal Courant-number difference across the cell and its neighbours
+        (which particles starting the timestep in the cell may reach, the domain
+        being treated as periodic)"""
+        max_abs_delta_courant = np.amax(
+            [
+                np.abs(np.diff(courant_component, axis=i))
+                for i, courant_component in enumerate(courant_field)
+            ],
+            axis=0,
+        )
+        for axis in range(self.dimension):
+            max_abs_delta_courant = np.maximum(
+                max_abs_delta_courant,
+                np.maximum(
+                    np.roll(max_abs_delta_courant, 1, axis=axis),
+                    np.roll(max_abs_delta_courant, -1, axis=axis),
+                ),
+            )
+
+        n_substeps = np.ones(max_abs_delta_courant.shape, dtype=np.int64)
+        while True:
+            delta = max_abs_delta_courant / n_substeps
+            with np.errstate(divide="ignore"):
+                error_estimate = np.where(delta == 0, 0, 1 / (1 / delta - 1))
+            too_large = error_estimate >= self.rtol
+            if not too_large.any():
+                return n_substeps
+            n_substeps[too_large] *= 2
 
     def __call__(self):
         # TIP: not need all array only [idx[:sd_num]]
@@ -100,24 +195,47 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         position_in_cell = self.particulator.attributes["position in cell"]
 
         self.precipitation_in_last_step = 0.0
-        for _ in range(self._n_substeps):
-            self.calculate_displacement(
-                self.displacement, self.courant, cell_origin, position_in_cell
-            )
-            self.update_position(position_in_cell, self.displacement)
-            if self.enable_sedimentation:
-                self.precipitation_in_last_step += self.particulator.remove_precipitated(
-                    displacement=self.displacement,
-                    precipitation_counting_level_index=self.precipitation_counting_level_index,
+        if self.fused:
+            self.precipitation_in_last_step += self.fused_step()
+        else:
+            for _ in range(self._n_substeps):
+                self.precipitation_in_last_step += self.substep(
+                    cell_origin, position_in_cell
                 )
-            self.particulator.flag_out_of_column()
-            self.update_cell_origin(cell_origin, position_in_cell)
-            self.boundary_condition(cell_origin)
-            self.particulator.recalculate_cell_id()
 
         for key in ("position in cell", "cell origin", "cell id"):
             self.particulator.attributes.mark_updated(key)
 
+    def substep(self, cell_origin, position_in_cell):
+        precipitation = 0.0
+        self.calculate_displacement(
+            self.displacement, self.courant, cell_origin, position_in_cell
+        )
+        self.update_position(position_in_cell, self.displacement)
+        if self.enable_sedimentation:
+            precipitation = self.particulator.remove_precipitated(
+                displacement=self.displacement,
+                precipitation_counting_level_index=self.precipitation_counting_level_index,
+            )
+        self.particulator.flag_out_of_column()
+        self.particulator.update_cell_origin_and_id(
+            grid=self.grid, strides=self.strides
+        )
+        return precipitation
+
+    def fused_step(self):
+        return self.particulator.displacement_step(
+            courant=self.courant_flat,
+            courant_offsets=self.courant_offsets,
+            courant_strides=self.courant_strides,
+            displacement=self.displacement,
+            grid=self.grid,
+            strides=self.strides,
+            n_substeps=self.n_substeps_per_cell,
+            enable_sedimentation=self.enable_sedimentation,
+            precipitation_counting_level_index=self.precipitation_counting_level_index,
+        )
+
     def calculate_displacement(
         self, displacement, courant, cell_origin, position_in_cell
     ):
@@ -132,9 +250,10 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
             displacement_z = displacement[self.dimension - 1, :]
             dt = self.particulator.dt / self._n_substeps
             dt_over_dz = dt / self.particulator.mesh.dz
-            displacement_z *= 1 / dt_over_dz
-            displacement_z -= self.particulator.attributes["relative fall velocity"]
-            displacement_z *= dt_over_dz
+            with self.particulator.Storage.deferred():
+                displacement_z *= 1 / dt_over_dz
+                displacement_z -= self.particulator.attributes["relative fall velocity"]
+                displacement_z *= dt_over_dz
 
     @staticmethod
     def update_position(position_in_cell, displacement):
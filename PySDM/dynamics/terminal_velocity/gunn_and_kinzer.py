@@ -4,6 +4,9 @@
  ventilation factor, etc
 """
 
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+
 import numba
 import numpy as np
 from scipy.interpolate import Rbf
@@ -11,128 +14,149 @@ from scipy.interpolate import Rbf
 from PySDM.backends.impl_numba import conf
 from PySDM.physics import constants as const
 
-
-class GunnKinzer1949:  # pylint: disable=too-few-public-methods
-    def __init__(self, particulator, small_r_limit=None):
-        self.particulator = particulator
-
-        """
-        Gunn & Kinzer 1949, Table 2
-        """
-        ir = (
-            np.array(
-                [
-                    0.078,
-                    0.1,
-                    0.2,
-                    0.3,
-                    0.4,
-                    0.5,
-                    0.6,
-                    0.7,
-                    0.8,
-                    0.9,
-                    1.0,
-                    1.2,
-                    1.4,
-                    1.6,
-                    1.8,
-                    2.0,
-                    2.2,
-                    2.4,
-                    2.6,
-                    2.8,
-                    3.0,
-                    3.2,
-                    3.4,
-                    3.6,
-                    3.8,
-                    4.0,
-                    4.2,
-                    4.4,
-                    4.6,
-                    4.8,
-                    5.0,
-                    5.2,
-                    5.4,
-                    5.6,
-                    5.8,
-                ]
-            )
-            * 1e-3
-            / 2
+FACTOR = 100000
+MAXIMUM_RADIUS = 0.6 * const.si.cm
+
+_TABLES = WeakKeyDictionary()
+""" device copies of the tables, per `Storage` class and `small_r_limit` """
+
+
+@lru_cache(maxsize=None)
+def _table(small_r_limit):
+    """
+    Gunn & Kinzer 1949, Table 2, interpolated with a radial basis function fit
+    onto an evenly-spaced radius grid and patched with the `TpDependent`
+    approximation below `small_r_limit`
+    """
+    ir = (
+        np.array(
+            [
+                0.078,
+                0.1,
+                0.2,
+                0.3,
+                0.4,
+                0.5,
+                0.6,
+                0.7,
+                0.8,
+                0.9,
+                1.0,
+                1.2,
+                1.4,
+                1.6,
+                1.8,
+                2.0,
+                2.2,
+                2.4,
+                2.6,
+                2.8,
+                3.0,
+                3.2,
+                3.4,
+                3.6,
+                3.8,
+                4.0,
+                4.2,
+                4.4,
+                4.6,
+                4.8,
+                5.0,
+                5.2,
+                5.4,
+                5.6,
+                5.8,
+            ]
         )
-        iu = (
-            np.array(
-                [
-                    18,
-                    27,
-                    72,
-                    117,
-                    162,
-                    206,
-                    247,
-                    287,
-                    327,
-                    367,
-                    403,
-                    464,
-                    517,
-                    565,
-                    609,
-                    649,
-                    690,
-                    727,
-                    757,
-                    782,
-                    806,
-                    826,
-                    844,
-                    860,
-                    872,
-                    883,
-                    892,
-                    898,
-                    903,
-                    907,
-                    909,
-                    912,
-                    914,
-                    916,
-                    917,
-                ]
-            )
-            / 100
+        * 1e-3
+        / 2
+    )
+    iu = (
+        np.array(
+            [
+                18,
+                27,
+                72,
+                117,
+                162,
+                206,
+                247,
+                287,
+                327,
+                367,
+                403,
+                464,
+                517,
+                565,
+                609,
+                649,
+                690,
+                727,
+                757,
+                782,
+                806,
+                826,
+                844,
+                860,
+                872,
+                883,
+                892,
+                898,
+                903,
+                907,
+                909,
+                912,
+                914,
+                916,
+                917,
+            ]
         )
+        / 100
+    )
+
+    rbf = Rbf(ir, iu)
+    num = 6 * FACTOR // 1000 + 1
+
+    space, step = np.linspace(0, MAXIMUM_RADIUS, num, retstep=True)
+    u = np.empty(num)
+    u[:] = rbf(space)
+    u[0] = 0
+    approximation_small = TpDependent.make(only_small=True)
+    approximation_small(u[1:], space[1:], small_r_limit)
+    b = np.append(np.diff(u), [u[-1] - u[-2]]) / step
+    u.setflags(write=False)
+    b.setflags(write=False)
+    return u, b
 
-        rbf = Rbf(ir, iu)
-        self.factor = 100000
-        num = 6 * self.factor // 1000 + 1
 
+class GunnKinzer1949:  # pylint: disable=too-few-public-methods
+    def __init__(self, particulator, small_r_limit=None):
+        self.particulator = particulator
+        self.factor = FACTOR
         self.minimum_radius = 0
-        self.maximum_radius = 0.6 * const.si.cm
-        space, step = np.linspace(
-            self.minimum_radius, self.maximum_radius, num, retstep=True
-        )
-        u = np.empty(num)
-        u[:] = rbf(space)
-        u[0] = 0
-        approximation_small = TpDependent.make(only_small=True)
+        self.maximum_radius = MAXIMUM_RADIUS
+
         small_r_limit = small_r_limit or 40 * const.si.um
-        approximation_small(u[1:], space[1:], small_r_limit)
-        self.a = particulator.backend.Storage.from_ndarray(u)
-        b = np.append(np.diff(u), [u[-1] - u[-2]]) / step
-        self.b = particulator.backend.Storage.from_ndarray(b)
+        tables = _TABLES.setdefault(particulator.backend.Storage, {})
+        if small_r_limit not in tables:
+            tables[small_r_limit] = tuple(
+                particulator.backend.Storage.from_ndarray(array)
+                for array in _table(small_r_limit)
+            )
+        self.a, self.b = tables[small_r_limit]
 
-    def __call__(self, output, radius):
-        r_max = radius.amax()
-        if r_max > self.maximum_radius:
+    def check_radius_range(self, out_of_range):
+        if out_of_range:
             raise ValueError(
                 f"Radii can be interpolated up to {self.maximum_radius} m"
-                + f" (max value of {r_max} m within input data)"
+                + " (larger values found within input data)"
+            )
+
+    def __call__(self, output, radius):
+        self.check_radius_range(
+            self.particulator.backend.interpolation(
+                output=output, radius=radius, factor=self.factor, b=self.a, c=self.b
             )
-        self.particulator.backend.interpolation(
-            output=output, radius=radius, factor=self.factor, b=self.a, c=self.b
         )
 
 
@@ -4,7 +4,25 @@ Classes representing particle environment:
 `PySDM.environments.parcel.Parcel`, ...
 """
 
-from .box import Box
-from .kinematic_1d import Kinematic1D
-from .kinematic_2d import Kinematic2D
-from .parcel import Parcel
+from typing import TYPE_CHECKING
+
+from PySDM.impl.lazy_imports import lazy_module
+
+if TYPE_CHECKING:  # names resolved lazily at runtime, listed here for static analysis
+    from .box import Box
+    from .kinematic_1d import Kinematic1D
+    from .kinematic_2d import Kinematic2D
+    from .parcel import Parcel
+    from .parcel_ensemble import ParcelEnsemble
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    exports={
+        "Box": "box",
+        "Kinematic1D": "kinematic_1d",
+        "Kinematic2D": "kinematic_2d",
+        "Parcel": "parcel",
+        "ParcelEnsemble": "parcel_ensemble",
+    },
+    subpackages=("impl",),
+)
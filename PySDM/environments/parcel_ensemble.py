@@ -0,0 +1,206 @@
+"""
+Ensemble of independent zero-dimensional adiabatic parcels, each mapped onto
+ a separate cell of a single particulator (with no inter-cell coupling)
+"""
+
+import numpy as np
+
+from PySDM.environments.impl.moist import Moist
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.equilibrate_wet_radii import (
+    default_rtol,
+    equilibrate_wet_radii,
+)
+
+
+class ParcelEnsemble(Moist):  # pylint: disable=too-many-instance-attributes
+    """
+    counterpart of `PySDM.environments.parcel.Parcel` in which `mass_of_dry_air`, `p0`,
+    `initial_water_vapour_mixing_ratio`, `T0` and `z0` can be given either as scalars
+    or as per-member arrays (of length `n_members`), and `w` either as a scalar,
+    a function of time returning a scalar or a per-member array, or a sequence
+    of per-member scalars and/or functions of time; the volume of each parcel
+    is exposed as a per-cell array through `mesh.dv` (hence collisions and aqueous
+    chemistry, which assume a common volume of all cells, are not supported)
+    """
+
+    def __init__(
+        self,
+        *,
+        dt,
+        n_members: int,
+        mass_of_dry_air: [float, np.ndarray],
+        p0: [float, np.ndarray],
+        initial_water_vapour_mixing_ratio: [float, np.ndarray],
+        T0: [float, np.ndarray],
+        w: [float, callable, tuple],
+        z0: [float, np.ndarray] = 0,
+        mixed_phase=False,
+    ):
+        super().__init__(
+            dt,
+            Mesh(
+                grid=(n_members,),
+                size=tuple(),
+                n_cell=n_members,
+                dv=np.nan,
+                n_dims=0,
+                strides=(-1,),
+            ),
+            ["rhod", "z", "t"],
+            mixed_phase=mixed_phase,
+        )
+
+        def per_member(value):
+            return np.broadcast_to(np.asarray(value, dtype=float), (n_members,))
+
+        self.n_members = n_members
+        self.p0 = per_member(p0)
+        self.initial_water_vapour_mixing_ratio = per_member(
+            initial_water_vapour_mixing_ratio
+        )
+        self.T0 = per_member(T0)
+        self.z0 = per_member(z0)
+        self.mass_of_dry_air = per_member(mass_of_dry_air)
+
+        if callable(w):
+            self.w = lambda t: per_member(w(t))
+        elif np.ndim(w) == 0:
+            self.w = lambda _: per_member(w)
+        else:
+            if len(w) != n_members:
+                raise ValueError("w sequence length differs from n_members")
+            self.w = lambda t: np.asarray(
+                [w_k(t) if callable(w_k) else w_k for w_k in w], dtype=float
+            )
+
+        self.formulae = None
+        self.delta_liquid_water_mixing_ratio = None
+
+    @property
+    def dv(self):
+        rhod_mean = (
+            self.get_predicted("rhod").to_ndarray() + self["rhod"].to_ndarray()
+        ) / 2
+        return self.formulae.trivia.volume_of_density_mass(
+            rhod_mean, self.mass_of_dry_air
+        )
+
+    def register(self, builder):
+        self.formulae = builder.particulator.formulae
+        pd0 = self.formulae.trivia.p_d(self.p0, self.initial_water_vapour_mixing_ratio)
+        rhod0 = self.formulae.state_variable_triplet.rhod_of_pd_T(pd0, self.T0)
+        self.mesh.dv = self.formulae.trivia.volume_of_density_mass(
+            rhod0, self.mass_of_dry_air
+        )
+
+        Moist.register(self, builder)
+
+        self["water_vapour_mixing_ratio"].upload(self.initial_water_vapour_mixing_ratio)
+        self["thd"].upload(self.formulae.trivia.th_std(pd0, self.T0))
+        self["rhod"].upload(rhod0)
+        self["z"].upload(self.z0)
+        self["t"][:] = 0
+
+        self._tmp["water_vapour_mixing_ratio"].upload(
+            self.initial_water_vapour_mixing_ratio
+        )
+        self.sync_parcel_vars()
+        Moist.sync(self)
+        self.notify()
+
+    def init_attributes(
+        self,
+        *,
+        n_in_dv: [float, np.ndarray],
+        kappa: [float, np.ndarray],
+        r_dry: [float, np.ndarray],
+        rtol=default_rtol,
+        include_dry_volume_in_attribute: bool = True,
+    ):
+        """`n_in_dv` and `r_dry` can be given as `(n_sd_per_member,)`-shaped arrays
+        (same for all members) or as `(n_members, n_sd_per_member)`-shaped arrays,
+        `kappa` as a scalar or as a per-member array; the super-droplets
+        are ordered by member and assigned to the corresponding cells"""
+        r_dry, n_in_dv = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(r_dry, dtype=float)),
+            np.atleast_1d(n_in_dv),
+        )
+        shape = (self.n_members, r_dry.shape[-1])
+        r_dry = np.broadcast_to(r_dry, shape).ravel()
+        n_in_dv = np.broadcast_to(n_in_dv, shape).ravel()
+        cell_id = np.repeat(np.arange(self.n_members, dtype=np.int64), shape[1])
+        kappa = np.broadcast_to(np.asarray(kappa, dtype=float), (self.n_members,))
+
+        attributes = {}
+        dry_volume = self.formulae.trivia.volume(radius=r_dry)
+        attributes["kappa times dry volume"] = dry_volume * kappa[cell_id]
+        attributes["multiplicity"] = n_in_dv
+        attributes["cell id"] = cell_id
+        r_wet = equilibrate_wet_radii(
+            r_dry=r_dry,
+            environment=self,
+            kappa_times_dry_volume=attributes["kappa times dry volume"],
+            cell_id=cell_id,
+            rtol=rtol,
+        )
+        attributes["volume"] = self.formulae.trivia.volume(radius=r_wet)
+        if include_dry_volume_in_attribute:
+            attributes["dry volume"] = dry_volume
+        return attributes
+
+    def advance_parcel_vars(self):
+        """vectorised (over members) equivalent of
+        `PySDM.environments.parcel.Parcel.advance_parcel_vars`"""
+        dt = self.particulator.dt
+        T = self["T"].to_ndarray()
+        p = self["p"].to_ndarray()
+        t = self["t"].to_ndarray()
+        z = self["z"].to_ndarray()
+        rhod = self["rhod"].to_ndarray()
+
+        dz_dt = self.w(t[0] + dt / 2)  # "mid-point"
+        water_vapour_mixing_ratio = (
+            self["water_vapour_mixing_ratio"].to_ndarray()
+            - self.delta_liquid_water_mixing_ratio / 2
+        )
+
+        drho_dz = self.formulae.hydrostatics.drho_dz(
+            g=self.formulae.constants.g_std,
+            p=p,
+            T=T,
+            water_vapour_mixing_ratio=water_vapour_mixing_ratio,
+            lv=self.formulae.latent_heat.lv(T),
+            d_liquid_water_mixing_ratio__dz=(
+                self.delta_liquid_water_mixing_ratio / dz_dt / dt
+            ),
+        )
+        drhod_dz = drho_dz
+
+        predicted_rhod = rhod + dt * dz_dt * drhod_dz
+        self._tmp["t"].upload(t + dt)
+        self._tmp["z"].upload(z + dt * dz_dt)
+        self._tmp["rhod"].upload(predicted_rhod)
+
+        self.mesh.dv = self.formulae.trivia.volume_of_density_mass(
+            (predicted_rhod + rhod) / 2, self.mass_of_dry_air
+        )
+
+    def get_thd(self):
+        return self["thd"]
+
+    def get_water_vapour_mixing_ratio(self):
+        return self["water_vapour_mixing_ratio"]
+
+    def sync_parcel_vars(self):
+        self.delta_liquid_water_mixing_ratio = (
+            self._tmp["water_vapour_mixing_ratio"].to_ndarray()
+            - self["water_vapour_mixing_ratio"].to_ndarray()
+        )
+        for var in self.variables:
+            self._tmp[var][:] = self[var][:]
+
+    def sync(self):
+        self.sync_parcel_vars()
+        self.advance_parcel_vars()
+        super().sync()
@@ -1,8 +1,30 @@
 """
-Exporters handling output to metadata-rich file formats incl. netCDF and VTK
+Exporters handling output to metadata-rich file formats incl. netCDF and VTK,
+ and to chunked compressed particle snapshots
 """
 
-from .netcdf_exporter import NetCDFExporter
-from .netcdf_exporter_1d import NetCDFExporter_1d, readNetCDF_1d
-from .vtk_exporter import VTKExporter
-from .vtk_exporter_1d import VTKExporter_1d
+from typing import TYPE_CHECKING
+
+from PySDM.impl.lazy_imports import lazy_module
+
+if TYPE_CHECKING:  # names resolved lazily at runtime, listed here for static analysis
+    from .netcdf_exporter import NetCDFExporter
+    from .netcdf_exporter_1d import NetCDFExporter_1d, readNetCDF_1d
+    from .product_store import ProductStore
+    from .snapshot_exporter import SnapshotExporter, read_snapshot
+    from .vtk_exporter import VTKExporter
+    from .vtk_exporter_1d import VTKExporter_1d
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    exports={
+        "NetCDFExporter": "netcdf_exporter",
+        "NetCDFExporter_1d": "netcdf_exporter_1d",
+        "readNetCDF_1d": "netcdf_exporter_1d",
+        "ProductStore": "product_store",
+        "SnapshotExporter": "snapshot_exporter",
+        "read_snapshot": "snapshot_exporter",
+        "VTKExporter": "vtk_exporter",
+        "VTKExporter_1d": "vtk_exporter_1d",
+    },
+)
@@ -11,6 +11,10 @@ DIM_SUFFIX = "_bin_left_edges"
 
 
 class NetCDFExporter:  # pylint: disable=too-few-public-methods
+    """writes the products kept in `storage` (an object with `load(name, step=None)`
+    method, e.g. `PySDM.exporters.product_store.ProductStore` from which the values
+    are streamed without re-reading any files) to a netCDF file"""
+
     def __init__(self, storage, settings, simulator, filename):
         self.storage = storage
         self.settings = settings
@@ -0,0 +1,107 @@
+"""
+append-only store of product values backed by memory-mapped `.npy` files,
+ usable as the `storage` of `PySDM.exporters.netcdf_exporter.NetCDFExporter`
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+
+class ProductStore:
+    """
+    Example of use:
+
+    store = ProductStore(path=".", n_output_steps=len(settings.output_steps))
+    for step in settings.output_steps:
+        simulation.particulator.run(step - simulation.particulator.n_steps)
+        for name, product in simulation.particulator.products.items():
+            store.save(product.get(), step, name)
+
+    for each product, an array of shape `(n_output_steps, *product_shape)` (with
+    single-element values stored as scalars) is allocated upon first `save()`
+    and filled with NaNs; the steps are assigned consecutive rows in the order
+    in which they are first saved; `data_range(name)` returns the running minimum
+    and maximum of a product; `load()` and `data_range()` raise
+    `ProductStore.Exception` for products or steps not saved; with `path=None`
+    the files are kept in a temporary directory removed together with the store
+    """
+
+    class Exception(LookupError):  # pylint: disable=redefined-builtin
+        pass
+
+    def __init__(self, *, path=None, n_output_steps=None, dtype=np.float32):
+        if path is None:
+            self.__tempdir = (
+                tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+            )
+            path = self.__tempdir.name
+        else:
+            os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.dtype = dtype
+        self.n_output_steps = n_output_steps
+        self.__data_range = {}
+        self.__arrays = {}
+        self.__rows = {}
+
+    def init(self, settings):
+        """resets the store and sizes it for `settings.output_steps`"""
+        self.n_output_steps = len(settings.output_steps)
+        self.__data_range = {}
+        self.__arrays = {}
+        self.__rows = {}
+
+    def __contains__(self, name):
+        return name in self.__arrays
+
+    def keys(self):
+        return self.__arrays.keys()
+
+    def save(self, data: np.ndarray, step: int, name: str):
+        data = np.asarray(data)
+        if data.size == 1:
+            data = data.reshape(())
+        if name not in self.__arrays:
+            self.__arrays[name] = np.lib.format.open_memmap(
+                os.path.join(self.path, f"{name}.npy"),
+                mode="w+",
+                dtype=self.dtype,
+                shape=(self.n_output_steps, *data.shape),
+            )
+            self.__arrays[name][:] = np.nan
+        if step not in self.__rows:
+            if len(self.__rows) == self.n_output_steps:
+                raise ValueError(
+                    f"all {self.n_output_steps} output steps are already in use"
+                )
+            self.__rows[step] = len(self.__rows)
+        self.__arrays[name][self.__rows[step]] = data
+
+        if data.size != 0 and not np.isnan(data).all():
+            data_min, data_max = np.nanmin(data), np.nanmax(data)
+            if name in self.__data_range:
+                data_min = min(data_min, self.__data_range[name][0])
+                data_max = max(data_max, self.__data_range[name][1])
+            self.__data_range[name] = (data_min, data_max)
+
+    def data_range(self, name: str) -> tuple:
+        try:
+            return self.__data_range[name]
+        except KeyError as err:
+            raise ProductStore.Exception() from err
+
+    def load(self, name: str, step: int = None) -> np.ndarray:
+        """returns a (memory-mapped) view of the values saved for a given step
+        or, if `step` is `None`, of the whole series"""
+        try:
+            if step is None:
+                return self.__arrays[name]
+            return self.__arrays[name][self.__rows[step]]
+        except KeyError as err:
+            raise ProductStore.Exception() from err
+
+    def flush(self):
+        for array in self.__arrays.values():
+            array.flush()
@@ -0,0 +1,165 @@
+"""
+particle-attribute snapshots written in a background thread to a chunked,
+ compressed columnar layout (one directory per snapshot with a `meta.json` file
+ and, for each attribute, a sequence of `.npz` chunks along the particle axis)
+ allowing subsequent partial reads with `read_snapshot()`, e.g. for offline
+ conversion to VTK
+"""
+
+import json
+import os
+import queue
+import threading
+
+import numpy as np
+
+META_FILENAME = "meta.json"
+
+
+class SnapshotExporter:  # pylint: disable=too-many-instance-attributes
+    """
+    Example of use:
+
+    with SnapshotExporter(path=".", attributes=("multiplicity", "water mass")) as exporter:
+        for step in range(settings.n_steps):
+            simulation.particulator.run(1)
+            exporter.export_attributes(simulation.particulator)
+
+    only the valid (not removed) super-droplets are exported, in the order
+    of the particle index; the simulation thread copies the data to host memory
+    and hands it over to the writer thread through a queue of at most
+    `max_queue_size` snapshots (`export_attributes()` blocks if it is full)
+    """
+
+    def __init__(
+        self,
+        *,
+        path=".",
+        attributes=None,
+        snapshot_filename="sd_snapshot",
+        chunk_size=2**20,
+        compress=True,
+        max_queue_size=2,
+        file_num_len=10,
+        verbose=False,
+    ):
+        self.path = os.path.join(path, "output")
+        os.makedirs(self.path, exist_ok=True)
+
+        self.attributes = None if attributes is None else tuple(attributes)
+        self.snapshot_file_path = os.path.join(self.path, snapshot_filename)
+        self.chunk_size = chunk_size
+        self.compress = compress
+        self.num_len = file_num_len
+        self.verbose = verbose
+        self.exported_times = {}
+
+        self.__queue = queue.Queue(maxsize=max_queue_size)
+        self.__error = None
+        self.__writer = threading.Thread(target=self.__write_loop, daemon=True)
+        self.__writer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def export_attributes(self, particulator):
+        self.__raise_writer_error()
+        path = (
+            self.snapshot_file_path
+            + "_num"
+            + str(particulator.n_steps).zfill(self.num_len)
+        )
+        self.exported_times[path] = particulator.n_steps * particulator.dt
+        if self.verbose:
+            print("Exporting attributes snapshot, path: " + path)
+
+        keys = self.attributes or tuple(particulator.attributes.keys())
+        payload = {key: particulator.attributes[key].to_ndarray() for key in keys}
+        meta = {
+            "n_steps": particulator.n_steps,
+            "time": self.exported_times[path],
+            "n_particles": particulator.attributes.super_droplet_count,
+            "chunk_size": self.chunk_size,
+            "mesh": {
+                "grid": list(particulator.mesh.grid),
+                "size": list(particulator.mesh.size),
+            },
+            "attributes": {
+                key: {"dtype": value.dtype.str, "shape": list(value.shape)}
+                for key, value in payload.items()
+            },
+        }
+        self.__queue.put((path, meta, payload))
+
+    def flush(self):
+        """blocks until all queued snapshots are written"""
+        self.__queue.join()
+        self.__raise_writer_error()
+
+    def close(self):
+        if self.__writer.is_alive():
+            self.__queue.put(None)
+            self.__writer.join()
+        self.__raise_writer_error()
+
+    def __raise_writer_error(self):
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise RuntimeError("snapshot writer failed") from error
+
+    def __write_loop(self):
+        while True:
+            item = self.__queue.get()
+            try:
+                if item is None:
+                    return
+                if self.__error is None:
+                    self.__write(*item)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self.__error = error
+            finally:
+                self.__queue.task_done()
+
+    def __write(self, path, meta, payload):
+        save = np.savez_compressed if self.compress else np.savez
+        for key, value in payload.items():
+            os.makedirs(os.path.join(path, key), exist_ok=True)
+            for chunk, start in enumerate(
+                range(0, meta["n_particles"], self.chunk_size)
+            ):
+                save(
+                    os.path.join(path, key, f"{chunk}.npz"),
+                    data=value[..., start : start + self.chunk_size],
+                )
+        # written last, marks the snapshot as complete
+        with open(os.path.join(path, META_FILENAME), "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+
+
+def read_snapshot(path, *, attributes=None, start=0, stop=None):
+    """returns the metadata and the values of the selected `attributes` (all by
+    default) for particles in the `[start, stop)` range, reading only
+    the chunks overlapping with it"""
+    with open(os.path.join(path, META_FILENAME), encoding="utf-8") as file:
+        meta = json.load(file)
+    chunk_size = meta["chunk_size"]
+    stop = meta["n_particles"] if stop is None else min(stop, meta["n_particles"])
+    start = min(start, stop)
+
+    data = {}
+    for key in attributes or meta["attributes"]:
+        chunks = []
+        for chunk in range(start // chunk_size, -(-stop // chunk_size)):
+            with np.load(os.path.join(path, key, f"{chunk}.npz")) as file:
+                offset = chunk * chunk_size
+                chunks.append(file["data"][..., max(start - offset, 0) : stop - offset])
+        spec = meta["attributes"][key]
+        data[key] = (
+            np.concatenate(chunks, axis=-1)
+            if chunks
+            else np.empty((*spec["shape"][:-1], 0), dtype=spec["dtype"])
+        )
+    return meta, data
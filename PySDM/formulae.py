@@ -18,7 +18,7 @@ import pint
 from numba.core.errors import NumbaExperimentalFeatureWarning
 
 from PySDM import physics
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 from PySDM.dynamics.terminal_velocity import GunnKinzer1949, PowerSeries, RogersYau
 from PySDM.dynamics.terminal_velocity.gunn_and_kinzer import TpDependent
 
@@ -217,8 +217,10 @@ def _formula(func, constants, dimensional_analysis, **kw):
         )
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=NumbaExperimentalFeatureWarning)
-            return vectorizer(function)
-    return numba.njit(
+            vectorized = vectorizer(function)
+        jit_cache.register_fingerprint(vectorized, source, constants, extras, kw)
+        return vectorized
+    return jit_cache.njit(
         getattr(loc["_"], func.__name__),
         **{
             **conf.JIT_FLAGS,
@@ -0,0 +1,177 @@
+"""
+opt-in instrumentation of backend methods: call counts, cumulative wall time
+ and bytes of storages (and arrays) passed as arguments, recorded per backend
+ method and per dynamic (see `PySDM.particulator.Particulator.enable_profiling()`),
+ with an optional timeline exportable in the Chrome trace-event JSON format
+ (viewable with chrome://tracing or https://ui.perfetto.dev)
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_common.storage_utils import StorageBase
+
+OUTSIDE_OF_DYNAMICS = "(outside of dynamics)"
+""" key under which calls made outside of any dynamic (e.g. by products) are recorded """
+
+_QUANTITIES = ("calls", "time", "bytes")
+
+
+def backend_method_names(backend):
+    """names of the public functions defined in the `BackendMethods` subclasses
+    from which the class of `backend` inherits"""
+    names = set()
+    for cls in type(backend).__mro__:
+        if not issubclass(cls, BackendMethods):
+            continue
+        for name, value in vars(cls).items():
+            if not name.startswith("_") and (
+                inspect.isfunction(value) or isinstance(value, staticmethod)
+            ):
+                names.add(name)
+    return tuple(sorted(names))
+
+
+def _nbytes(arg):
+    if isinstance(arg, StorageBase):
+        return int(np.prod(arg.shape)) * np.dtype(arg.dtype).itemsize
+    if isinstance(arg, np.ndarray):
+        return arg.nbytes
+    if isinstance(arg, (tuple, list)):
+        return sum(_nbytes(item) for item in arg)
+    return 0
+
+
+class BackendProfiler:  # pylint: disable=too-many-instance-attributes
+    """
+    while enabled, the backend methods are shadowed by instance attributes
+    wrapping the original ones (disabling the profiler removes them, hence
+    the only overhead of a disabled profiler is a single check per dynamic call);
+    the recorded wall times are inclusive (i.e. cover nested backend method calls)
+    and, for asynchronous (GPU) backends, measure the kernel launches only;
+    `bytes` is the total size of the storages (and arrays) passed as arguments
+    """
+
+    def __init__(self, backend, *, trace=False):
+        self.backend = backend
+        self.trace = trace
+        self.method_names = backend_method_names(backend)
+        self.stats = {}
+        self.events = []
+        self.__dynamic = OUTSIDE_OF_DYNAMICS
+        self.__wrappers = {}
+        self.__t0 = time.perf_counter()
+
+    @property
+    def enabled(self):
+        return len(self.__wrappers) > 0
+
+    def enable(self):
+        for name in self.method_names:
+            if name not in self.__wrappers:
+                self.__wrappers[name] = self.__wrap(name, getattr(self.backend, name))
+                setattr(self.backend, name, self.__wrappers[name])
+
+    def disable(self):
+        for name, wrapper in self.__wrappers.items():
+            if self.backend.__dict__.get(name) is wrapper:
+                delattr(self.backend, name)
+        self.__wrappers = {}
+
+    def reset(self):
+        self.stats = {}
+        self.events = []
+
+    @contextmanager
+    def dynamic(self, key):
+        """attributes backend method calls made within the context to dynamic `key`"""
+        outer, self.__dynamic = self.__dynamic, key
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__dynamic = outer
+            if self.trace:
+                self.__trace_event(key, "dynamic", start, time.perf_counter(), {})
+
+    def __wrap(self, name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stop = time.perf_counter()
+                nbytes = _nbytes(args) + _nbytes(tuple(kwargs.values()))
+                stats = self.stats.setdefault(self.__dynamic, {}).setdefault(
+                    name, dict.fromkeys(_QUANTITIES, 0)
+                )
+                stats["calls"] += 1
+                stats["time"] += stop - start
+                stats["bytes"] += nbytes
+                if self.trace:
+                    self.__trace_event(
+                        name,
+                        self.__dynamic,
+                        start,
+                        stop,
+                        {"bytes": nbytes},
+                    )
+
+        return wrapper
+
+    def __trace_event(  # pylint: disable=too-many-arguments
+        self, name, category, start, stop, args
+    ):
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.__t0) * 1e6,
+                "dur": (stop - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def total(self, method, quantity, dynamic=None):
+        """sum of `quantity` (one of `"calls"`, `"time"` or `"bytes"`) recorded
+        for `method` within `dynamic` (or, if `None`, regardless of the dynamic)"""
+        assert quantity in _QUANTITIES
+        return sum(
+            per_method[method][quantity]
+            for key, per_method in self.stats.items()
+            if method in per_method and (dynamic is None or key == dynamic)
+        )
+
+    def report(self):
+        """returns a `{dynamic: {method: {"calls": ..., "time": ..., "bytes": ...}}}`
+        dictionary with methods sorted by decreasing cumulative wall time"""
+        return {
+            dynamic: dict(
+                sorted(
+                    ((method, dict(stats)) for method, stats in per_method.items()),
+                    key=lambda item: -item[1]["time"],
+                )
+            )
+            for dynamic, per_method in self.stats.items()
+        }
+
+    def chrome_trace(self):
+        """returns the recorded timeline (requires `trace=True`) as a trace-event
+        format dictionary"""
+        return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.chrome_trace(), file)
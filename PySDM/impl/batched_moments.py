@@ -0,0 +1,145 @@
+"""
+single-pass evaluation of all statistical moments requested by the products
+ (see `PySDM.products.impl.moment_product.MomentProduct`) for a given state
+ of the particle attributes
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+MomentSpec = namedtuple(
+    "MomentSpec",
+    (
+        "attr",
+        "rank",
+        "filter_attr",
+        "filter_range",
+        "weighting_attribute",
+        "weighting_rank",
+    ),
+)
+
+
+class BatchedMoments:  # pylint: disable=too-many-instance-attributes
+    """caches the moments (not normalised by the zero-th moment) for all specs
+    requested since the attributes last changed; upon a change (new timestep,
+    attribute marked as updated or super-droplet removal), all specs requested
+    in the previous state are recomputed in one pass over particles, while
+    specs requested for the first time in a given state are computed
+    (in a batch of one) and added to the cache"""
+
+    def __init__(self, particulator):
+        self.particulator = particulator
+        self.enabled = True
+        self.__state = None
+        self.__results = {}
+        self.__requested = set()
+
+    def invalidate(self):
+        self.__state = None
+
+    def get(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        moment_0,
+        moments,
+        attr,
+        rank,
+        filter_attr,
+        filter_range,
+        weighting_attribute,
+        weighting_rank,
+        skip_division_by_m0,
+    ):
+        """writes to `moment_0` and `moments[0, :]` the same values as
+        `PySDM.particulator.Particulator.moments` would for `specs={attr: (rank,)}`"""
+        spec = MomentSpec(
+            attr,
+            rank,
+            filter_attr,
+            tuple(filter_range),
+            weighting_attribute,
+            weighting_rank,
+        )
+        state = self.__current_state()
+        if state != self.__state:
+            batch = self.__requested | {spec}
+            self.__results = {}
+            self.__requested = set()
+            self.__compute(batch)
+            self.__state = state
+        elif spec not in self.__results:
+            self.__compute({spec})
+        self.__requested.add(spec)
+
+        result_0, result = self.__results[spec]
+        moment_0.fill(result_0)
+        moments[0, :].fill(result)
+        if not skip_division_by_m0:
+            moments[0, :].divide_if_not_zero(moment_0)
+
+    def __current_state(self):
+        return (
+            self.particulator.n_steps,
+            self.particulator.attributes.super_droplet_count,
+            self.particulator.attributes.timestamp(),
+        )
+
+    def __compute(self, specs):
+        # pylint: disable=too-many-locals
+        groups = {}
+        for spec in specs:
+            groups.setdefault(spec[2:], []).append(spec)
+        groups = {key: sorted(group) for key, group in sorted(groups.items())}
+
+        attr_names = sorted(
+            {spec.attr for spec in specs}
+            | {key[0] for key in groups}
+            | {key[2] for key in groups}
+        )
+        attr_index = {name: i for i, name in enumerate(attr_names)}
+        group_start = np.cumsum([0] + [len(group) for group in groups.values()])
+        all_specs = [spec for group in groups.values() for spec in group]
+
+        storage = self.particulator.Storage
+        n_cell = self.particulator.mesh.n_cell
+        moment_0 = storage.empty((len(groups), n_cell), dtype=float)
+        moments = storage.empty((len(all_specs), n_cell), dtype=float)
+        self.particulator.backend.batched_moments(
+            moment_0=moment_0,
+            moments=moments,
+            multiplicity=self.particulator.attributes["multiplicity"],
+            attributes=tuple(self.particulator.attributes[name] for name in attr_names),
+            cell_id=self.particulator.attributes["cell id"],
+            idx=self.particulator.attributes._ParticleAttributes__idx,
+            length=self.particulator.attributes.super_droplet_count,
+            filter_attr=storage.from_ndarray(
+                np.array([attr_index[key[0]] for key in groups], dtype=np.int64)
+            ),
+            min_x=storage.from_ndarray(
+                np.array([key[1][0] for key in groups], dtype=float)
+            ),
+            max_x=storage.from_ndarray(
+                np.array([key[1][1] for key in groups], dtype=float)
+            ),
+            weighting_attr=storage.from_ndarray(
+                np.array([attr_index[key[2]] for key in groups], dtype=np.int64)
+            ),
+            weighting_rank=storage.from_ndarray(
+                np.array([key[3] for key in groups], dtype=float)
+            ),
+            group_start=storage.from_ndarray(group_start.astype(np.int64)),
+            moment_attr=storage.from_ndarray(
+                np.array([attr_index[spec.attr] for spec in all_specs], dtype=np.int64)
+            ),
+            moment_rank=storage.from_ndarray(
+                np.array([spec.rank for spec in all_specs], dtype=float)
+            ),
+        )
+        for group_id, group in enumerate(groups.values()):
+            for k, spec in enumerate(group):
+                self.__results[spec] = (
+                    moment_0[group_id, :],
+                    moments[int(group_start[group_id]) + k, :],
+                )
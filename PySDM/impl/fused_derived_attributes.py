@@ -0,0 +1,72 @@
+"""
+single-pass evaluation of the chain of attributes derived from water mass
+ (volume, radius and terminal velocity), enabled by
+ setting `PySDM.particulator.Particulator.derived_attributes_fusion` to `"fused"`
+ or `"virtual"` before building
+"""
+
+from PySDM.attributes.physics import Radius, TerminalVelocity, Volume
+from PySDM.dynamics.terminal_velocity import GunnKinzer1949, RogersYau
+
+
+class FusedDerivedAttributes:  # pylint: disable=too-few-public-methods
+    """once attached to the `volume`, `radius` and `terminal velocity` attributes
+    (whichever of these are present, in this order, with terminal velocity
+    included only for the `GunnKinzer1949` and `RogersYau` approximations), any
+    update of any of them recomputes all in one backend call; with `virtual=True`
+    the members requested only by other members of the chain (e.g. volume and
+    radius if only terminal velocity is used) are not stored at all"""
+
+    def __init__(self, req_attr, *, requesters, virtual):
+        self.water_mass = req_attr["water mass"]
+        self.particulator = self.water_mass.particulator
+        if not hasattr(self.particulator.backend, "water_mass_derived_attributes"):
+            raise NotImplementedError(
+                "fusion of derived attributes is not available with "
+                + type(self.particulator.backend).__name__
+            )
+        self.timestamp = 0
+        self.table = None
+        self.members = {}
+        for name, cls in (
+            ("volume", Volume),
+            ("radius", Radius),
+            ("terminal velocity", TerminalVelocity),
+        ):
+            if not isinstance(req_attr.get(name), cls):
+                break
+            self.members[name] = req_attr[name]
+        if "terminal velocity" in self.members:
+            approximation = self.members["terminal velocity"].approximation
+            if isinstance(approximation, GunnKinzer1949):
+                self.table = approximation
+            elif not isinstance(approximation, RogersYau):
+                del self.members["terminal velocity"]
+
+        for name, attr in self.members.items():
+            attr.chain = self
+            attr.virtual = virtual and requesters[name] <= set(self.members)
+
+    def update(self):
+        self.water_mass.update()
+        if self.timestamp < self.water_mass.timestamp:
+            self.timestamp = self.water_mass.timestamp
+            outputs = dict.fromkeys(("volume", "radius", "terminal velocity"))
+            for name, attr in self.members.items():
+                if not attr.virtual:
+                    outputs[name] = attr.data
+            out_of_range = self.particulator.backend.water_mass_derived_attributes(
+                water_mass=self.water_mass.data,
+                volume=outputs["volume"],
+                radius=outputs["radius"],
+                terminal_velocity=outputs["terminal velocity"],
+                table=(
+                    None
+                    if self.table is None
+                    else (self.table.factor, self.table.a, self.table.b)
+                ),
+            )
+            if self.table is not None:
+                self.table.check_radius_range(out_of_range)
+            for attr in self.members.values():
+                attr.timestamp = self.timestamp
@@ -0,0 +1,27 @@
+"""
+helpers for deferring (using module-level `__getattr__` and `__dir__`, see
+ [PEP 562](https://peps.python.org/pep-0562/)) the import of submodules until
+ the names these define are first accessed, what keeps `import PySDM` cheap
+"""
+
+import importlib
+import sys
+
+
+def lazy_module(package, *, exports, subpackages=()):
+    """returns `__getattr__` and `__dir__` functions for the `package` module,
+    `exports` maps names to the (relative) names of submodules defining them"""
+
+    def __getattr__(name):
+        if name in subpackages:
+            return importlib.import_module(f"{package}.{name}")
+        if name in exports:
+            value = getattr(importlib.import_module(f"{package}.{exports[name]}"), name)
+            setattr(sys.modules[package], name, value)
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted({*vars(sys.modules[package]), *exports, *subpackages})
+
+    return __getattr__, __dir__
@@ -8,6 +8,7 @@ from typing import Dict
 import numpy as np
 
 from PySDM.attributes.impl.attribute import Attribute
+from PySDM.attributes.impl.derived_attribute import DerivedAttribute
 
 
 class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
@@ -57,6 +58,15 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def mark_updated(self, key):
         self.__attributes[key].mark_updated()
 
+    def timestamp(self):
+        """sum of timestamps of the non-derived attributes, i.e. a counter
+        incremented whenever any attribute is marked as updated"""
+        return sum(
+            attr.timestamp
+            for attr in self.__attributes.values()
+            if not isinstance(attr, DerivedAttribute)
+        )
+
     def sanitize(self):
         if not self.healthy:
             self.__idx.length = self.__valid_n_sd
@@ -89,15 +99,41 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def __contains__(self, key):
         return key in self.__attributes
 
-    def permutation(self, u01, local):
+    def permutation(self, u01, local, parallel=False):
         """apply Fisher-Yates algorithm to all super-droplets (local=False) or
-        otherwise on a per-cell basis"""
+        otherwise on a per-cell basis; for the global shuffle, `parallel=True`
+        selects a multi-threaded random-key sort instead"""
         if local:
             self.__idx.shuffle(u01, parts=self.cell_start)
         else:
-            self.__idx.shuffle(u01)
+            self.__idx.shuffle(u01, parallel=parallel)
             self.__sorted = False
 
+    def locality(self):
+        """fraction of super-droplets neighbouring in the `idx` order which are
+        also adjacent in memory (equals one right after `defragment()`, drops
+        towards zero as the particles get shuffled and moved between cells)"""
+        return self.__idx.locality()
+
+    def defragment(self):
+        """physically reorders the data of all attributes into the cell-sorted
+        `idx` order and resets `idx` to identity, so that the subsequent per-cell
+        loops stream contiguous memory; as any other attribute-storage changes,
+        it invalidates the derived attributes"""
+        assert self.healthy
+        if not self.__sorted:
+            self.__sort_by_cell_id()
+        self.__idx.reorder(
+            tuple(
+                attr.data
+                for attr in self.__attributes.values()
+                if attr.data is not None
+            )
+        )
+        for attr in self.__attributes.values():
+            if not isinstance(attr, DerivedAttribute):
+                attr.mark_updated()
+
     def __sort_by_cell_id(self):
         self.__cell_caretaker(
             self["cell id"], self.cell_idx, self.__cell_start, self.__idx
@@ -9,6 +9,8 @@ from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
 from PySDM.backends.impl_common.pairwise_storage import make_PairwiseStorage
+from PySDM.impl.backend_profiler import BackendProfiler
+from PySDM.impl.batched_moments import BatchedMoments
 from PySDM.impl.particle_attributes import ParticleAttributes
 
 
@@ -28,7 +30,11 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         self.n_steps = 0
 
         self.sorting_scheme = "default"
+        self.defragmentation_interval = 0
+        self.defragmentation_locality_threshold = 0.0
+        self.derived_attributes_fusion = None
         self.condensation_solver = None
+        self.batched_moments = BatchedMoments(self)
 
         self.Index = make_Index(backend)  # pylint: disable=invalid-name
         self.PairIndicator = make_PairIndicator(backend)  # pylint: disable=invalid-name
@@ -40,16 +46,50 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         )
 
         self.timers = {}
+        self.profiler = None
         self.null = self.Storage.empty(0, dtype=float)
 
     def run(self, steps):
         for _ in range(steps):
+            if self._defragmentation_due():
+                self.attributes.defragment()
             for key, dynamic in self.dynamics.items():
                 with self.timers[key]:
-                    dynamic()
+                    if self.profiler is None:
+                        dynamic()
+                    else:
+                        with self.profiler.dynamic(key):
+                            dynamic()
             self.n_steps += 1
             self._notify_observers()
 
+    def enable_profiling(self, *, trace=False) -> BackendProfiler:
+        """instruments the backend methods (see `PySDM.impl.backend_profiler`),
+        returns the profiler (the same one if called again)"""
+        if self.profiler is None:
+            self.profiler = BackendProfiler(self.backend, trace=trace)
+        self.profiler.trace |= trace
+        self.profiler.enable()
+        return self.profiler
+
+    def disable_profiling(self):
+        """removes the instrumentation, the recorded data is discarded"""
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler = None
+
+    def _defragmentation_due(self):
+        """attribute data is reordered by cell every `defragmentation_interval`
+        steps and/or whenever `ParticleAttributes.locality()` falls below
+        `defragmentation_locality_threshold` (zero values disable the triggers)"""
+        if self.defragmentation_interval > 0 and self.n_steps > 0:
+            if self.n_steps % self.defragmentation_interval == 0:
+                return True
+        if self.defragmentation_locality_threshold > 0:
+            if self.attributes.locality() < self.defragmentation_locality_threshold:
+                return True
+        return False
+
     def _notify_observers(self):
         reversed_order_so_that_environment_is_last = reversed(self.observers)
         for observer in reversed_order_so_that_environment_is_last:
@@ -104,7 +144,18 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             RH=self.environment.get_predicted("RH"),
         )
 
-    def condensation(self, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order):
+    def condensation(
+        self,
+        *,
+        rtol_x,
+        rtol_thd,
+        counters,
+        RH_max,
+        success,
+        cell_order,
+        work_stealing=False,
+        parallel_droplets=None,
+    ):
         """Updates droplet volumes by simulating condensation driven by prior changes
           in environment thermodynamic state, updates the environment state.
         In the case of parcel environment, condensation is driven solely by changes in
@@ -140,6 +191,8 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             timestep=self.dt,
             counters=counters,
             cell_order=cell_order,
+            work_stealing=work_stealing,
+            parallel_droplets=parallel_droplets,
             RH_max=RH_max,
             success=success,
             cell_id=self.attributes["cell id"],
@@ -210,6 +263,58 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         for key in self.attributes.get_extensive_attribute_keys():
             self.attributes.mark_updated(key)
 
+    def fused_collision_coalescence(
+        self,
+        *,
+        kernel,
+        kernel_params,
+        kernel_attributes,
+        rand,
+        prob,
+        norm_factor,
+        n_substeps,
+        collision_rate,
+        collision_rate_deficit,
+        coalescence_rate,
+        is_first_in_pair,
+        compute_probabilities=True,
+        coalescence=True,
+    ):
+        # pylint: disable=too-many-locals
+        self.backend.fused_collision_coalescence(
+            kernel=kernel,
+            kernel_params=kernel_params,
+            x=self.attributes[kernel_attributes[0]],
+            y=self.attributes[kernel_attributes[1]],
+            multiplicity=self.attributes["multiplicity"],
+            idx=self.attributes._ParticleAttributes__idx,
+            attributes=self.attributes.get_extensive_attribute_storage(),
+            rand=rand,
+            prob=prob,
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+            cell_id=self.attributes["cell id"],
+            cell_idx=self.attributes.cell_idx,
+            cell_start=self.attributes.cell_start,
+            norm_factor=norm_factor,
+            timestep=self.dt,
+            dv=self.mesh.dv,
+            n_substeps=n_substeps,
+            collision_rate=collision_rate,
+            collision_rate_deficit=collision_rate_deficit,
+            coalescence_rate=coalescence_rate,
+            is_first_in_pair=is_first_in_pair,
+            compute_probabilities=compute_probabilities,
+            coalescence=coalescence,
+        )
+        if coalescence:
+            self.attributes.healthy = bool(
+                self.attributes._ParticleAttributes__healthy_memory
+            )
+            self.attributes.sanitize()
+            self.attributes.mark_updated("multiplicity")
+            for key in self.attributes.get_extensive_attribute_keys():
+                self.attributes.mark_updated(key)
+
     def oxidation(
         self,
         *,
@@ -252,11 +357,11 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         timestep,
         environment_mixing_ratios,
         do_chemistry_flag,
+        cell_order,
     ):
         self.backend.dissolution(
             n_cell=self.mesh.n_cell,
-            n_threads=1,
-            cell_order=np.arange(self.mesh.n_cell),
+            cell_order=cell_order,
             cell_start_arg=self.attributes.cell_start,
             idx=self.attributes._ParticleAttributes__idx,
             do_chemistry_flag=do_chemistry_flag,
@@ -303,6 +408,19 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         )
         self.attributes._ParticleAttributes__sorted = False
 
+    def update_cell_origin_and_id(self, *, grid, strides):
+        """single-pass equivalent of moving the integer part of `position in cell`
+        into `cell origin`, applying periodic boundary condition to the latter
+        and calling `recalculate_cell_id()`"""
+        self.backend.update_cell_origin_and_id(
+            cell_id=self.attributes["cell id"],
+            cell_origin=self.attributes["cell origin"],
+            position_in_cell=self.attributes["position in cell"],
+            grid=grid,
+            strides=strides,
+        )
+        self.attributes._ParticleAttributes__sorted = False
+
     def sort_within_pair_by_attr(self, is_first_in_pair, attr_name):
         self.backend.sort_within_pair_by_attr(
             self.attributes._ParticleAttributes__idx,
@@ -376,7 +494,15 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         attr_name="water mass",
         weighting_attribute="water mass",
         weighting_rank=0,
+        attr_bins_spacing=None,
     ):
+        """
+        Writes to `moment_0` and `moments` the zero-th and the `rank`-th moments
+        of the attribute `attr` in each of the bins of `attr_name` defined by the
+        `attr_bins` edges; `attr_bins_spacing` can be set to `"monotonic"`,
+        `"linear"` or `"logarithmic"` (see `bins_spacing()` in
+        `PySDM.products.impl.spectrum_moment_product`) to speed up bin lookup
+        """
         attr_data = self.attributes[attr]
         self.backend.spectrum_moments(
             moment_0=moment_0,
@@ -385,12 +511,14 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             attr_data=attr_data,
             cell_id=self.attributes["cell id"],
             idx=self.attributes._ParticleAttributes__idx,
+            cell_start=self.attributes.cell_start,
             length=self.attributes.super_droplet_count,
             rank=rank,
             x_bins=attr_bins,
             x_attr=self.attributes[attr_name],
             weighting_attribute=self.attributes[weighting_attribute],
             weighting_rank=weighting_rank,
+            x_bins_spacing=attr_bins_spacing,
         )
 
     def adaptive_sdm_end(self, dt_left):
@@ -443,6 +571,59 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
                 n_substeps=n_substeps,
             )
 
+    def displacement_step(
+        self,
+        *,
+        courant,
+        courant_offsets,
+        courant_strides,
+        displacement,
+        grid,
+        strides,
+        n_substeps,
+        enable_sedimentation,
+        precipitation_counting_level_index,
+    ) -> float:
+        """single-pass equivalent of repeating, for each particle, `n_substeps[cell id]`
+        times (cell id as of the beginning of the step): `calculate_displacement()`
+        (including sedimentation), updating positions, `remove_precipitated()` (if
+        `enable_sedimentation`), `flag_out_of_column()` and
+        `update_cell_origin_and_id()` with the Courant-number components
+        passed flattened into a single storage; returns the precipitated volume
+        """
+        res = self.backend.displacement_step(
+            courant=courant,
+            courant_offsets=courant_offsets,
+            courant_strides=courant_strides,
+            cell_origin=self.attributes["cell origin"],
+            position_in_cell=self.attributes["position in cell"],
+            cell_id=self.attributes["cell id"],
+            displacement=displacement,
+            idx=self.attributes._ParticleAttributes__idx,
+            length=self.attributes.super_droplet_count,
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+            grid=grid,
+            strides=strides,
+            n_substeps=n_substeps,
+            relative_fall_velocity=(
+                self.attributes["relative fall velocity"]
+                if enable_sedimentation
+                else None
+            ),
+            timestep=self.dt if enable_sedimentation else np.nan,
+            dz=self.mesh.dz if enable_sedimentation else np.nan,
+            volume=self.attributes["volume"] if enable_sedimentation else None,
+            multiplicity=self.attributes["multiplicity"],
+            precipitation_counting_level_index=precipitation_counting_level_index,
+            domain_top_level_index=self.mesh.grid[-1],
+        )
+        self.attributes.healthy = bool(
+            self.attributes._ParticleAttributes__healthy_memory
+        )
+        self.attributes.sanitize()
+        self.attributes._ParticleAttributes__sorted = False
+        return res
+
     def isotopic_fractionation(self, heavy_isotopes: tuple):
         self.backend.isotopic_fractionation()
         for isotope in heavy_isotopes:
@@ -2,13 +2,128 @@
 Simulation output products
 """
 
-from .ambient_thermodynamics import *
-from .aqueous_chemistry import *
-from .collision import *
-from .condensation import *
-from .displacement import *
-from .freezing import *
-from .housekeeping import *
-from .size_spectral import *
-from .optical import *
-from .parcel import *
+from typing import TYPE_CHECKING
+
+from PySDM.impl.lazy_imports import lazy_module
+
+if TYPE_CHECKING:  # names resolved lazily at runtime, listed here for static analysis
+    from .ambient_thermodynamics import *
+    from .aqueous_chemistry import *
+    from .collision import *
+    from .condensation import *
+    from .displacement import *
+    from .freezing import *
+    from .housekeeping import *
+    from .optical import *
+    from .parcel import *
+    from .size_spectral import *
+
+_EXPORTS = {
+    "ambient_thermodynamics": (
+        "AmbientDryAirDensity",
+        "AmbientDryAirPotentialTemperature",
+        "AmbientPressure",
+        "AmbientRelativeHumidity",
+        "AmbientTemperature",
+        "AmbientWaterVapourMixingRatio",
+    ),
+    "aqueous_chemistry": (
+        "Acidity",
+        "AcidityIterations",
+        "AqueousMassSpectrum",
+        "AqueousMoleFraction",
+        "GaseousMoleFraction",
+        "TotalDryMassMixingRatio",
+    ),
+    "collision": (
+        "BreakupRateDeficitPerGridbox",
+        "BreakupRatePerGridbox",
+        "CoalescenceRatePerGridbox",
+        "CollisionRateDeficitPerGridbox",
+        "CollisionRatePerGridbox",
+        "CollisionTimestepMean",
+        "CollisionTimestepMin",
+    ),
+    "condensation": (
+        "ActivableFraction",
+        "ActivatingRate",
+        "CondensationTimestepMax",
+        "CondensationTimestepMin",
+        "DeactivatingRate",
+        "PeakSupersaturation",
+        "RipeningRate",
+    ),
+    "displacement": (
+        "AveragedTerminalVelocity",
+        "DisplacementSubstepCount",
+        "FlowVelocityComponent",
+        "MaxCourantNumber",
+        "SurfacePrecipitation",
+    ),
+    "freezing": (
+        "CoolingRate",
+        "FreezableSpecificConcentration",
+        "FrozenParticleConcentration",
+        "FrozenParticleSpecificConcentration",
+        "IceNucleiConcentration",
+        "SpecificIceNucleiConcentration",
+        "TotalUnfrozenImmersedSurfaceArea",
+    ),
+    "housekeeping": (
+        "BackendMethodBytes",
+        "BackendMethodCalls",
+        "BackendMethodWallTime",
+        "CPUTime",
+        "DynamicWallTime",
+        "SuperDropletCountPerGridbox",
+        "Time",
+        "WallTime",
+    ),
+    "size_spectral": (
+        "ActivatedEffectiveRadius",
+        "ActivatedMeanRadius",
+        "ActivatedParticleConcentration",
+        "ActivatedParticleSpecificConcentration",
+        "AreaStandardDeviation",
+        "CloudWaterContent",
+        "EffectiveRadius",
+        "IceWaterContent",
+        "LiquidWaterContent",
+        "MeanRadius",
+        "MeanVolumeRadius",
+        "NumberSizeSpectrum",
+        "ParticleConcentration",
+        "ParticleSizeSpectrumPerMass",
+        "ParticleSizeSpectrumPerVolume",
+        "ParticleSpecificConcentration",
+        "ParticleVolumeVersusRadiusLogarithmSpectrum",
+        "RadiusBinnedNumberAveragedTerminalVelocity",
+        "RadiusFirstMoment",
+        "RadiusSixthMoment",
+        "RadiusStandardDeviation",
+        "SpecificCloudWaterContent",
+        "SpecificIceWaterContent",
+        "SpecificLiquidWaterContent",
+        "TotalParticleConcentration",
+        "TotalParticleSpecificConcentration",
+        "VolumeFirstMoment",
+        "VolumeSecondMoment",
+        "VolumeStandardDeviation",
+        "WaterMixingRatio",
+        "ZerothMoment",
+    ),
+    "optical": (
+        "CloudAlbedo",
+        "CloudOpticalDepth",
+    ),
+    "parcel": (
+        "ParcelDisplacement",
+        "ParcelLiquidWaterPath",
+    ),
+}
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    exports={name: module for module, names in _EXPORTS.items() for name in names},
+    subpackages=(*_EXPORTS, "impl"),
+)
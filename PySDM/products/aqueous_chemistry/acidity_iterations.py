@@ -0,0 +1,21 @@
+"""
+number of toms748 iterations taken in each cell to equilibrate pH within the last
+ timestep (summed over super-droplets and chemistry substeps; also used by
+ `PySDM.dynamics.aqueous_chemistry.AqueousChemistry` to order cells for dissolution)
+"""
+
+from PySDM.products.impl.product import Product
+
+
+class AcidityIterations(Product):
+    def __init__(self, unit="dimensionless", name=None):
+        super().__init__(name=name, unit=unit)
+        self.aqueous_chemistry = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.aqueous_chemistry = self.particulator.dynamics["AqueousChemistry"]
+
+    def _impl(self, **kwargs):
+        self._download_to_buffer(self.aqueous_chemistry.counters["n_pH_iterations"])
+        return self.buffer
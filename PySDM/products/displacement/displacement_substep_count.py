@@ -0,0 +1,21 @@
+"""
+number of particle-displacement substeps per cell used in the last timestep
+(uniform across the domain unless the `PySDM.dynamics.displacement.Displacement`
+dynamic is run with `local_substeps=True`)
+"""
+
+from PySDM.products.impl.product import Product
+
+
+class DisplacementSubstepCount(Product):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(unit=unit, name=name)
+        self.displacement = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.displacement = self.particulator.dynamics["Displacement"]
+
+    def _impl(self, **kwargs):
+        self._download_to_buffer(self.displacement.n_substeps_per_cell)
+        return self.buffer
@@ -2,6 +2,11 @@
 Housekeeping products: time, super-particle count, wall-time timers...
 """
 
+from .backend_method_profile import (
+    BackendMethodBytes,
+    BackendMethodCalls,
+    BackendMethodWallTime,
+)
 from .dynamic_wall_time import DynamicWallTime
 from .super_droplet_count_per_gridbox import SuperDropletCountPerGridbox
 from .time import Time
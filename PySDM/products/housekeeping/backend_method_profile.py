@@ -0,0 +1,56 @@
+"""
+call counts, cumulative wall time and bytes of storages passed as arguments
+ for a given backend method (optionally, only for calls made by a given dynamic),
+ registering the products enables profiling (see `PySDM.impl.backend_profiler`);
+ fetching a value resets the counter (zero is returned while profiling is disabled)
+"""
+
+from PySDM.products.impl.product import Product
+
+
+class _BackendMethodProfile(Product):
+    quantity = None
+
+    def __init__(self, *, method, dynamic=None, name, unit):
+        super().__init__(name=name, unit=unit)
+        self.method = method
+        self.dynamic = dynamic
+        self.value = 0
+
+    def register(self, builder):
+        super().register(builder)
+        self.shape = ()
+        self.particulator.enable_profiling()
+        assert self.method in self.particulator.profiler.method_names
+
+    def _impl(self, **kwargs):
+        if self.particulator.profiler is None:
+            self.value = 0
+            return 0
+        total = self.particulator.profiler.total(
+            self.method, self.quantity, dynamic=self.dynamic
+        )
+        result = total - self.value
+        self.value = total
+        return result
+
+
+class BackendMethodCalls(_BackendMethodProfile):
+    quantity = "calls"
+
+    def __init__(self, method, dynamic=None, name=None, unit="dimensionless"):
+        super().__init__(method=method, dynamic=dynamic, name=name, unit=unit)
+
+
+class BackendMethodWallTime(_BackendMethodProfile):
+    quantity = "time"
+
+    def __init__(self, method, dynamic=None, name=None, unit="s"):
+        super().__init__(method=method, dynamic=dynamic, name=name, unit=unit)
+
+
+class BackendMethodBytes(_BackendMethodProfile):
+    quantity = "bytes"
+
+    def __init__(self, method, dynamic=None, name=None, unit="dimensionless"):
+        super().__init__(method=method, dynamic=dynamic, name=name, unit=unit)
@@ -1,4 +1,4 @@
-""" common code for products computing statistical moments (e.g., effective radius, acidity) """
+"""common code for products computing statistical moments (e.g., effective radius, acidity)"""
 
 from abc import ABC
 
@@ -33,16 +33,29 @@ class MomentProduct(Product, ABC):
         weighting_rank=0,
         skip_division_by_m0=False,
     ):
-        self.particulator.moments(
-            moment_0=self.moment_0,
-            moments=self.moments,
-            specs={attr: (rank,)},
-            attr_name=filter_attr,
-            attr_range=filter_range,
-            weighting_attribute=weighting_attribute,
-            weighting_rank=weighting_rank,
-            skip_division_by_m0=skip_division_by_m0,
-        )
+        if self.particulator.batched_moments.enabled:
+            self.particulator.batched_moments.get(
+                moment_0=self.moment_0,
+                moments=self.moments,
+                attr=attr,
+                rank=rank,
+                filter_attr=filter_attr,
+                filter_range=filter_range,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+                skip_division_by_m0=skip_division_by_m0,
+            )
+        else:
+            self.particulator.moments(
+                moment_0=self.moment_0,
+                moments=self.moments,
+                specs={attr: (rank,)},
+                attr_name=filter_attr,
+                attr_range=filter_range,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+                skip_division_by_m0=skip_division_by_m0,
+            )
         if rank == 0:  # TODO #217
             self._download_to_buffer(self.moment_0)
         else:
@@ -5,13 +5,21 @@ logic around the `PySDM.products.impl.product.Product` - parent class for all pr
 import inspect
 import re
 from abc import abstractmethod
+from functools import lru_cache
 from typing import Optional
 
-import pint
-
 from PySDM.physics.constants import PPB, PPM, PPT
 
-_UNIT_REGISTRY = pint.UnitRegistry()
+
+@lru_cache(maxsize=None)
+def _unit_registry():
+    """the Pint registry is instantiated upon first product construction
+    rather than at import time (what costs a few hundred milliseconds)"""
+    import pint  # pylint: disable=import-outside-toplevel
+
+    return pint.UnitRegistry()
+
+
 _CAMEL_CASE_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![^A-Z])")
 
 
@@ -41,15 +49,16 @@ class Product:
 
     @staticmethod
     def _parse_unit(unit: str):
+        unit_registry = _unit_registry()
         if unit in ("%", "percent"):
-            return 0.01 * _UNIT_REGISTRY.dimensionless
+            return 0.01 * unit_registry.dimensionless
         if unit in ("PPB", "ppb"):
-            return PPB * _UNIT_REGISTRY.dimensionless
+            return PPB * unit_registry.dimensionless
         if unit in ("PPM", "ppm"):
-            return PPM * _UNIT_REGISTRY.dimensionless
+            return PPM * unit_registry.dimensionless
         if unit in ("PPT", "ppt"):
-            return PPT * _UNIT_REGISTRY.dimensionless
-        return _UNIT_REGISTRY.parse_expression(unit)
+            return PPT * unit_registry.dimensionless
+        return unit_registry.parse_expression(unit)
 
     @staticmethod
     def _camel_case_to_words(string: str):
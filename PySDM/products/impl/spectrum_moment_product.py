@@ -5,13 +5,32 @@ common code for products computing **binned** statistical moments
 
 from abc import ABC
 
+import numpy as np
+
 from PySDM.products.impl.product import Product
 
 
+def bins_spacing(edges, rtol=1e-9):
+    """classifies bin edges as `"linear"` or `"logarithmic"` (uniformly spaced)
+    or as `"monotonic"` (increasing); returns `None` otherwise"""
+    edges = np.asarray(edges, dtype=float)
+    if len(edges) < 2 or not np.all(np.diff(edges) > 0):
+        return None
+    widths = np.diff(edges)
+    if np.allclose(widths, widths[0], rtol=rtol, atol=0):
+        return "linear"
+    if edges[0] > 0:
+        log_widths = np.diff(np.log(edges))
+        if np.allclose(log_widths, log_widths[0], rtol=rtol, atol=0):
+            return "logarithmic"
+    return "monotonic"
+
+
 class SpectrumMomentProduct(ABC, Product):
     def __init__(self, name, unit, attr_unit):
         super().__init__(name=name, unit=unit)
         self.attr_bins_edges = None
+        self.attr_bins_spacing = None
         self.attr_unit = attr_unit
         self.moment_0 = None
         self.moments = None
@@ -25,6 +44,7 @@ class SpectrumMomentProduct(ABC, Product):
             (len(self.attr_bins_edges) - 1, self.particulator.mesh.n_cell), dtype=float
         )
         _ = self._parse_unit(self.attr_unit)
+        self.attr_bins_spacing = bins_spacing(self.attr_bins_edges.to_ndarray())
 
     def _recalculate_spectrum_moment(
         self,
@@ -44,6 +64,7 @@ class SpectrumMomentProduct(ABC, Product):
             attr_name=filter_attr,
             weighting_attribute=weighting_attribute,
             weighting_rank=weighting_rank,
+            attr_bins_spacing=self.attr_bins_spacing,
         )
 
     def _download_spectrum_moment_to_buffer(self, rank, bin_number):
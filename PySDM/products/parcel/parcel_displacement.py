@@ -1,8 +1,9 @@
 """
-parcel displacement, for use with `PySDM.environments.parcel.Parcel` environment only
+parcel displacement, for use with `PySDM.environments.parcel.Parcel`
+ and `PySDM.environments.parcel_ensemble.ParcelEnsemble` environments only
 """
 
-from PySDM.environments import Parcel
+from PySDM.environments import Parcel, ParcelEnsemble
 from PySDM.products.impl.product import Product
 
 
@@ -13,7 +14,7 @@ class ParcelDisplacement(Product):
 
     def register(self, builder):
         super().register(builder)
-        assert isinstance(builder.particulator.environment, Parcel)
+        assert isinstance(builder.particulator.environment, (Parcel, ParcelEnsemble))
         self.environment = builder.particulator.environment
 
     def _impl(self, **kwargs):
@@ -38,5 +38,5 @@ class NumberSizeSpectrum(SpectrumMomentProduct):
             self._download_spectrum_moment_to_buffer(rank=0, bin_number=i)
             vals[:, i] = self.buffer.ravel()
 
-        vals *= 1 / self.particulator.mesh.dv
+        vals *= 1 / np.reshape(self.particulator.mesh.dv, (-1, 1))
         return vals
@@ -41,5 +41,9 @@ class ParticleVolumeVersusRadiusLogarithmSpectrum(SpectrumMomentProduct):
             self._download_spectrum_moment_to_buffer(rank=0, bin_number=i)
             vals[:, i] *= self.buffer.ravel()
 
-        vals *= 1 / np.diff(np.log(self.radius_bins_edges)) / self.particulator.mesh.dv
+        vals *= (
+            1
+            / np.diff(np.log(self.radius_bins_edges))
+            / np.reshape(self.particulator.mesh.dv, (-1, 1))
+        )
         return vals
@@ -0,0 +1,4 @@
+"""
+asv-style performance benchmarks (classes with `setup()` and `time_*()` methods,
+ parameterised through `params` and `param_names` attributes)
+"""
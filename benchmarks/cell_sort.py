@@ -0,0 +1,57 @@
+"""
+full counting sort vs. incremental patching of the cell-sorted super-droplet index
+ for different fractions of particles changing cells between the calls,
+ run with `python -m benchmarks.cell_sort`
+"""
+
+import timeit
+
+import numpy as np
+
+from PySDM.backends import CPU
+from PySDM.backends.impl_common.index import make_Index
+from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
+
+
+class TimeCellSort:
+    params = ((2**16, 2**20), (0.0, 0.01, 0.05), ("default", "incremental"))
+    param_names = ("n_sd", "moved_fraction", "scheme")
+    n_cell = 2**10
+
+    def setup(self, n_sd, moved_fraction, scheme):
+        # pylint: disable=attribute-defined-outside-init
+        backend = CPU()
+        rng = np.random.default_rng(seed=44)
+        self.idx = make_Index(backend).identity_index(n_sd)
+        self.cell_id = make_IndexedStorage(backend).from_ndarray(
+            self.idx, np.sort(rng.integers(0, self.n_cell, size=n_sd))
+        )
+        self.cell_idx = make_Index(backend).identity_index(self.n_cell)
+        self.cell_start = backend.Storage.from_ndarray(
+            np.zeros(self.n_cell + 1, dtype=int)
+        )
+        self.caretaker = backend.make_cell_caretaker(
+            self.idx.shape, self.idx.dtype, len(self.cell_start), scheme=scheme
+        )
+        self.moved = rng.choice(n_sd, size=int(moved_fraction * n_sd), replace=False)
+        self.time_sort(n_sd, moved_fraction, scheme)
+
+    def time_sort(self, *_):
+        cell_id = self.cell_id.data
+        cell_id[self.moved] = (cell_id[self.moved] + 1) % self.n_cell
+        self.caretaker(self.cell_id, self.cell_idx, self.cell_start, self.idx)
+
+
+def main(number=5):
+    bench = TimeCellSort()
+    print(f"{'n_sd':>10} {'moved':>6} {'scheme':>12} {'time [s]':>10}")
+    for n_sd in TimeCellSort.params[0]:
+        for moved_fraction in TimeCellSort.params[1]:
+            for scheme in TimeCellSort.params[2]:
+                bench.setup(n_sd, moved_fraction, scheme)
+                time = min(timeit.repeat(bench.time_sort, number=1, repeat=number))
+                print(f"{n_sd:>10} {moved_fraction:>6} {scheme:>12} {time:>10.5f}")
+
+
+if __name__ == "__main__":
+    main()
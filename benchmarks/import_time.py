@@ -0,0 +1,39 @@
+"""
+wall time of importing PySDM (and of its backends) in a fresh interpreter,
+ run with `python -m benchmarks.import_time`
+"""
+
+import subprocess
+import sys
+import timeit
+
+STATEMENTS = {
+    "PySDM": "import PySDM",
+    "CPU": "from PySDM.backends import CPU",
+    "GPU": "from PySDM.backends import GPU",
+}
+
+
+def main(number=5):
+    print(f"{'target':>10} {'time [s]':>10}")
+    for target, statement in STATEMENTS.items():
+        time = min(
+            timeit.repeat(
+                lambda statement=statement: subprocess.run(
+                    (sys.executable, "-c", statement), check=True
+                ),
+                number=1,
+                repeat=number,
+            )
+        ) - min(
+            timeit.repeat(
+                lambda: subprocess.run((sys.executable, "-c", "pass"), check=True),
+                number=1,
+                repeat=number,
+            )
+        )
+        print(f"{target:>10} {time:>10.5f}")
+
+
+if __name__ == "__main__":
+    main()
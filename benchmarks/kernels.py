@@ -0,0 +1,429 @@
+"""
+hot kernels of the Numba backend (cell sort, shuffles, pair operations, collision
+ gamma, coalescence and breakup, condensation solver, moments, spectrum moments
+ and displacement) swept over the number of super-droplets, the number of cells
+ and the number of threads; run with `python -m benchmarks.kernels` which prints
+ a table and, with `--output results.json`, saves the timings in a JSON file
+ that can be passed as `--compare` to a subsequent run to report regressions
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+
+import numba
+import numpy as np
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Collision, Condensation
+from PySDM.dynamics.collisions.breakup_efficiencies import ConstEb
+from PySDM.dynamics.collisions.breakup_fragmentations import AlwaysN
+from PySDM.dynamics.collisions.coalescence_efficiencies import ConstEc
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box, ParcelEnsemble
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Exponential
+from PySDM.physics import si
+
+N_SD = (2**14, 2**18)
+N_CELL = (1, 2**4, 2**8)
+N_THREADS = tuple(
+    sorted({1, numba.config.NUMBA_NUM_THREADS})  # pylint: disable=no-member
+)
+
+
+def _particulator(n_sd, n_cell, dynamics=()):
+    """a particulator with `n_cell` independent boxes (cells) of `n_sd // n_cell`
+    droplets each, featuring the given `dynamics`"""
+    env = Box(dt=1 * si.s, dv=1 * si.m**3)
+    env.mesh = Mesh(
+        grid=(n_cell,), size=(), n_cell=n_cell, dv=env.mesh.dv, n_dims=0, strides=(-1,)
+    )
+    builder = Builder(n_sd=n_sd, backend=CPU(Formulae(seed=44)), environment=env)
+    for dynamic in dynamics:
+        builder.add_dynamic(dynamic)
+    volume, multiplicity = ConstantMultiplicity(
+        Exponential(norm_factor=2**23, scale=4.1888 * si.um**3)
+    ).sample(n_sd // n_cell)
+    return builder.build(
+        attributes={
+            "volume": np.tile(volume, n_cell),
+            "multiplicity": np.tile(multiplicity, n_cell),
+            "cell id": np.repeat(np.arange(n_cell), n_sd // n_cell),
+        }
+    )
+
+
+def _parcels(n_sd, n_cell, dynamics=()):
+    """a particulator with `n_cell` independent parcels (cells) of `n_sd // n_cell`
+    aerosol particles each, featuring the given `dynamics`"""
+    env = ParcelEnsemble(
+        dt=1 * si.s,
+        n_members=n_cell,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        initial_water_vapour_mixing_ratio=20 * si.g / si.kg,
+        T0=np.linspace(295, 300, n_cell) * si.K,
+        w=1 * si.m / si.s,
+    )
+    builder = Builder(n_sd=n_sd, backend=CPU(Formulae(seed=44)), environment=env)
+    for dynamic in dynamics:
+        builder.add_dynamic(dynamic)
+    n_sd_per_cell = n_sd // n_cell
+    r_dry = np.random.default_rng(seed=44).lognormal(
+        mean=np.log(50 * si.nm), sigma=np.log(1.6), size=n_sd_per_cell
+    )
+    return builder.build(
+        attributes=env.init_attributes(
+            n_in_dv=np.full(n_sd_per_cell, 1e8 / n_sd_per_cell),
+            kappa=0.5,
+            r_dry=r_dry,
+        )
+    )
+
+
+class _KernelBenchmark:
+    params = (N_SD, N_CELL, N_THREADS)
+    param_names = ("n_sd", "n_cell", "n_threads")
+
+    def setup(self, n_sd, n_cell, n_threads):
+        numba.set_num_threads(n_threads)
+        self._setup(n_sd, n_cell)
+        for name in time_methods(type(self)):  # just-in-time compilation
+            getattr(self, name)(n_sd, n_cell, n_threads)
+
+    def teardown(self, *_):
+        numba.set_num_threads(
+            numba.config.NUMBA_NUM_THREADS  # pylint: disable=no-member
+        )
+
+    def _setup(self, n_sd, n_cell):
+        raise NotImplementedError()
+
+
+class TimeSortAndShuffle(_KernelBenchmark):
+    def _setup(self, n_sd, n_cell):
+        # pylint: disable=attribute-defined-outside-init
+        self.particulator = _particulator(n_sd, n_cell)
+        self.u01 = self.particulator.Storage.from_ndarray(
+            np.random.default_rng(seed=44).uniform(size=n_sd)
+        )
+
+    def time_counting_sort(self, *_):
+        self.particulator.attributes.reset_cell_idx()
+
+    def time_shuffle_local(self, *_):
+        self.particulator.attributes.permutation(self.u01, local=True)
+
+    def time_shuffle_global(self, *_):
+        self.particulator.attributes.permutation(self.u01, local=False, parallel=True)
+        self.particulator.attributes.reset_cell_idx()
+
+
+class TimeCollisions(_KernelBenchmark):
+    """pair operations, gamma and the coalescence/breakup bodies with the state
+    left by a single collision step (candidate pairs and probabilities)"""
+
+    def _setup(self, n_sd, n_cell):
+        # pylint: disable=attribute-defined-outside-init
+        self.particulator = _particulator(
+            n_sd,
+            n_cell,
+            dynamics=(
+                Collision(
+                    collision_kernel=Golovin(b=1.5e3 / si.s),
+                    coalescence_efficiency=ConstEc(Ec=0.5),
+                    breakup_efficiency=ConstEb(Eb=1),
+                    fragmentation_function=AlwaysN(n=2),
+                    adaptive=False,
+                    warn_overflows=False,
+                ),
+            ),
+        )
+        self.collision = self.particulator.dynamics["Collision"]
+        self.collision.step()
+        self.prob = self.particulator.PairwiseStorage.from_ndarray(
+            self.collision.kernel_temp.to_ndarray()
+        )
+        self.rand = self.particulator.Storage.from_ndarray(
+            np.random.default_rng(seed=44).uniform(size=n_sd // 2)
+        )
+
+    def time_find_pairs(self, *_):
+        self.collision.is_first_in_pair.update(
+            self.particulator.attributes.cell_start,
+            self.particulator.attributes.cell_idx,
+            self.particulator.attributes["cell id"],
+        )
+
+    def time_sum_pair(self, *_):
+        self.collision.kernel_temp.sum(
+            self.particulator.attributes["water mass"], self.collision.is_first_in_pair
+        )
+
+    def time_max_pair(self, *_):
+        self.collision.kernel_temp.max(
+            self.particulator.attributes["multiplicity"],
+            self.collision.is_first_in_pair,
+        )
+
+    def time_compute_gamma(self, *_):
+        self.particulator.backend.compute_gamma(
+            prob=self.prob,
+            rand=self.rand,
+            multiplicity=self.particulator.attributes["multiplicity"],
+            cell_id=self.particulator.attributes["cell id"],
+            collision_rate_deficit=self.collision.collision_rate_deficit,
+            collision_rate=self.collision.collision_rate,
+            is_first_in_pair=self.collision.is_first_in_pair,
+            out=self.collision.gamma,
+        )
+
+    def _coalescence_breakup(self, enable_breakup):
+        collision = self.collision
+        self.particulator.collision_coalescence_breakup(
+            enable_breakup=enable_breakup,
+            gamma=collision.gamma,
+            rand=self.rand,
+            Ec=collision.Ec_temp,
+            Eb=collision.Eb_temp,
+            fragment_mass=collision.fragment_mass,
+            coalescence_rate=collision.coalescence_rate,
+            breakup_rate=collision.breakup_rate,
+            breakup_rate_deficit=collision.breakup_rate_deficit,
+            is_first_in_pair=collision.is_first_in_pair,
+            warn_overflows=False,
+            max_multiplicity=collision.max_multiplicity,
+        )
+
+    def time_coalescence(self, *_):
+        self._coalescence_breakup(enable_breakup=False)
+
+    def time_coalescence_breakup(self, *_):
+        self._coalescence_breakup(enable_breakup=True)
+
+    def time_step(self, *_):
+        self.collision.step()
+
+
+class TimeCondensation(_KernelBenchmark):
+    """a timestep of the condensation solver (including the per-cell adaptive
+    substepping) together with the ambient thermodynamics update"""
+
+    def _setup(self, n_sd, n_cell):
+        # pylint: disable=attribute-defined-outside-init
+        self.particulator = _parcels(
+            n_sd, n_cell, dynamics=(AmbientThermodynamics(), Condensation())
+        )
+
+    def time_condensation(self, *_):
+        self.particulator.run(1)
+
+
+class TimeMoments(_KernelBenchmark):
+    n_bins = 64
+
+    def _setup(self, n_sd, n_cell):
+        # pylint: disable=attribute-defined-outside-init
+        self.particulator = _particulator(n_sd, n_cell)
+        self.moment_0 = self.particulator.Storage.empty(n_cell, dtype=float)
+        self.moments = self.particulator.Storage.empty((3, n_cell), dtype=float)
+        self.spectrum_moment_0 = self.particulator.Storage.empty(
+            (self.n_bins, n_cell), dtype=float
+        )
+        self.spectrum_moments = self.particulator.Storage.empty(
+            (self.n_bins, n_cell), dtype=float
+        )
+        self.bins = self.particulator.Storage.from_ndarray(
+            np.logspace(-24, -12, self.n_bins + 1)
+        )
+
+    def time_moments(self, *_):
+        self.particulator.moments(
+            moment_0=self.moment_0,
+            moments=self.moments,
+            specs={"water mass": (1, 2, 3)},
+        )
+
+    def time_spectrum_moments(self, *_):
+        self.particulator.spectrum_moments(
+            moment_0=self.spectrum_moment_0,
+            moments=self.spectrum_moments,
+            attr="water mass",
+            rank=1,
+            attr_bins=self.bins,
+            attr_bins_spacing="logarithmic",
+        )
+
+
+class TimeDisplacement(_KernelBenchmark):
+    """displacement in both directions on a square 2D Arakawa-C grid"""
+
+    def _setup(self, n_sd, n_cell):
+        # pylint: disable=attribute-defined-outside-init
+        self.backend = CPU()
+        rng = np.random.default_rng(seed=44)
+        grid = (int(np.sqrt(n_cell)), n_cell // int(np.sqrt(n_cell)))
+        self.courant = tuple(
+            self.backend.Storage.from_ndarray(
+                rng.uniform(
+                    -0.5, 0.5, size=tuple(n + (d == dim) for d, n in enumerate(grid))
+                )
+            )
+            for dim in range(2)
+        )
+        self.cell_origin = self.backend.Storage.from_ndarray(
+            np.stack([rng.integers(0, n, size=n_sd) for n in grid])
+        )
+        self.position_in_cell = self.backend.Storage.from_ndarray(
+            rng.uniform(size=(2, n_sd))
+        )
+        self.displacement = self.backend.Storage.empty((2, n_sd), dtype=float)
+
+    def time_displacement(self, *_):
+        for dim, courant in enumerate(self.courant):
+            self.backend.calculate_displacement(
+                dim=dim,
+                displacement=self.displacement,
+                courant=courant,
+                cell_origin=self.cell_origin,
+                position_in_cell=self.position_in_cell,
+                n_substeps=1,
+            )
+
+
+BENCHMARKS = (
+    TimeSortAndShuffle,
+    TimeCollisions,
+    TimeCondensation,
+    TimeMoments,
+    TimeDisplacement,
+)
+
+
+def time_methods(cls):
+    return tuple(name for name in dir(cls) if name.startswith("time_"))
+
+
+def machine_info():
+    try:
+        commit = subprocess.run(
+            ("git", "rev-parse", "HEAD"),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": numba.__version__,
+        "max_threads": numba.config.NUMBA_NUM_THREADS,  # pylint: disable=no-member
+    }
+
+
+def run(*, n_sd=N_SD, n_cell=N_CELL, n_threads=N_THREADS, pattern="", repeat=5):
+    """returns a list of results (benchmark name, parameters and the minimum
+    and median of `repeat` timings in seconds) for benchmarks with names
+    containing `pattern`"""
+    results = []
+    for cls in BENCHMARKS:
+        names = [
+            name for name in time_methods(cls) if pattern in f"{cls.__name__}.{name}"
+        ]
+        if not names:
+            continue
+        bench = cls()
+        for params in (
+            (a, b, c) for a in n_sd for b in n_cell for c in n_threads if a >= b
+        ):
+            bench.setup(*params)
+            for name in names:
+                times = timeit.repeat(
+                    lambda bench=bench, name=name, params=params: getattr(bench, name)(
+                        *params
+                    ),
+                    number=1,
+                    repeat=repeat,
+                )
+                results.append(
+                    {
+                        "benchmark": f"{cls.__name__}.{name}",
+                        "params": dict(zip(cls.param_names, params)),
+                        "min": min(times),
+                        "median": float(np.median(times)),
+                    }
+                )
+            bench.teardown(*params)
+    return results
+
+
+def _key(result):
+    return result["benchmark"], tuple(sorted(result["params"].items()))
+
+
+def compare(results, baseline, threshold):
+    """returns `(result, ratio)` pairs for results slower than in `baseline`
+    by more than a factor of `threshold` (comparing the minimum timings)"""
+    reference = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        if _key(result) in reference:
+            ratio = result["min"] / reference[_key(result)]["min"]
+            if ratio > threshold:
+                regressions.append((result, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="JSON file to save the results to")
+    parser.add_argument("--compare", help="JSON file with baseline results")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    parser.add_argument("--filter", default="", help="benchmark name substring")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--n-sd", type=int, nargs="+", default=N_SD)
+    parser.add_argument("--n-cell", type=int, nargs="+", default=N_CELL)
+    parser.add_argument("--n-threads", type=int, nargs="+", default=N_THREADS)
+    args = parser.parse_args(argv)
+
+    results = run(
+        n_sd=args.n_sd,
+        n_cell=args.n_cell,
+        n_threads=args.n_threads,
+        pattern=args.filter,
+        repeat=args.repeat,
+    )
+    print(
+        f"{'benchmark':>45} {'n_sd':>8} {'n_cell':>6} {'threads':>7} {'time [s]':>10}"
+    )
+    for result in results:
+        params = result["params"]
+        print(
+            f"{result['benchmark']:>45} {params['n_sd']:>8} {params['n_cell']:>6}"
+            f" {params['n_threads']:>7} {result['min']:>10.5f}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"info": machine_info(), "results": results}, file, indent=1)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for result, ratio in regressions:
+            print(f"REGRESSION {result['benchmark']} {result['params']}: x{ratio:.2f}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
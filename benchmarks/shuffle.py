@@ -0,0 +1,50 @@
+"""
+serial (Fisher-Yates) vs. parallel (random-key bucket sort) global shuffle
+ of the super-droplet index, run with `python -m benchmarks.shuffle`
+"""
+
+import timeit
+
+import numpy as np
+
+from PySDM.backends import CPU
+from PySDM.backends.impl_common.index import make_Index
+
+
+class TimeShuffleGlobal:
+    params = ((2**14, 2**18, 2**22), (False, True))
+    param_names = ("n_sd", "parallel")
+
+    def setup(self, n_sd, parallel):
+        # pylint: disable=attribute-defined-outside-init
+        self.backend = CPU()
+        self.idx = make_Index(self.backend).identity_index(n_sd)
+        self.u01 = self.backend.Storage.from_ndarray(
+            np.random.default_rng(seed=44).uniform(size=n_sd)
+        )
+        self.time_shuffle(n_sd, parallel)
+
+    def time_shuffle(self, n_sd, parallel):  # pylint: disable=unused-argument
+        self.idx.shuffle(self.u01, parallel=parallel)
+
+
+def main(number=5):
+    bench = TimeShuffleGlobal()
+    print(f"{'n_sd':>10} {'parallel':>8} {'time [s]':>10}")
+    for n_sd in TimeShuffleGlobal.params[0]:
+        for parallel in TimeShuffleGlobal.params[1]:
+            bench.setup(n_sd, parallel)
+            time = min(
+                timeit.repeat(
+                    lambda n_sd=n_sd, parallel=parallel: bench.time_shuffle(
+                        n_sd, parallel
+                    ),
+                    number=1,
+                    repeat=number,
+                )
+            )
+            print(f"{n_sd:>10} {str(parallel):>8} {time:>10.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+linear-scan vs. bisection vs. closed-form bin lookup in spectrum moment
+ computation, run with `python -m benchmarks.spectrum_moments`
+"""
+
+import timeit
+
+import numpy as np
+
+from PySDM.backends import CPU
+
+
+class TimeSpectrumMoments:
+    params = ((2**14, 2**18), (32, 256), (None, "monotonic", "logarithmic"))
+    param_names = ("n_sd", "n_bins", "spacing")
+
+    def setup(self, n_sd, n_bins, spacing):
+        # pylint: disable=attribute-defined-outside-init
+        backend = CPU()
+        rng = np.random.default_rng(seed=44)
+        n_cell = 4
+        x_attr = rng.lognormal(mean=np.log(1e-15), sigma=2, size=n_sd)
+        cell_id = np.sort(rng.integers(0, n_cell, size=n_sd))
+        self.moment_0 = backend.Storage.empty((n_bins, n_cell), dtype=float)
+        self.moments = backend.Storage.empty((n_bins, n_cell), dtype=float)
+        self.kw_args = {
+            "multiplicity": backend.Storage.from_ndarray(np.ones(n_sd, dtype=int)),
+            "attr_data": backend.Storage.from_ndarray(x_attr),
+            "cell_id": backend.Storage.from_ndarray(cell_id),
+            "idx": backend.Storage.from_ndarray(np.arange(n_sd)),
+            "cell_start": backend.Storage.from_ndarray(
+                np.searchsorted(cell_id, np.arange(n_cell + 1))
+            ),
+            "length": n_sd,
+            "rank": 1,
+            "x_bins": backend.Storage.from_ndarray(
+                np.logspace(-21, -9, num=n_bins + 1)
+            ),
+            "x_attr": backend.Storage.from_ndarray(x_attr),
+            "weighting_attribute": backend.Storage.from_ndarray(x_attr),
+            "weighting_rank": 0,
+            "x_bins_spacing": spacing,
+        }
+        self.backend = backend
+        self.time_spectrum_moments(n_sd, n_bins, spacing)
+
+    def time_spectrum_moments(self, n_sd, n_bins, spacing):
+        # pylint: disable=unused-argument
+        self.backend.spectrum_moments(
+            moment_0=self.moment_0, moments=self.moments, **self.kw_args
+        )
+
+
+def main(number=5):
+    bench = TimeSpectrumMoments()
+    print(f"{'n_sd':>10} {'n_bins':>6} {'spacing':>12} {'time [s]':>10}")
+    for n_sd in TimeSpectrumMoments.params[0]:
+        for n_bins in TimeSpectrumMoments.params[1]:
+            for spacing in TimeSpectrumMoments.params[2]:
+                bench.setup(n_sd, n_bins, spacing)
+                time = min(
+                    timeit.repeat(
+                        lambda n_sd=n_sd, n_bins=n_bins, spacing=spacing: (
+                            bench.time_spectrum_moments(n_sd, n_bins, spacing)
+                        ),
+                        number=1,
+                        repeat=number,
+                    )
+                )
+                print(f"{n_sd:>10} {n_bins:>6} {str(spacing):>12} {time:>10.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,13 @@
-import importlib
-
+import numba
 from matplotlib import pyplot as plt
 from PySDM_examples.Arabas_et_al_2015 import Settings
 from PySDM_examples.Szumowski_et_al_1998 import Simulation, Storage
 
-import PySDM.backends.impl_numba.conf
 from PySDM import Formulae
 from PySDM.backends import CPU, GPU
 from PySDM.products import WallTime
 
 
-def reload_cpu_backend():
-    importlib.reload(PySDM.backends.impl_numba.methods.collisions_methods)
-    importlib.reload(PySDM.backends.impl_numba.methods.displacement_methods)
-    importlib.reload(PySDM.backends.impl_numba.methods.moments_methods)
-    importlib.reload(PySDM.backends.impl_numba.methods.index_methods)
-    importlib.reload(PySDM.backends.impl_numba.methods.pair_methods)
-    importlib.reload(PySDM.backends.impl_numba.methods.physics_methods)
-    importlib.reload(PySDM.backends.impl_numba.methods.chemistry_methods)
-    importlib.reload(PySDM.backends.impl_numba.storage_impl)
-    importlib.reload(PySDM.backends.impl_numba.atomic_operations)
-    importlib.reload(PySDM.backends)
-
-
 def main():
     settings = Settings(Formulae())
 
@@ -42,14 +27,13 @@ def main():
     n_sd = range(14, 16, 1)
 
     times = {}
-    backends = [(CPU, "sync"), (CPU, "async")]
+    max_threads = numba.config.NUMBA_NUM_THREADS
+    backends = [(CPU, 1), (CPU, max_threads)]
     if GPU.ENABLE:
-        backends.append((GPU, "async"))
-    for backend, mode in backends:
-        if backend is CPU:
-            PySDM.backends.impl_numba.conf.NUMBA_PARALLEL = mode
-            reload_cpu_backend()
-        key = f"{backend} (mode={mode})"
+        backends.append((GPU, max_threads))
+    for backend, n_threads in backends:
+        numba.set_num_threads(n_threads)
+        key = f"{backend} (threads={n_threads})"
         times[key] = []
         for sd in n_sd:
             settings.n_sd_per_gridbox = sd
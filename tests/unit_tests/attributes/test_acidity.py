@@ -55,6 +55,7 @@ class TestAcidity:
             # output
             do_chemistry_flag=np.empty(1),
             pH=result,
+            n_iters=np.zeros(1, dtype=int),
             # params
             H_min=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_max),
             H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
@@ -148,6 +149,7 @@ class TestAcidity:
             # output
             do_chemistry_flag=np.empty(1),
             pH=actual_pH,
+            n_iters=np.zeros(1, dtype=int),
             # params
             H_min=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_max),
             H_max=FORMULAE.trivia.pH2H(aqueous_chemistry.DEFAULTS.pH_min),
@@ -0,0 +1,104 @@
+"""tests single-pass evaluation of the water-mass-derived attribute chain"""
+
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.environments import Box
+from PySDM.physics import si
+
+WATER_MASS = np.asarray([1 * si.ng, 1 * si.ug, 100 * si.ug, 1 * si.mg])
+
+
+def _make_particulator(fusion, *, requested, terminal_velocity="GunnKinzer1949"):
+    builder = Builder(
+        backend=CPU(Formulae(terminal_velocity=terminal_velocity)),
+        n_sd=WATER_MASS.size,
+        environment=Box(dt=None, dv=None),
+    )
+    builder.particulator.derived_attributes_fusion = fusion
+    for attr in requested:
+        builder.request_attribute(attr)
+    return builder.build(
+        attributes={
+            "water mass": WATER_MASS.copy(),
+            "multiplicity": np.ones_like(WATER_MASS),
+        }
+    )
+
+
+class TestFusedDerivedAttributes:
+    @staticmethod
+    @pytest.mark.parametrize("fusion", ("fused", "virtual"))
+    @pytest.mark.parametrize("terminal_velocity", ("GunnKinzer1949", "RogersYau"))
+    def test_values_match_unfused(fusion, terminal_velocity):
+        # arrange
+        names = ("volume", "radius", "terminal velocity")
+        particulators = {
+            key: _make_particulator(
+                key, requested=names, terminal_velocity=terminal_velocity
+            )
+            for key in (None, fusion)
+        }
+
+        for step in range(2):
+            # act
+            if step == 1:
+                for particulator in particulators.values():
+                    particulator.attributes["water mass"][:] = WATER_MASS[::-1]
+                    particulator.attributes.mark_updated("water mass")
+            values = {
+                key: {
+                    name: particulator.attributes[name].to_ndarray() for name in names
+                }
+                for key, particulator in particulators.items()
+            }
+
+            # assert
+            for name in names:
+                np.testing.assert_allclose(
+                    values[fusion][name], values[None][name], rtol=1e-12
+                )
+
+    @staticmethod
+    def test_virtual_intermediates_not_stored():
+        # arrange
+        particulator = _make_particulator("virtual", requested=("terminal velocity",))
+
+        # act
+        terminal_velocity = particulator.attributes["terminal velocity"].to_ndarray()
+
+        # assert
+        assert (terminal_velocity > 0).all()
+        for name in ("volume", "radius"):
+            with pytest.raises(ValueError):
+                _ = particulator.attributes[name]
+
+    @staticmethod
+    def test_intermediates_requested_by_non_members_are_stored():
+        # arrange
+        particulator = _make_particulator(
+            "virtual", requested=("terminal velocity", "square root of radius")
+        )
+
+        # act
+        radius = particulator.attributes["radius"].to_ndarray()
+
+        # assert
+        np.testing.assert_allclose(
+            radius, (WATER_MASS / (4 / 3 * np.pi * 1000 * si.kg / si.m**3)) ** (1 / 3)
+        )
+        with pytest.raises(ValueError):
+            _ = particulator.attributes["volume"]
+
+    @staticmethod
+    def test_radius_range_check():
+        # arrange
+        particulator = _make_particulator("fused", requested=("terminal velocity",))
+        particulator.attributes["water mass"][:] = 1 * si.g
+        particulator.attributes.mark_updated("water mass")
+
+        # act & assert
+        with pytest.raises(ValueError):
+            _ = particulator.attributes["terminal velocity"]
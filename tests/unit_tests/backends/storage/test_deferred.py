@@ -0,0 +1,111 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba import storage_expression
+
+DATA = np.asarray([-2.5, -1.0, 0.0, 0.5, 3.0, 7.25])
+
+
+def _chain(storage, tmp, other):
+    storage += 1.5
+    storage *= other
+    storage **= 0.5
+    storage -= other
+    storage /= 2
+    storage += (0.5, "*", other)
+    tmp.product(storage, 3)
+    tmp.floor()
+    storage.ratio(tmp, other)
+    storage.sum(storage, tmp)
+
+
+class TestDeferred:
+    @staticmethod
+    def test_deferred_chain_matches_eager():
+        # arrange
+        def run(deferred):
+            storage = CPU.Storage.from_ndarray(DATA)
+            tmp = CPU.Storage.empty(DATA.shape, dtype=float)
+            other = CPU.Storage.from_ndarray(np.arange(1, DATA.size + 1) * 1.0)
+            if deferred:
+                with CPU.Storage.deferred():
+                    _chain(storage, tmp, other)
+            else:
+                _chain(storage, tmp, other)
+            return storage.to_ndarray(), tmp.to_ndarray()
+
+        # act
+        expected = run(deferred=False)
+        actual = run(deferred=True)
+
+        # assert
+        for exp, act in zip(expected, actual):
+            np.testing.assert_allclose(act, exp, rtol=1e-14)
+
+    @staticmethod
+    def test_operations_fused_until_data_accessed():
+        # arrange
+        storage = CPU.Storage.from_ndarray(DATA)
+        other = CPU.Storage.from_ndarray(DATA)
+
+        with CPU.Storage.deferred():
+            # act
+            storage *= 2
+            storage -= other
+            storage **= 2
+
+            # assert
+            assert storage_expression.PENDING == [storage]
+            np.testing.assert_array_equal(storage._data, DATA)
+            np.testing.assert_array_equal(storage.to_ndarray(), np.sign(DATA) * DATA**2)
+            assert not storage_expression.PENDING
+
+    @staticmethod
+    @pytest.mark.parametrize("read_via_data", (False, True))
+    def test_operand_modified_after_being_used(read_via_data):
+        # arrange
+        storage = CPU.Storage.from_ndarray(DATA)
+        other = CPU.Storage.from_ndarray(DATA)
+
+        # act
+        with CPU.Storage.deferred():
+            other *= 2
+            storage += other
+            if read_via_data:
+                other.data[:] = 0
+            else:
+                other *= 3
+
+        # assert
+        np.testing.assert_array_equal(storage.to_ndarray(), 3 * DATA)
+
+    @staticmethod
+    def test_self_as_operand():
+        # arrange
+        storage = CPU.Storage.from_ndarray(DATA)
+
+        # act
+        with CPU.Storage.deferred():
+            storage += 1
+            storage *= storage
+
+        # assert
+        np.testing.assert_array_equal(storage.to_ndarray(), (DATA + 1) ** 2)
+
+    @staticmethod
+    def test_non_float_and_2d_storages_evaluated_eagerly():
+        # arrange
+        ints = CPU.Storage.from_ndarray(np.arange(3))
+        rows = CPU.Storage.from_ndarray(np.ones((2, 3)))
+
+        with CPU.Storage.deferred():
+            # act
+            ints += 1
+            rows *= 2
+
+            # assert
+            assert not storage_expression.PENDING
+        np.testing.assert_array_equal(ints.to_ndarray(), np.arange(1, 4))
+        np.testing.assert_array_equal(rows.to_ndarray(), np.full((2, 3), 2))
@@ -1,11 +1,12 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 import numpy as np
+import pytest
 
 from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 
 
-class TestIndex:  # pylint: disable=too-few-public-methods
+class TestIndex:
     @staticmethod
     def test_remove_zero_n_or_flagged(backend_class):
         # Arrange
@@ -25,3 +26,22 @@ class TestIndex:  # pylint: disable=too-few-public-methods
         assert (
             backend.Storage.to_ndarray(data)[idx.to_ndarray()[: len(idx)]] > 0
         ).all()
+
+    @staticmethod
+    @pytest.mark.parametrize("n_sd", (0, 1, 44, 3333))
+    @pytest.mark.parametrize("length_delta", (0, 1))
+    def test_shuffle_global_parallel(backend_class, n_sd, length_delta):
+        # Arrange
+        backend = backend_class()
+        u01 = np.random.default_rng(seed=44).uniform(size=n_sd)
+        length = max(0, n_sd - length_delta)
+        idx = make_Index(backend).from_ndarray(np.arange(n_sd)[::-1].copy())
+        idx.length = backend.Storage.INT(length)
+        expected = idx.to_ndarray()
+        expected[:length] = expected[:length][np.argsort(u01[:length], kind="stable")]
+
+        # Act
+        idx.shuffle(backend.Storage.from_ndarray(u01), parallel=True)
+
+        # Assert
+        np.testing.assert_array_equal(idx.to_ndarray(), expected)
@@ -206,7 +206,12 @@ class TestCollisionMethods:
     @staticmethod
     @pytest.mark.parametrize(
         "backend_class, scheme",
-        ((CPU, "counting_sort"), (CPU, "counting_sort_parallel"), (GPU, "default")),
+        (
+            (CPU, "counting_sort"),
+            (CPU, "counting_sort_parallel"),
+            (CPU, "incremental"),
+            (GPU, "default"),
+        ),
     )
     def test_cell_caretaker(backend_class, scheme):
         # Arrange
@@ -235,3 +240,42 @@ class TestCollisionMethods:
 
         # Assert
         assert all(cell_start.to_ndarray()[:] == np.array([0, 3]))
+
+    @staticmethod
+    @pytest.mark.parametrize("n_moved", (0, 1, 5, 20, 150))
+    @pytest.mark.parametrize("balanced", (False, True))
+    def test_incremental_cell_caretaker(n_moved, balanced):
+        # Arrange
+        n_sd, n_cell = 200, 7
+        rng = np.random.default_rng(seed=44)
+        backend = CPU()
+        idx = make_Index(backend).from_ndarray(rng.permutation(n_sd))
+        cell_id = make_IndexedStorage(backend).from_ndarray(
+            idx, rng.integers(0, n_cell, size=n_sd)
+        )
+        cell_idx = make_Index(backend).identity_index(n_cell)
+        cell_start = backend.Storage.from_ndarray(np.zeros(n_cell + 1, dtype=int))
+        sut = backend.make_cell_caretaker(
+            idx.shape, idx.dtype, len(cell_start), scheme="incremental"
+        )
+        sut(cell_id, cell_idx, cell_start, idx)
+
+        moved = rng.choice(n_sd, size=n_moved, replace=False)
+        if balanced:
+            cell_id.data[moved] = cell_id.data[np.roll(moved, 1)]
+        else:
+            cell_id.data[moved] = (cell_id.data[moved] + 1) % n_cell
+        expected_cell_start = np.concatenate(
+            ((0,), np.cumsum(np.bincount(cell_id.data, minlength=n_cell)))
+        )
+
+        # Act
+        sut(cell_id, cell_idx, cell_start, idx)
+
+        # Assert
+        np.testing.assert_array_equal(cell_start.to_ndarray(), expected_cell_start)
+        np.testing.assert_array_equal(np.sort(idx.to_ndarray()), np.arange(n_sd))
+        for cell in range(n_cell):
+            np.testing.assert_array_equal(
+                cell_id.data[idx.data[cell_start[cell] : cell_start[cell + 1]]], cell
+            )
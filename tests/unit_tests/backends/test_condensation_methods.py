@@ -0,0 +1,173 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numba
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.backends.impl_numba.condensation_solver import make_droplet_invariants
+from PySDM.backends.impl_numba.conf import JIT_FLAGS
+from PySDM.backends.impl_numba.methods.condensation_methods import (
+    _Attributes,
+    _CellData,
+    _Counters,
+    _RelativeTolerances,
+)
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.physics import si
+
+N_SD_IN_CELL = np.asarray([3, 0, 1, 7, 2, 2])
+N_CELL = len(N_SD_IN_CELL)
+
+
+@numba.njit
+def _fake_solver(
+    attributes,
+    cell_idx,
+    thd,
+    water_vapour_mixing_ratio,
+    rhod,
+    dthd_dt,
+    d_water_vapour_mixing_ratio__dt,
+    drhod_dt,
+    m_d,
+    air_density,
+    air_dynamic_viscosity,
+    rtols,
+    timestep,
+    n_substeps,
+):  # pylint: disable=unused-argument,too-many-arguments
+    n_substeps = 1 + int(thd) * len(cell_idx)
+    return (
+        True,
+        water_vapour_mixing_ratio,
+        thd + 1,
+        n_substeps,
+        0,
+        0,
+        0,
+        rhod,
+        0,
+    )
+
+
+def _condensation(*, n_threads, work_stealing):
+    cell_data_arrays = {
+        field: np.arange(N_CELL, dtype=float) for field in _CellData._fields
+    }
+    counters = _Counters(
+        **{field: np.zeros(N_CELL, dtype=int) for field in _Counters._fields[:-1]},
+        thread_load=np.full(n_threads, -1),
+    )
+    success = np.zeros(N_CELL, dtype=bool)
+    CPU._condensation(  # pylint: disable=protected-access
+        solver=_fake_solver,
+        n_threads=n_threads,
+        n_cell=N_CELL,
+        cell_start_arg=np.concatenate(((0,), np.cumsum(N_SD_IN_CELL))),
+        attributes=_Attributes(*(np.empty(0),) * len(_Attributes._fields)),
+        cell_data=_CellData(**{**cell_data_arrays, "dv_mean": np.ones(N_CELL)}),
+        idx=np.arange(np.sum(N_SD_IN_CELL)),
+        rtols=_RelativeTolerances(x=1e-6, thd=1e-6),
+        timestep=1.0,
+        counters=counters,
+        cell_order=np.argsort(-N_SD_IN_CELL, kind="stable"),
+        work_stealing=work_stealing,
+        RH_max=np.empty(N_CELL),
+        success=success,
+    )
+    return counters, cell_data_arrays, success
+
+
+class TestCondensationMethods:
+    @staticmethod
+    @pytest.mark.parametrize("n_threads", (1, 2, 3))
+    @pytest.mark.parametrize("work_stealing", (False, True))
+    def test_each_non_empty_cell_solved_once(n_threads, work_stealing):
+        # act
+        counters, cell_data, success = _condensation(
+            n_threads=n_threads, work_stealing=work_stealing
+        )
+
+        # assert
+        non_empty = N_SD_IN_CELL > 0
+        np.testing.assert_array_equal(success, non_empty)
+        np.testing.assert_array_equal(cell_data["pthd"], np.arange(N_CELL) + non_empty)
+        np.testing.assert_array_equal(
+            counters.n_substeps,
+            np.where(non_empty, 1 + np.arange(N_CELL) * N_SD_IN_CELL, 0),
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize("n_threads", (1, 2, 3))
+    @pytest.mark.parametrize("work_stealing", (False, True))
+    def test_thread_load(n_threads, work_stealing):
+        # act
+        counters, _, _ = _condensation(n_threads=n_threads, work_stealing=work_stealing)
+
+        # assert
+        assert (counters.thread_load >= 0).all()
+        assert np.sum(counters.thread_load) == np.sum(
+            counters.n_substeps * N_SD_IN_CELL
+        )
+
+    @staticmethod
+    def test_droplet_parallel_solver_matches_cell_parallel_one():
+        # arrange
+        n_sd = 64
+        water_mass = {}
+        for parallel_droplets in (False, True):
+            env = Parcel(
+                dt=1 * si.s,
+                mass_of_dry_air=1 * si.kg,
+                p0=1000 * si.hPa,
+                initial_water_vapour_mixing_ratio=20 * si.g / si.kg,
+                T0=300 * si.K,
+                w=1 * si.m / si.s,
+            )
+            builder = Builder(n_sd=n_sd, backend=CPU(), environment=env)
+            builder.add_dynamic(AmbientThermodynamics())
+            builder.add_dynamic(Condensation(parallel_droplets=parallel_droplets))
+            particulator = builder.build(
+                attributes=env.init_attributes(
+                    n_in_dv=np.full(n_sd, 1e8),
+                    kappa=0.5,
+                    r_dry=np.logspace(-2, 0, n_sd) * si.um,
+                )
+            )
+
+            # act
+            particulator.run(100)
+            water_mass[parallel_droplets] = particulator.attributes[
+                "water mass"
+            ].to_ndarray()
+
+        # assert
+        np.testing.assert_array_equal(water_mass[True], water_mass[False])
+
+    @staticmethod
+    def test_droplet_invariants():
+        # arrange
+        formulae = Formulae()
+        vdry = np.linspace(1, 2, 5) * si.um**3
+        attributes = _Attributes(
+            **{**{field: np.empty(0) for field in _Attributes._fields}, "vdry": vdry}
+        )
+        cell_idx = np.asarray([3, 1])
+        sut = make_droplet_invariants(
+            {**JIT_FLAGS, "parallel": False}, formulae.flatten
+        )
+
+        # act
+        invariants = sut(attributes, cell_idx)
+
+        # assert
+        np.testing.assert_allclose(
+            invariants.rd3, vdry[cell_idx] / formulae.constants.PI_4_3
+        )
+        np.testing.assert_allclose(
+            invariants.x_insane,
+            formulae.condensation_coordinate.x(vdry[cell_idx] / 100),
+        )
+        assert not invariants.RH_eq_cached.any()
@@ -0,0 +1,114 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Formulae
+from PySDM.backends.impl_numba.methods.chemistry_methods import ChemistryMethods
+from PySDM.backends.impl_numba.storage import Storage
+from PySDM.dynamics.impl.chemistry_utils import GASEOUS_COMPOUNDS
+from PySDM.physics import si
+from PySDM.physics.constants import PPB, PI_4_3
+
+formulae = Formulae()
+
+
+class SUT(ChemistryMethods):
+    def __init__(self):
+        self.formulae = formulae
+        super().__init__()
+
+
+N_SD_IN_CELL = np.asarray([3, 0, 2, 5])
+N_CELL = len(N_SD_IN_CELL)
+N_SD = np.sum(N_SD_IN_CELL)
+DV = 1 * si.m**3
+RHOD = 1 * si.kg / si.m**3
+
+
+def _dissolve(cell_order, system_type="closed"):
+    rng = np.random.default_rng(seed=44)
+    do_chemistry_flag = np.ones(N_SD, dtype=bool)
+    do_chemistry_flag[:3] = False  # none active in the first cell
+    mole_amounts = {
+        key: Storage.from_ndarray(np.zeros(N_SD)) for key in GASEOUS_COMPOUNDS
+    }
+    env_mixing_ratio = {
+        compound: np.full(N_CELL, 1 * PPB) for compound in GASEOUS_COMPOUNDS.values()
+    }
+    multiplicity = rng.integers(1e6, 1e8, size=N_SD)
+    SUT().dissolution(
+        n_cell=N_CELL,
+        cell_order=cell_order,
+        cell_start_arg=Storage.from_ndarray(
+            np.concatenate(((0,), np.cumsum(N_SD_IN_CELL)))
+        ),
+        idx=Storage.from_ndarray(np.arange(N_SD)),
+        do_chemistry_flag=Storage.from_ndarray(do_chemistry_flag),
+        mole_amounts=mole_amounts,
+        env_mixing_ratio=env_mixing_ratio,
+        env_T=Storage.from_ndarray(np.linspace(275, 285, N_CELL) * si.K),
+        env_p=Storage.from_ndarray(np.full(N_CELL, 900 * si.hPa)),
+        env_rho_d=Storage.from_ndarray(np.full(N_CELL, RHOD)),
+        dissociation_factors={
+            compound: Storage.from_ndarray(np.ones(N_SD))
+            for compound in GASEOUS_COMPOUNDS.values()
+        },
+        timestep=1 * si.s,
+        dv=DV,
+        system_type=system_type,
+        droplet_volume=Storage.from_ndarray(
+            PI_4_3 * rng.uniform(1 * si.um, 10 * si.um, size=N_SD) ** 3
+        ),
+        multiplicity=Storage.from_ndarray(multiplicity),
+    )
+    return (
+        {key: storage.to_ndarray() for key, storage in mole_amounts.items()},
+        env_mixing_ratio,
+        multiplicity,
+    )
+
+
+class TestDissolution:
+    @staticmethod
+    def test_result_independent_of_cell_order():
+        # act
+        expected = _dissolve(cell_order=np.arange(N_CELL))
+        actual = _dissolve(cell_order=np.arange(N_CELL)[::-1])
+
+        # assert
+        for expected_dict, actual_dict in zip(expected[:2], actual[:2]):
+            for key, value in expected_dict.items():
+                np.testing.assert_array_equal(actual_dict[key], value)
+
+    @staticmethod
+    @pytest.mark.parametrize("system_type", ("open", "closed"))
+    def test_all_cells_with_active_droplets_updated(system_type):
+        # act
+        mole_amounts, env_mixing_ratio, multiplicity = _dissolve(
+            cell_order=np.arange(N_CELL), system_type=system_type
+        )
+
+        # assert
+        cell_id = np.repeat(np.arange(N_CELL), N_SD_IN_CELL)
+        sut = SUT()
+        for key, compound in GASEOUS_COMPOUNDS.items():
+            assert (mole_amounts[key][:3] == 0).all()
+            assert (mole_amounts[key][3:] > 0).all()
+            delta_mr = (
+                np.bincount(
+                    cell_id,
+                    weights=multiplicity * mole_amounts[key],
+                    minlength=N_CELL,
+                )
+                * sut.specific_gravities[compound]
+                * formulae.constants.Md
+                / DV
+                / RHOD
+            )
+            assert (delta_mr[N_SD_IN_CELL > 0][1:] > 0).all()
+            if system_type == "closed":
+                np.testing.assert_allclose(
+                    env_mixing_ratio[compound], 1 * PPB - delta_mr, rtol=1e-10
+                )
+            else:
+                np.testing.assert_array_equal(env_mixing_ratio[compound], 1 * PPB)
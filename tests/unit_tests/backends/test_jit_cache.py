@@ -0,0 +1,97 @@
+"""
+unit tests for the content-addressed on-disk cache of JIT-compiled closures and formulae
+"""
+
+import numba
+import pytest
+
+from PySDM import Formulae
+from PySDM.backends.impl_numba import conf, jit_cache
+
+
+def _make_closure(factor, fastmath=True):
+    @jit_cache.njit(**{**conf.JIT_FLAGS, "parallel": False, "fastmath": fastmath})
+    def body(arg):
+        return factor * arg
+
+    return body
+
+
+@pytest.fixture(name="cache_dir")
+def cache_dir_fixture(tmp_path, monkeypatch):
+    if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+        pytest.skip("JIT disabled")
+    monkeypatch.setattr(conf, "JIT_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestJitCache:
+    @staticmethod
+    def test_closure_recreated_with_same_content_is_loaded_from_cache(cache_dir):
+        # arrange
+        first = _make_closure(factor=2.0)
+        assert first(1.0) == 2.0
+
+        # act
+        second = _make_closure(factor=2.0)
+        result = second(1.0)
+
+        # assert
+        assert result == 2.0
+        assert sum(first.stats.cache_misses.values()) == 1
+        assert sum(second.stats.cache_hits.values()) == 1
+        assert any(cache_dir.iterdir())
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs", ({"factor": 3.0}, {"factor": 2.0, "fastmath": False})
+    )
+    def test_closure_with_different_content_is_not_loaded_from_cache(
+        cache_dir, kwargs
+    ):  # pylint: disable=unused-argument
+        # arrange
+        assert _make_closure(factor=2.0)(1.0) == 2.0
+
+        # act
+        other = _make_closure(**kwargs)
+        result = other(1.0)
+
+        # assert
+        assert result == kwargs["factor"]
+        assert sum(other.stats.cache_hits.values()) == 0
+
+    @staticmethod
+    def test_formulae_fingerprint_depends_on_constants(cache_dir):
+        # pylint: disable=unused-argument,protected-access
+        # arrange
+        formulae = [Formulae(constants={"FWC_C0": c0}) for c0 in (610.0, 610.0, 611.0)]
+
+        # act
+        fingerprints = [
+            f.saturation_vapour_pressure.pvs_Celsius._cache._fingerprint
+            for f in formulae
+        ]
+
+        # assert
+        assert fingerprints[0] == fingerprints[1]
+        assert fingerprints[0] != fingerprints[2]
+
+    @staticmethod
+    def test_formula_loaded_from_cache(cache_dir):
+        # pylint: disable=unused-argument
+        # arrange
+        temperature = 10.0
+        formula = Formulae(
+            constants={"FWC_C0": 612.0}
+        ).saturation_vapour_pressure.pvs_Celsius
+        expected = formula(temperature)
+
+        # act
+        reloaded = jit_cache.njit(
+            **{k: v for k, v in formula.targetoptions.items() if k != "nopython"}
+        )(formula.py_func)
+        result = reloaded(temperature)
+
+        # assert
+        assert result == expected
+        assert sum(reloaded.stats.cache_hits.values()) == 1
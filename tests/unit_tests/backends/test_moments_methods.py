@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 
 from PySDM import Formulae
+from PySDM.products.impl.spectrum_moment_product import bins_spacing
 
 
 @pytest.mark.parametrize(
@@ -45,3 +46,73 @@ def test_moments_range(backend_class, min_x, max_x, value, expected):
 
     # Assert
     assert moment_0.to_ndarray()[:] == moments.to_ndarray()[:] == expected
+
+
+@pytest.mark.parametrize(
+    "x_bins, spacing",
+    [
+        (np.linspace(1, 5, num=9), "linear"),
+        (np.logspace(-3, 1, num=17), "logarithmic"),
+        (np.asarray([0.001, 0.1, 0.2, 1.5, 2.0, 9.0]), "monotonic"),
+        (np.linspace(1, 5, num=9) ** 3, "monotonic"),
+    ],
+)
+def test_spectrum_moments_bins_spacing(backend_class, x_bins, spacing):
+    # Arrange
+    backend = backend_class(Formulae())
+    rng = np.random.default_rng(seed=44)
+    n_sd, n_cell = 1000, 3
+    x_attr = np.concatenate(
+        (rng.uniform(x_bins[0] / 2, x_bins[-1] * 2, size=n_sd - 3), x_bins[[0, 1, -1]])
+    )
+    cell_id = np.sort(rng.integers(0, n_cell, size=n_sd))
+    kw_args = {
+        "multiplicity": backend.Storage.from_ndarray(rng.integers(1, 100, size=n_sd)),
+        "attr_data": backend.Storage.from_ndarray(x_attr),
+        "cell_id": backend.Storage.from_ndarray(cell_id),
+        "idx": backend.Storage.from_ndarray(np.arange(n_sd)),
+        "cell_start": backend.Storage.from_ndarray(
+            np.searchsorted(cell_id, np.arange(n_cell + 1))
+        ),
+        "length": n_sd,
+        "rank": 1,
+        "x_bins": backend.Storage.from_ndarray(x_bins),
+        "x_attr": backend.Storage.from_ndarray(x_attr),
+        "weighting_attribute": backend.Storage.from_ndarray(x_attr),
+        "weighting_rank": 0,
+    }
+
+    def spectrum_moments(x_bins_spacing):
+        shape = (len(x_bins) - 1, n_cell)
+        moment_0 = backend.Storage.empty(shape, dtype=float)
+        moments = backend.Storage.empty(shape, dtype=float)
+        backend.spectrum_moments(
+            moment_0=moment_0,
+            moments=moments,
+            x_bins_spacing=x_bins_spacing,
+            **kw_args,
+        )
+        return moment_0.to_ndarray(), moments.to_ndarray()
+
+    # Act
+    expected = spectrum_moments(x_bins_spacing=None)
+    actual = spectrum_moments(x_bins_spacing=spacing)
+
+    # Assert
+    assert expected[0].sum() > 0
+    np.testing.assert_array_equal(actual[0], expected[0])
+    np.testing.assert_allclose(actual[1], expected[1], rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "edges, expected",
+    [
+        (np.linspace(0, 5, num=11), "linear"),
+        (np.logspace(-9, -3, num=31), "logarithmic"),
+        (np.linspace(1, 5, num=11) ** 3, "monotonic"),
+        (np.asarray([1.0, 3.0, 2.0]), None),
+        (np.asarray([1.0]), None),
+    ],
+)
+def test_bins_spacing(edges, expected):
+    assert bins_spacing(edges) == expected
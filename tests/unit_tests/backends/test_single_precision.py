@@ -0,0 +1,143 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae, products
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Coalescence, Condensation
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box, Parcel
+from PySDM.initialisation.sampling.spectral_sampling import ConstantMultiplicity
+from PySDM.initialisation.spectra import Exponential
+from PySDM.physics import si
+
+
+def _box_coalescence(backend):
+    n_sd = 2**10
+    builder = Builder(
+        n_sd=n_sd, backend=backend, environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+    )
+    volume, multiplicity = ConstantMultiplicity(
+        Exponential(norm_factor=2**23, scale=4.1888 * si.um**3)
+    ).sample(n_sd)
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+    particulator = builder.build(
+        attributes={"volume": volume, "multiplicity": multiplicity},
+        products=(
+            products.TotalParticleConcentration(name="n"),
+            products.MeanRadius(name="r"),
+        ),
+    )
+    particulator.run(600)
+    return particulator
+
+
+def _parcel_condensation(backend):
+    n_sd = 16
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        initial_water_vapour_mixing_ratio=20 * si.g / si.kg,
+        T0=300 * si.K,
+        w=1 * si.m / si.s,
+    )
+    builder = Builder(n_sd=n_sd, backend=backend, environment=env)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    particulator = builder.build(
+        attributes=env.init_attributes(
+            n_in_dv=np.full(n_sd, 1e8),
+            kappa=0.5,
+            r_dry=np.logspace(-2, 0, n_sd) * si.um,
+        ),
+        products=(
+            products.EffectiveRadius(name="r_eff"),
+            products.WaterMixingRatio(name="ql", radius_range=(1 * si.um, np.inf)),
+        ),
+    )
+    particulator.run(300)
+    return particulator
+
+
+class TestSinglePrecision:
+    @staticmethod
+    def test_storage_dtypes():
+        # arrange
+        sut = CPU(double_precision=False)
+
+        # act
+        floats = sut.Storage.from_ndarray(np.linspace(0, 1, 3))
+        ints = sut.Storage.empty(3, dtype=int)
+
+        # assert
+        assert floats.dtype == np.float32
+        assert floats[1:].dtype == np.float32
+        assert isinstance(floats[1:], sut.Storage)
+        assert ints.dtype == np.int64
+        assert CPU().Storage.empty(3, dtype=float).dtype == np.float64
+
+    @staticmethod
+    def test_multiplicity_kept_in_64_bits():
+        # arrange
+        backend = CPU(double_precision=False)
+        builder = Builder(
+            n_sd=2, backend=backend, environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+        )
+        multiplicity = np.asarray([2**40 + 1, 1])
+
+        # act
+        particulator = builder.build(
+            attributes={"multiplicity": multiplicity, "volume": np.ones(2)}
+        )
+
+        # assert
+        np.testing.assert_array_equal(
+            particulator.attributes["multiplicity"].to_ndarray(), multiplicity
+        )
+        assert particulator.attributes["volume"].to_ndarray().dtype == np.float32
+
+    @staticmethod
+    def test_moments_accumulated_in_double_precision():
+        # arrange
+        backend = CPU(double_precision=False)
+        n_sd = 2**16
+        builder = Builder(
+            n_sd=n_sd, backend=backend, environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+        )
+        particulator = builder.build(
+            attributes={
+                "multiplicity": np.full(n_sd, 2**30 + 1),
+                "volume": np.full(n_sd, 1 * si.um**3),
+            },
+            products=(products.TotalParticleConcentration(name="n"),),
+        )
+
+        # act
+        concentration = particulator.products["n"].get()
+
+        # assert
+        np.testing.assert_allclose(concentration, n_sd * (2**30 + 1), rtol=1e-6)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "scenario, rtol",
+        (
+            pytest.param(_box_coalescence, 2e-2, id="box coalescence"),
+            pytest.param(_parcel_condensation, 1e-3, id="parcel condensation"),
+        ),
+    )
+    def test_accuracy_against_double_precision(scenario, rtol):
+        # act
+        results = {
+            double_precision: scenario(
+                CPU(Formulae(seed=44), double_precision=double_precision)
+            )
+            for double_precision in (True, False)
+        }
+
+        # assert
+        for name, product in results[True].products.items():
+            np.testing.assert_allclose(
+                results[False].products[name].get(), product.get(), rtol=rtol
+            )
@@ -0,0 +1,97 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence, Collision
+from PySDM.dynamics.collisions.breakup_efficiencies import ConstEb
+from PySDM.dynamics.collisions.breakup_fragmentations import AlwaysN
+from PySDM.dynamics.collisions.coalescence_efficiencies import ConstEc
+from PySDM.dynamics.collisions.collision_kernels import (
+    ConstantK,
+    Electric,
+    Geometric,
+    Golovin,
+    Linear,
+)
+from PySDM.environments import Box
+from PySDM.physics import si
+
+KERNELS = {
+    "Geometric": lambda: Geometric(collection_efficiency=0.5),
+    "Golovin": lambda: Golovin(b=1.5e3 / si.s),
+    "Linear": lambda: Linear(a=1e-6 * si.cm**3 / si.s, b=1e3 / si.s),
+    "ConstantK": lambda: ConstantK(a=1e-5 * si.cm**3 / si.s),
+    "Electric": Electric,
+}
+
+
+def _run(kernel, fused, adaptive, n_sd=64, n_steps=3):
+    rng = np.random.default_rng(44)
+    builder = Builder(
+        n_sd=n_sd,
+        backend=CPU(Formulae(seed=44)),
+        environment=Box(dt=10 * si.s, dv=1 * si.m**3),
+    )
+    builder.add_dynamic(
+        Coalescence(collision_kernel=KERNELS[kernel](), adaptive=adaptive, fused=fused)
+    )
+    particulator = builder.build(
+        attributes={
+            "volume": rng.exponential(scale=(30 * si.um) ** 3, size=n_sd),
+            "multiplicity": rng.integers(1e6, 1e8, size=n_sd),
+        }
+    )
+    particulator.run(n_steps)
+    return {
+        "multiplicity": particulator.attributes["multiplicity"].to_ndarray(raw=True),
+        "volume": particulator.attributes["volume"].to_ndarray(raw=True),
+        "coalescence_rate": particulator.dynamics[
+            "Collision"
+        ].coalescence_rate.to_ndarray(),
+    }
+
+
+class TestSDMFused:
+    @staticmethod
+    @pytest.mark.parametrize("kernel", KERNELS)
+    @pytest.mark.parametrize("adaptive", (False, True))
+    def test_fused_step_matches_unfused(kernel, adaptive):
+        # act
+        expected = _run(kernel, fused=False, adaptive=adaptive)
+        actual = _run(kernel, fused=True, adaptive=adaptive)
+
+        # assert
+        assert (expected["coalescence_rate"] > 0).any()
+        for key, value in expected.items():
+            np.testing.assert_allclose(actual[key], value, rtol=1e-10)
+
+    @staticmethod
+    def test_fused_step_requires_fusable_kernel():
+        # arrange
+        class Kernel:  # pylint: disable=too-few-public-methods
+            def register(self, builder):
+                pass
+
+        builder = Builder(
+            n_sd=2, backend=CPU(), environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+        )
+        builder.add_dynamic(Coalescence(collision_kernel=Kernel(), fused=True))
+
+        # act & assert
+        with pytest.raises(ValueError):
+            builder.build(
+                attributes={"volume": np.ones(2), "multiplicity": np.ones(2, dtype=int)}
+            )
+
+    @staticmethod
+    def test_fused_step_does_not_support_breakup():
+        with pytest.raises(ValueError):
+            Collision(
+                collision_kernel=ConstantK(a=1 * si.cm**3 / si.s),
+                coalescence_efficiency=ConstEc(),
+                breakup_efficiency=ConstEb(),
+                fragmentation_function=AlwaysN(n=2),
+                fused=True,
+            )
@@ -0,0 +1,74 @@
+"""tests of the step-doubling and embedded condensation substep controls"""
+
+import numpy as np
+import pytest
+
+from PySDM import Builder, products
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.environments import Parcel
+from PySDM.physics import si
+
+N_SD = 32
+N_STEPS = 400
+
+
+def _run_parcel(substep_control):
+    env = Parcel(
+        dt=1 * si.s,
+        mass_of_dry_air=1 * si.kg,
+        p0=1000 * si.hPa,
+        initial_water_vapour_mixing_ratio=20 * si.g / si.kg,
+        T0=300 * si.K,
+        w=5 * si.m / si.s,
+    )
+    builder = Builder(n_sd=N_SD, backend=CPU(), environment=env)
+    builder.add_dynamic(AmbientThermodynamics())
+    condensation = Condensation(substep_control=substep_control)
+    builder.add_dynamic(condensation)
+    particulator = builder.build(
+        attributes=env.init_attributes(
+            n_in_dv=np.full(N_SD, 1e8),
+            kappa=0.5,
+            r_dry=np.logspace(-2, 0, N_SD) * si.um,
+        ),
+        products=(
+            products.WaterMixingRatio(name="ql", radius_range=(1 * si.um, np.inf)),
+        ),
+    )
+    n_substeps = 0
+    n_solves_saved = 0
+    for _ in range(N_STEPS):
+        particulator.run(1)
+        n_substeps += condensation.counters["n_substeps"][0]
+        n_solves_saved += condensation.counters["n_solves_saved"][0]
+    return particulator.products["ql"].get()[0], n_substeps, n_solves_saved
+
+
+class TestSubstepControl:
+    @staticmethod
+    def test_embedded_matches_step_doubling():
+        # act
+        ql, _, n_solves_saved = _run_parcel("step_doubling")
+        ql_embedded, n_substeps, n_solves_saved_embedded = _run_parcel("embedded")
+
+        # assert
+        # regression value (with all droplets activated: ql ~ 1e-3 x smaller if
+        # condensation on near-equilibrium droplets is wrongly skipped)
+        np.testing.assert_allclose(ql, 4.08 * si.g / si.kg, rtol=1e-2)
+        np.testing.assert_allclose(ql_embedded, ql, rtol=1e-2)
+        assert n_solves_saved == 0
+        assert n_substeps > N_STEPS
+        assert n_solves_saved_embedded > 0
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            {"substep_control": "Richardson"},
+            {"substep_control": "embedded", "adaptive": False},
+        ),
+    )
+    def test_invalid_arguments(kwargs):
+        with pytest.raises(ValueError):
+            Condensation(**kwargs)
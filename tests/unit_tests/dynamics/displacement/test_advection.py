@@ -228,3 +228,43 @@ class TestExplicitEulerWithInterpolation:
         # Assert
         assert state["cell origin"][0, droplet_id] == 0
         assert state["cell origin"][1, droplet_id] == 0
+
+    @staticmethod
+    def test_update_cell_origin_and_id(backend_class):
+        # Arrange
+        grid = (3, 4)
+        positions = np.asarray([[0.5, 1.5, 2.5, 0.5, 1.5], [0.5, 1.5, 2.5, 3.5, 0.5]])
+        deltas = np.asarray([[1.1, -0.2, 2.5, -1.5, 0.3], [0.7, 1.2, -0.9, 3.5, -3.2]])
+        settings = DisplacementSettings(
+            n_sd=positions.shape[1],
+            grid=grid,
+            positions=positions.tolist(),
+            courant_field_data=(np.zeros((4, 4)), np.zeros((3, 5))),
+        )
+        sut, particulator = settings.get_displacement(
+            backend_class, scheme="ImplicitInSpace"
+        )
+        state = particulator.attributes
+        state["position in cell"][:] = particulator.backend.Storage.from_ndarray(
+            state["position in cell"].to_ndarray() + deltas
+        )
+
+        # Act
+        particulator.update_cell_origin_and_id(grid=sut.grid, strides=sut.strides)
+
+        # Assert
+        expected_cell_origin = np.floor(positions + deltas).astype(int) % np.reshape(
+            grid, (-1, 1)
+        )
+        np.testing.assert_array_equal(
+            state["cell origin"].to_ndarray(), expected_cell_origin
+        )
+        np.testing.assert_allclose(
+            state["position in cell"].to_ndarray(),
+            np.mod(positions + deltas, 1),
+            rtol=1e-12,
+        )
+        np.testing.assert_array_equal(
+            state["cell id"].to_ndarray(),
+            np.dot(particulator.mesh.strides, expected_cell_origin)[0],
+        )
@@ -0,0 +1,88 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU, GPU
+
+from .displacement_settings import DisplacementSettings
+
+N_SD = 128
+GRIDS = ((5,), (4, 5), (3, 4, 5))
+
+
+class ConstantFallVelocity:  # pylint: disable=too-few-public-methods
+    def __init__(self, backend, n_sd):
+        self.values = backend.Storage.from_ndarray(np.full(n_sd, 1.5))
+
+    def get(self):
+        return self.values
+
+
+def _courant_field(grid, rng):
+    """random field with an updraft in the last dimension"""
+    return tuple(
+        rng.uniform(-0.4, 0.4, size=tuple(n + (i == dim) for i, n in enumerate(grid)))
+        + 0.3 * (dim == len(grid) - 1)
+        for dim in range(len(grid))
+    )
+
+
+def _run(grid, sedimentation, fused, n_steps=3):
+    rng = np.random.default_rng(seed=44)
+    settings = DisplacementSettings(
+        n_sd=N_SD,
+        grid=grid,
+        positions=[rng.uniform(0, n, size=N_SD).tolist() for n in grid],
+        courant_field_data=_courant_field(grid, rng),
+    )
+    settings.dt = 0.1
+    settings.sedimentation = sedimentation
+    sut, particulator = settings.get_displacement(
+        CPU, scheme="ImplicitInSpace", fused=fused
+    )
+    if sedimentation:
+        particulator.attributes._ParticleAttributes__attributes[
+            "relative fall velocity"
+        ] = ConstantFallVelocity(particulator.backend, N_SD)
+    precipitation = 0
+    for _ in range(n_steps):
+        sut()
+        precipitation += sut.precipitation_in_last_step
+    live = np.sort(
+        particulator.attributes._ParticleAttributes__idx.to_ndarray()[
+            : particulator.attributes.super_droplet_count
+        ]
+    )
+    return {
+        "n_substeps": sut._n_substeps,  # pylint: disable=protected-access
+        "precipitation": precipitation,
+        "super_droplet_count": particulator.attributes.super_droplet_count,
+        **{
+            key: particulator.attributes[key].to_ndarray(raw=True)[..., live]
+            for key in ("position in cell", "cell origin", "cell id")
+        },
+    }
+
+
+class TestFusedDisplacement:
+    @staticmethod
+    @pytest.mark.parametrize("grid", GRIDS)
+    @pytest.mark.parametrize("sedimentation", (False, True))
+    def test_fused_step_matches_unfused(grid, sedimentation):
+        # act
+        expected = _run(grid, sedimentation, fused=False)
+        actual = _run(grid, sedimentation, fused=True)
+
+        # assert
+        assert expected["n_substeps"] > 1
+        assert 0 < expected["super_droplet_count"] < N_SD
+        assert (expected["precipitation"] > 0) == sedimentation
+        for key, value in expected.items():
+            np.testing.assert_allclose(actual[key], value, rtol=1e-12)
+
+    @staticmethod
+    def test_fused_step_not_available_on_gpu():
+        with pytest.raises(NotImplementedError):
+            DisplacementSettings().get_displacement(
+                GPU, scheme="ImplicitInSpace", fused=True
+            )
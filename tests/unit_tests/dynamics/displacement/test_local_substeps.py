@@ -0,0 +1,121 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Displacement
+from PySDM.environments import Kinematic2D
+from PySDM.products import DisplacementSubstepCount
+
+from .displacement_settings import DisplacementSettings
+
+GRID = (8, 6)
+N_SD = 256
+
+
+def _courant_field():
+    """uniform flow in the first dimension with an updraft core in the second"""
+    courant_x = np.full((GRID[0] + 1, GRID[1]), 0.1)
+    courant_z = np.zeros((GRID[0], GRID[1] + 1))
+    courant_z[3, 3] = 0.4
+    return courant_x, courant_z
+
+
+def _core_mask():
+    mask = np.zeros(GRID, dtype=bool)
+    mask[2:5, 1:5] = True
+    return mask
+
+
+def _run(local_substeps, n_steps=3):
+    rng = np.random.default_rng(seed=44)
+    settings = DisplacementSettings(
+        n_sd=N_SD,
+        grid=GRID,
+        positions=[rng.uniform(0, n, size=N_SD).tolist() for n in GRID],
+        courant_field_data=_courant_field(),
+    )
+    sut, particulator = settings.get_displacement(
+        CPU, scheme="ImplicitInSpace", fused=True, local_substeps=local_substeps
+    )
+    for _ in range(n_steps):
+        sut()
+    return sut, {
+        key: particulator.attributes[key].to_ndarray(raw=True)
+        for key in ("position in cell", "cell origin", "cell id")
+    }
+
+
+class TestLocalSubsteps:
+    @staticmethod
+    def test_substep_count_per_cell():
+        # act
+        sut, _ = _run(local_substeps=True, n_steps=0)
+        reference, _ = _run(local_substeps=False, n_steps=0)
+        n_substeps = sut.n_substeps_per_cell.to_ndarray().reshape(GRID)
+
+        # assert
+        assert reference._n_substeps > 1  # pylint: disable=protected-access
+        np.testing.assert_array_equal(n_substeps[~_core_mask()], 1)
+        np.testing.assert_array_equal(
+            n_substeps[_core_mask()],
+            reference._n_substeps,  # pylint: disable=protected-access
+        )
+        assert (
+            sut._n_substeps == reference._n_substeps
+        )  # pylint: disable=protected-access
+
+    @staticmethod
+    def test_local_substeps_match_global():
+        # act
+        _, expected = _run(local_substeps=False)
+        _, actual = _run(local_substeps=True)
+
+        # assert
+        for key, value in expected.items():
+            np.testing.assert_allclose(actual[key], value, rtol=0, atol=1e-12)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            {"local_substeps": True},
+            {"local_substeps": True, "fused": True, "adaptive": False},
+        ),
+    )
+    def test_invalid_arguments(kwargs):
+        with pytest.raises(ValueError):
+            Displacement(**kwargs)
+
+    @staticmethod
+    @pytest.mark.parametrize("local_substeps", (False, True))
+    def test_substep_count_product(local_substeps):
+        # arrange
+        n_sd = 1
+        env = Kinematic2D(dt=1, grid=GRID, size=(100, 100), rhod_of=lambda x: x * 0 + 1)
+        builder = Builder(n_sd=n_sd, backend=CPU(), environment=env)
+        builder.add_dynamic(
+            Displacement(fused=local_substeps, local_substeps=local_substeps)
+        )
+        particulator = builder.build(
+            attributes={
+                "multiplicity": np.ones(n_sd),
+                "volume": np.ones(n_sd),
+                "cell id": np.zeros(n_sd, dtype=int),
+            },
+            products=(DisplacementSubstepCount(),),
+        )
+        sut = particulator.products["displacement substep count"]
+
+        # act
+        particulator.dynamics["Displacement"].upload_courant_field(_courant_field())
+        n_substeps = sut.get()
+
+        # assert
+        assert n_substeps.shape == GRID
+        assert np.amax(n_substeps) > 1
+        if local_substeps:
+            np.testing.assert_array_equal(n_substeps[~_core_mask()], 1)
+        else:
+            np.testing.assert_array_equal(n_substeps, np.amax(n_substeps))
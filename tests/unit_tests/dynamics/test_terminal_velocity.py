@@ -46,6 +46,47 @@ def test_approximation(backend_class, plot=False):
         plt.show()
 
 
+def test_gunn_kinzer_tables_shared_across_instances(backend_class):
+    # arrange
+    particulator = DummyParticulator(backend_class)
+
+    # act
+    instances = [
+        GunnKinzer1949(particulator, small_r_limit=small_r_limit)
+        for small_r_limit in (None, 40 * si.um, 30 * si.um)
+    ]
+
+    # assert
+    assert instances[0].a is instances[1].a and instances[0].b is instances[1].b
+    assert instances[0].a is not instances[2].a
+    assert instances[0].a.to_ndarray()[-1] == instances[2].a.to_ndarray()[-1]
+
+
+def test_gunn_kinzer_out_of_range_flagged(backend_class):
+    # arrange
+    particulator = DummyParticulator(backend_class, n_sd=3)
+    approximation = GunnKinzer1949(particulator)
+    radius = particulator.backend.Storage.from_ndarray(
+        np.asarray([1 * si.um, approximation.maximum_radius, 1 * si.cm])
+    )
+    output = particulator.backend.Storage.empty((3,), float)
+
+    # act
+    out_of_range = particulator.backend.interpolation(
+        output=output,
+        radius=radius,
+        factor=approximation.factor,
+        b=approximation.a,
+        c=approximation.b,
+    )
+
+    # assert
+    assert out_of_range
+    assert np.isfinite(output.to_ndarray()[:2]).all()
+    with pytest.raises(ValueError, match="Radii"):
+        approximation(output, radius)
+
+
 @pytest.mark.parametrize(
     "variant, water_mass, exception_context, expected_v_term",
     (
@@ -0,0 +1,108 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae, products
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Coalescence, Condensation
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Parcel, ParcelEnsemble
+from PySDM.initialisation.sampling import spectral_sampling
+from PySDM.initialisation.spectra import Lognormal
+from PySDM.physics import si
+
+BACKEND = CPU(Formulae())
+N_SD_PER_MEMBER = 8
+R_DRY, N_IN_DV = spectral_sampling.Logarithmic(
+    Lognormal(norm_factor=1e8, m_mode=50 * si.nm, s_geom=1.5)
+).sample(N_SD_PER_MEMBER)
+MEMBERS = {
+    "w": (0.5 * si.m / si.s, lambda t: 2 * si.m / si.s + t / si.s),
+    "T0": np.asarray((300, 298)) * si.K,
+    "kappa": np.asarray((1.2, 0.1)),
+}
+COMMON = {
+    "dt": 1 * si.s,
+    "mass_of_dry_air": 1 * si.kg,
+    "p0": 1000 * si.hPa,
+    "initial_water_vapour_mixing_ratio": 20 * si.g / si.kg,
+}
+N_STEPS = 30
+RADIUS_BINS_EDGES = np.logspace(np.log10(0.01 * si.um), np.log10(10 * si.um), 5)
+
+
+def _products():
+    return (
+        products.AmbientRelativeHumidity(name="RH"),
+        products.AmbientTemperature(name="T"),
+        products.ParcelDisplacement(name="z"),
+        products.ParticleConcentration(name="n", radius_range=(0.5 * si.um, np.inf)),
+        products.ParticleSizeSpectrumPerVolume(
+            name="spectrum", radius_bins_edges=RADIUS_BINS_EDGES
+        ),
+    )
+
+
+def _run(env, kappa):
+    builder = Builder(
+        backend=BACKEND,
+        n_sd=N_SD_PER_MEMBER * env.mesh.n_cell,
+        environment=env,
+    )
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    particulator = builder.build(
+        attributes=env.init_attributes(n_in_dv=N_IN_DV, kappa=kappa, r_dry=R_DRY),
+        products=_products(),
+    )
+    particulator.run(N_STEPS)
+    return {
+        name: np.asarray(product.get()).reshape(env.mesh.n_cell, -1)
+        for name, product in particulator.products.items()
+    }
+
+
+class TestParcelEnsemble:
+    @staticmethod
+    def test_members_match_independent_parcels():
+        # arrange
+        expected = [
+            _run(
+                Parcel(**COMMON, w=MEMBERS["w"][i], T0=MEMBERS["T0"][i]),
+                kappa=MEMBERS["kappa"][i],
+            )
+            for i in range(len(MEMBERS["w"]))
+        ]
+
+        # act
+        actual = _run(
+            ParcelEnsemble(**COMMON, n_members=2, w=MEMBERS["w"], T0=MEMBERS["T0"]),
+            kappa=MEMBERS["kappa"],
+        )
+
+        # assert
+        assert expected[0]["z"][0, 0] != expected[1]["z"][0, 0]
+        assert (actual["n"] > 0).all()
+        for i, member in enumerate(expected):
+            for name, value in member.items():
+                np.testing.assert_allclose(actual[name][i], value[0], rtol=1e-9)
+
+    @staticmethod
+    def test_w_sequence_length_checked():
+        with pytest.raises(ValueError):
+            ParcelEnsemble(**COMMON, n_members=2, w=(1, 2, 3), T0=300 * si.K)
+
+    @staticmethod
+    def test_dynamics_assuming_common_cell_volume_rejected():
+        # arrange
+        env = ParcelEnsemble(**COMMON, n_members=2, w=MEMBERS["w"], T0=MEMBERS["T0"])
+        builder = Builder(backend=BACKEND, n_sd=N_SD_PER_MEMBER * 2, environment=env)
+        builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+
+        # act & assert
+        with pytest.raises(NotImplementedError):
+            builder.build(
+                attributes=env.init_attributes(
+                    n_in_dv=N_IN_DV, kappa=MEMBERS["kappa"], r_dry=R_DRY
+                )
+            )
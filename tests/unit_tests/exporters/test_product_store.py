@@ -0,0 +1,124 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from scipy.io import netcdf_file
+
+from PySDM.exporters import NetCDFExporter, ProductStore
+
+OUTPUT_STEPS = (0, 5, 10)
+GRID = (2, 3)
+
+
+class Settings:  # pylint: disable=too-few-public-methods
+    output_steps = OUTPUT_STEPS
+    grid = GRID
+    size = (20.0, 30.0)
+    dt = 1.0
+
+    def __dir__(self):
+        return "output_steps", "grid", "size", "dt"
+
+
+class Controller(nullcontext):  # pylint: disable=too-few-public-methods
+    panic = False
+
+    def set_percent(self, _):
+        pass
+
+
+def _fill(store):
+    for i, step in enumerate(OUTPUT_STEPS):
+        store.save(np.full(GRID, i, dtype=float), step, "field")
+        store.save(np.asarray([2 * i]), step, "scalar")
+
+
+class TestProductStore:
+    @staticmethod
+    @pytest.mark.parametrize("in_tmp_path", (False, True))
+    def test_save_and_load(tmp_path, in_tmp_path):
+        # arrange
+        sut = ProductStore(
+            path=tmp_path if in_tmp_path else None, n_output_steps=len(OUTPUT_STEPS)
+        )
+
+        # act
+        _fill(sut)
+
+        # assert
+        assert sut.load("field").shape == (len(OUTPUT_STEPS), *GRID)
+        np.testing.assert_array_equal(sut.load("field", OUTPUT_STEPS[1]), 1)
+        np.testing.assert_array_equal(sut.load("scalar"), (0, 2, 4))
+        assert sut.data_range("field") == (0, 2)
+        assert sut.data_range("scalar") == (0, 4)
+        if in_tmp_path:
+            sut.flush()
+            np.testing.assert_array_equal(
+                np.load(tmp_path / "scalar.npy", mmap_mode="r"), (0, 2, 4)
+            )
+
+    @staticmethod
+    def test_unsaved_steps_are_nan():
+        # arrange
+        sut = ProductStore(n_output_steps=2)
+
+        # act
+        sut.save(np.ones(GRID), 0, "field")
+
+        # assert
+        assert np.isnan(sut.load("field")[1]).all()
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "access",
+        (
+            lambda sut: sut.load("other"),
+            lambda sut: sut.load("field", step=1),
+            lambda sut: sut.data_range("other"),
+        ),
+    )
+    def test_missing_product_or_step(access):
+        # arrange
+        sut = ProductStore(n_output_steps=2)
+        sut.save(np.ones(GRID), 0, "field")
+
+        # act & assert
+        with pytest.raises(ProductStore.Exception):
+            access(sut)
+
+    @staticmethod
+    def test_too_many_steps():
+        # arrange
+        sut = ProductStore(n_output_steps=1)
+        sut.save(1, 0, "scalar")
+
+        # act & assert
+        with pytest.raises(ValueError):
+            sut.save(1, 1, "scalar")
+
+    @staticmethod
+    def test_netcdf_export(tmp_path):
+        # arrange
+        store = ProductStore()
+        store.init(Settings())
+        _fill(store)
+        simulator = SimpleNamespace(
+            products={
+                "field": SimpleNamespace(shape=GRID, unit="m"),
+                "scalar": SimpleNamespace(shape=(), unit="1"),
+            }
+        )
+        filename = str(tmp_path / "output.nc")
+
+        # act
+        NetCDFExporter(store, Settings(), simulator, filename).run(Controller())
+
+        # assert
+        with netcdf_file(filename, mmap=False) as ncdf:
+            np.testing.assert_array_equal(ncdf.variables["T"][:], OUTPUT_STEPS)
+            np.testing.assert_array_equal(ncdf.variables["scalar"][:], (0, 2, 4))
+            np.testing.assert_array_equal(
+                ncdf.variables["field"][:], store.load("field")
+            )
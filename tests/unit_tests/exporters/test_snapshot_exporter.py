@@ -0,0 +1,97 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import os
+
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.environments import Box
+from PySDM.exporters import SnapshotExporter, read_snapshot
+from PySDM.physics import si
+
+N_SD = 10
+
+
+def _make_particulator(backend_class):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend_class(),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": np.arange(N_SD) % 4,
+            "volume": np.linspace(1, 2, N_SD) * si.um**3,
+        }
+    )
+
+
+class TestSnapshotExporter:
+    @staticmethod
+    @pytest.mark.parametrize("chunk_size", (3, 100))
+    def test_only_valid_particles_and_selected_attributes_exported(
+        backend_class, tmp_path, chunk_size
+    ):
+        # arrange
+        particulator = _make_particulator(backend_class)
+        particulator.attributes.healthy = False
+        particulator.attributes.sanitize()
+        expected = particulator.attributes["volume"].to_ndarray()
+
+        # act
+        with SnapshotExporter(
+            path=tmp_path, attributes=("volume",), chunk_size=chunk_size
+        ) as sut:
+            sut.export_attributes(particulator)
+            particulator.run(1)
+            sut.export_attributes(particulator)
+
+        # assert
+        paths = sorted(sut.exported_times)
+        assert len(paths) == 2
+        for path in paths:
+            meta, data = read_snapshot(path)
+            assert meta["n_particles"] == len(expected) < N_SD
+            assert tuple(data) == ("volume",)
+            np.testing.assert_array_equal(data["volume"], expected)
+            assert len(os.listdir(os.path.join(path, "volume"))) == -(
+                -len(expected) // chunk_size
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize("start, stop", ((0, None), (2, 5), (4, 100), (7, 7)))
+    def test_partial_read(backend_class, tmp_path, start, stop):
+        # arrange
+        particulator = _make_particulator(backend_class)
+        with SnapshotExporter(path=tmp_path, chunk_size=3) as sut:
+            sut.export_attributes(particulator)
+        paths = tuple(sut.exported_times)
+        assert len(paths) == 1
+        path = paths[0]
+
+        # act
+        _, data = read_snapshot(
+            path, attributes=("multiplicity",), start=start, stop=stop
+        )
+
+        # assert
+        np.testing.assert_array_equal(
+            data["multiplicity"],
+            particulator.attributes["multiplicity"].to_ndarray()[start:stop],
+        )
+        assert tuple(data) == ("multiplicity",)
+
+    @staticmethod
+    def test_writer_error_raised_in_simulation_thread(backend_class, tmp_path):
+        # arrange
+        particulator = _make_particulator(backend_class)
+        sut = SnapshotExporter(path=tmp_path, attributes=("volume",))
+        with open(sut.snapshot_file_path + "_num" + "0" * 10, "w", encoding="utf-8"):
+            pass
+
+        # act
+        sut.export_attributes(particulator)
+
+        # assert
+        with pytest.raises(RuntimeError):
+            sut.close()
@@ -0,0 +1,136 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import json
+
+import numpy as np
+
+from PySDM import Builder, products
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.impl.backend_profiler import OUTSIDE_OF_DYNAMICS
+from PySDM.physics import si
+
+N_SD = 16
+N_STEPS = 3
+
+
+def _make_particulator(backend_class, products_=()):
+    builder = Builder(
+        n_sd=N_SD, backend=backend_class(), environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+    )
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+    return builder.build(
+        attributes={
+            "multiplicity": np.full(N_SD, 1000),
+            "volume": np.linspace(1, 2, N_SD) * si.um**3,
+        },
+        products=products_,
+    )
+
+
+class TestBackendProfiler:
+    @staticmethod
+    def test_report(backend_class):
+        # arrange
+        particulator = _make_particulator(backend_class)
+        sut = particulator.enable_profiling()
+
+        # act
+        particulator.run(N_STEPS)
+        report = sut.report()
+
+        # assert
+        stats = report["Collision"]["compute_gamma"]
+        assert stats["calls"] == N_STEPS
+        assert stats["time"] > 0
+        assert stats["bytes"] > 0
+        assert list(report["Collision"].values()) == sorted(
+            report["Collision"].values(), key=lambda item: -item["time"]
+        )
+
+    @staticmethod
+    def test_products(backend_class):
+        # arrange
+        particulator = _make_particulator(
+            backend_class,
+            products_=(
+                products.BackendMethodCalls("compute_gamma", dynamic="Collision"),
+                products.BackendMethodWallTime("compute_gamma"),
+                products.BackendMethodBytes("batched_moments"),
+                products.TotalParticleConcentration(),
+            ),
+        )
+
+        # act
+        particulator.run(N_STEPS)
+        particulator.products["total particle concentration"].get()
+        calls = particulator.products["backend method calls"].get()
+        calls_after_reset = particulator.products["backend method calls"].get()
+
+        # assert
+        assert calls == N_STEPS
+        assert calls_after_reset == 0
+        assert particulator.products["backend method wall time"].get() > 0
+        assert particulator.products["backend method bytes"].get() > 0
+        assert (
+            particulator.profiler.total(
+                "batched_moments", "calls", dynamic=OUTSIDE_OF_DYNAMICS
+            )
+            == 1
+        )
+
+    @staticmethod
+    def test_chrome_trace(backend_class, tmp_path):
+        # arrange
+        particulator = _make_particulator(backend_class)
+        sut = particulator.enable_profiling(trace=True)
+        path = tmp_path / "trace.json"
+
+        # act
+        particulator.run(N_STEPS)
+        sut.save_chrome_trace(path)
+
+        # assert
+        with open(path, encoding="utf-8") as file:
+            events = json.load(file)["traceEvents"]
+        dynamics = [event for event in events if event["cat"] == "dynamic"]
+        assert [event["name"] for event in dynamics] == ["Collision"] * N_STEPS
+        for event in events:
+            assert event["ph"] == "X"
+            assert event["dur"] >= 0
+        gamma = [event for event in events if event["name"] == "compute_gamma"]
+        assert len(gamma) == N_STEPS
+        assert gamma[0]["cat"] == "Collision"
+        assert dynamics[0]["ts"] <= gamma[0]["ts"] <= dynamics[1]["ts"]
+
+    @staticmethod
+    def test_disable_restores_backend_methods(backend_class):
+        # arrange
+        particulator = _make_particulator(backend_class)
+        backend = particulator.backend
+        particulator.enable_profiling()
+        assert "compute_gamma" in vars(backend)
+
+        # act
+        particulator.disable_profiling()
+        particulator.run(1)
+
+        # assert
+        assert particulator.profiler is None
+        assert "compute_gamma" not in vars(backend)
+
+    @staticmethod
+    def test_products_after_disable(backend_class):
+        # arrange
+        particulator = _make_particulator(
+            backend_class, products_=(products.BackendMethodCalls("compute_gamma"),)
+        )
+        particulator.run(1)
+
+        # act
+        particulator.disable_profiling()
+        particulator.run(1)
+        calls = particulator.products["backend method calls"].get()
+
+        # assert
+        assert calls == 0
@@ -0,0 +1,83 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+
+from PySDM import Builder, products
+from PySDM.backends import CPU
+from PySDM.environments import Box
+from PySDM.physics import si
+
+N_SD = 64
+
+
+def _particulator(backend):
+    rng = np.random.default_rng(seed=44)
+    builder = Builder(
+        n_sd=N_SD, backend=backend, environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+    )
+    return builder.build(
+        attributes={
+            "volume": rng.exponential(scale=(10 * si.um) ** 3, size=N_SD),
+            "multiplicity": rng.integers(1, 1e6, size=N_SD),
+        },
+        products=(
+            products.ParticleConcentration(name="n"),
+            products.ParticleConcentration(
+                name="n_cloud", radius_range=(5 * si.um, 25 * si.um)
+            ),
+            products.MeanRadius(name="r_mean"),
+            products.EffectiveRadius(name="r_eff"),
+            products.TotalParticleConcentration(name="n_tot"),
+        ),
+    )
+
+
+def _get_all(particulator):
+    return {key: product.get().copy() for key, product in particulator.products.items()}
+
+
+class TestBatchedMoments:
+    @staticmethod
+    def test_batched_moments_match_per_product_moments(backend_class):
+        # arrange
+        particulator = _particulator(backend_class())
+        particulator.batched_moments.enabled = False
+        expected = _get_all(particulator)
+
+        # act
+        particulator.batched_moments.enabled = True
+        actual = _get_all(particulator)
+
+        # assert
+        for key, value in expected.items():
+            assert np.isfinite(value).all()
+            np.testing.assert_allclose(actual[key], value, rtol=1e-10)
+
+    @staticmethod
+    def test_single_pass_per_state():
+        # arrange
+        particulator = _particulator(CPU())
+        n_calls = [0]
+        batched_moments = particulator.backend.batched_moments
+
+        def counting_batched_moments(**kwargs):
+            n_calls[0] += 1
+            batched_moments(**kwargs)
+
+        particulator.backend.batched_moments = counting_batched_moments
+        first = _get_all(particulator)
+        n_calls[0] = 0
+
+        # act
+        again = _get_all(particulator)
+        n_calls_same_state = n_calls[0]
+        particulator.attributes["water mass"][:] *= 2
+        particulator.attributes.mark_updated("water mass")
+        changed = _get_all(particulator)
+        n_calls_new_state = n_calls[0] - n_calls_same_state
+
+        # assert
+        assert n_calls_same_state == 0
+        assert n_calls_new_state == 1
+        for key, value in first.items():
+            np.testing.assert_array_equal(again[key], value)
+        assert changed["r_mean"] > first["r_mean"]
@@ -280,3 +280,41 @@ class TestParticleAttributes:
         np.testing.assert_array_equal(
             sut._ParticleAttributes__idx.to_ndarray(), expected
         )
+
+    @staticmethod
+    def test_defragment(backend_class):
+        # Arrange
+        n_sd = 16
+        rng = np.random.default_rng(seed=44)
+        particulator = DummyParticulator(backend_class, n_sd=n_sd, grid=(2, 2))
+        particulator.build(
+            attributes={
+                "multiplicity": rng.integers(1, 10, size=n_sd),
+                "water mass": rng.uniform(size=n_sd),
+                "cell id": rng.integers(0, particulator.mesh.n_cell, size=n_sd),
+            },
+            int_caster=np.int64,
+        )
+        sut = particulator.attributes
+        sut.permutation(
+            make_indexed_storage(particulator.backend, rng.uniform(size=n_sd)),
+            local=False,
+        )
+        cell_start = sut.cell_start.to_ndarray()
+        expected = {key: sut[key].to_ndarray() for key in tuple(sut.keys())}
+        assert sut.locality() < 1
+
+        # Act
+        sut.defragment()
+
+        # Assert
+        np.testing.assert_array_equal(sut.cell_start.to_ndarray(), cell_start)
+        np.testing.assert_array_equal(
+            sut._ParticleAttributes__idx.to_ndarray(), np.arange(n_sd)
+        )
+        assert sut.locality() == 1
+        for key, value in expected.items():
+            np.testing.assert_array_equal(sut[key].to_ndarray(), value)
+            np.testing.assert_array_equal(sut[key].to_ndarray(raw=True), value)
+        if backend_class is not GPU:  # TODO #330
+            assert (np.diff(sut["cell id"].to_ndarray(raw=True)) >= 0).all()
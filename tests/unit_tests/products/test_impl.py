@@ -18,6 +18,9 @@ from PySDM.products import (
     AqueousMassSpectrum,
     AqueousMoleFraction,
     AreaStandardDeviation,
+    BackendMethodBytes,
+    BackendMethodCalls,
+    BackendMethodWallTime,
     DynamicWallTime,
     FlowVelocityComponent,
     FreezableSpecificConcentration,
@@ -46,6 +49,9 @@ _ARGUMENTS = {
     GaseousMoleFraction: {"key": "O3"},
     FreezableSpecificConcentration: {"temperature_bins_edges": (0, 300)},
     DynamicWallTime: {"dynamic": "Condensation"},
+    BackendMethodBytes: {"method": "moments"},
+    BackendMethodCalls: {"method": "moments"},
+    BackendMethodWallTime: {"method": "moments"},
     ParticleSizeSpectrumPerVolume: {"radius_bins_edges": (0, np.inf)},
     ParticleVolumeVersusRadiusLogarithmSpectrum: {"radius_bins_edges": (0, np.inf)},
     RadiusBinnedNumberAveragedTerminalVelocity: {"radius_bin_edges": (0, np.inf)},
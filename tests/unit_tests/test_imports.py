@@ -1,8 +1,12 @@
-""" test ensuring that all needed __init__.py entries are in place """
+"""test ensuring that all needed __init__.py entries are in place"""
+
+import subprocess
+import sys
 
 import pytest
 
 import PySDM
+from PySDM import products
 
 CLASSES = (
     "Builder",
@@ -21,6 +25,8 @@ CLASSES = (
     "environments.Kinematic1D",
     "environments.Kinematic2D",
     "environments.Parcel",
+    "environments.ParcelEnsemble",
+    "exporters.SnapshotExporter",
     "exporters.VTKExporter",
     "initialisation.aerosol_composition.DryAerosolMixture",
     "initialisation.init_fall_momenta",
@@ -46,3 +52,36 @@ class TestImports:
     @staticmethod
     def test_classes_sorted():
         assert tuple(sorted(CLASSES)) == CLASSES
+
+    @staticmethod
+    def test_import_is_lazy():
+        """`import PySDM` does not import Numba, Pint or probe for CUDA"""
+        # act
+        output = subprocess.run(
+            (
+                sys.executable,
+                "-c",
+                "import sys, PySDM;"
+                "print(*sorted(m for m in sys.modules"
+                " if m.split('.')[0] in ('numba', 'pint')"
+                " or m.startswith('PySDM.')))",
+            ),
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+
+        # assert
+        assert output == ["PySDM.impl", "PySDM.impl.lazy_imports"]
+
+    @staticmethod
+    @pytest.mark.parametrize("module", products._EXPORTS)
+    def test_products_exports_complete(module):
+        # pylint: disable=protected-access
+        subpackage = getattr(products, module)
+        assert set(products._EXPORTS[module]) == {
+            name
+            for name, value in vars(subpackage).items()
+            if isinstance(value, type)
+            and value.__module__.startswith(subpackage.__name__)
+        }
@@ -53,3 +53,37 @@ class TestParticulator:
         assert particulator.attributes.updated == [
             f"moles_{isotope}" for isotope in isotopes
         ]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "interval, threshold, expected_count",
+        ((0, 0, 0), (3, 0, 3), (0, 0.25, 0), (0, 0.75, 10), (3, 0.75, 10)),
+    )
+    def test_defragmentation_triggers(
+        backend_class, interval, threshold, expected_count
+    ):
+        # arrange
+        class AttributesMock:
+            def __init__(self):
+                self.defragment_count = 0
+
+            @staticmethod
+            def locality():
+                return 0.5
+
+            def defragment(self):
+                self.defragment_count += 1
+
+        class DP(DummyParticulator):
+            pass
+
+        particulator = DP(backend_class, 44)
+        particulator.attributes = AttributesMock()
+        particulator.defragmentation_interval = interval
+        particulator.defragmentation_locality_threshold = threshold
+
+        # act
+        particulator.run(steps=10)
+
+        # assert
+        assert particulator.attributes.defragment_count == expected_count